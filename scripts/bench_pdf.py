@@ -0,0 +1,75 @@
+"""
+Benchmark IncrementalPdf: parts built in-process vs on the shared part pool.
+
+Generates synthetic magazine-page screenshots (text-like blocks plus a noisy
+"photo") as in-memory PNGs, feeds them to IncrementalPdf page by page as the
+scrape worker does and finalizes the PDF, for each worker count. Reports wall
+time, CPU time spent in this (the server's) process and the slowest add_page
+call, i.e. the longest the scrape loop waits on the PDF. Run from the repo root:
+
+    uv run python scripts/bench_pdf.py --pages 200 --workers 1 2 4 8
+"""
+
+import argparse
+import io
+import os
+import random
+import tempfile
+import time
+
+from PIL import Image, ImageDraw
+
+import readly_mcp.core.pdf as pdf_module
+from readly_mcp.core.pdf import PDF_CHUNK_PAGES, IncrementalPdf, PageEncoding, encode_page, part_pool
+
+
+def _page(seed: int, size: tuple[int, int]) -> bytes:
+    rng = random.Random(seed)  # noqa: S311
+    width, height = size
+    img = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(400):
+        x, y = rng.randrange(width), rng.randrange(height)
+        draw.rectangle((x, y, x + rng.randrange(20, 160), y + rng.randrange(6, 14)), fill="black")
+    photo = Image.effect_noise((width // 3, height // 3), 50).convert("RGB")
+    img.paste(photo, (rng.randrange(width - photo.width), rng.randrange(height - photo.height)))
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--size", default="1920x1080", help="page size in pixels, WxH")
+    parser.add_argument("--chunk", type=int, default=PDF_CHUNK_PAGES, help="pages per part file")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--format", default="png", choices=["png", "jpeg"])
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    encoding = PageEncoding(args.format)
+    pages = [encode_page(_page(n, size), encoding) for n in range(args.pages)]
+    # Size the shared pool for the largest run and start it up front: a server pays that once, not per PDF.
+    pdf_module.PDF_WORKERS = max(args.workers)
+    list(part_pool().map(time.sleep, [0.5] * pdf_module.PDF_WORKERS))
+
+    print(f"{args.pages} pages of {args.size} {args.format}, {args.chunk} per part, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8} {'cpu s':>7} {'max add_page s':>15}")
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in dict.fromkeys(args.workers):
+            pdf = IncrementalPdf(os.path.join(tmp, f"out_{workers}.pdf"), args.chunk, workers)
+            slowest = 0.0
+            started, cpu = time.perf_counter(), time.process_time()
+            for page, page_size in pages:
+                added = time.perf_counter()
+                pdf.add_page(page, page_size)
+                slowest = max(slowest, time.perf_counter() - added)
+            pdf.finalize()
+            elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>9.2f} {baseline / elapsed:>7.2f}x {cpu:>7.2f} {slowest:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
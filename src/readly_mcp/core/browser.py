@@ -1,9 +1,33 @@
 import asyncio
 import logging
 import os
+import sys
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-
-from playwright.async_api import BrowserContext, Page, Playwright, async_playwright
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Page, Playwright, Route, async_playwright
+
+from .cache import (
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
+    ArticleCache,
+    ListingCache,
+    TTLCache,
+    article_handle,
+    normalize_query,
+)
+from .chunks import ARTICLE_CHUNK_CHARS, first_chunk, text_chunk
+from .dedupe import DEDUPE_MODE, FingerprintIndex
+from .extraction import extract_article, extract_library, extract_listing, harvest, install_extraction_script
+from .index import ARTICLE_INDEX_ENABLED, ArticleIndex, magazine_from_issue
+from .ingest import STATE_EXTRACTED, STATE_SKIPPED, IngestSnapshot
+from .ranking import BM25Ranker
+from .readiness import reader_state, wait_ready
+from .scheduler import PRIORITY_BATCH, PriorityGate, current_priority
 
 log = logging.getLogger(__name__)
 
@@ -36,25 +60,56 @@ _last_poll_stats: dict = {
     "last_run_at": None,
     "magazine": None,
 }
+# Per-run records, newest last; the summary above only keeps the latest values.
+_poll_history: deque[dict] = deque(maxlen=int(os.environ.get("READLY_POLL_HISTORY", "200")))
 
 
 def record_poll_stats(**kwargs) -> None:
+    """Update the last-poll summary and append one run record to the poll history.
+
+    Besides the summary fields, callers may pass ``source``, ``duration_ms``,
+    ``magazines``, ``low_yield`` (defaults to fewer than 2 articles extracted) and
+    ``failed_magazines``, which are added to the rolling low-yield list instead of
+    ``magazine`` on a low-yield run.
+    """
     global _last_poll_stats
+    run_fields = {
+        k: kwargs.pop(k) for k in ("source", "duration_ms", "magazines", "low_yield", "failed_magazines") if k in kwargs
+    }
     _last_poll_stats.update(kwargs)
     _last_poll_stats["last_run_at"] = datetime.now(UTC).isoformat()
-    if kwargs.get("articles_extracted", 0) < 2:
-        mag = kwargs.get("magazine")
-        if mag:
-            lows = list(_last_poll_stats.get("low_yield_magazines") or [])
-            if mag not in lows:
+    low_yield = run_fields.get("low_yield", kwargs.get("articles_extracted", 0) < 2)
+    if low_yield:
+        lows = list(_last_poll_stats.get("low_yield_magazines") or [])
+        for mag in run_fields.get("failed_magazines") or [kwargs.get("magazine")]:
+            if mag and mag not in lows:
                 lows.append(mag)
-            _last_poll_stats["low_yield_magazines"] = lows[-10:]
+        _last_poll_stats["low_yield_magazines"] = lows[-10:]
+    _poll_history.append(
+        {
+            "at": _last_poll_stats["last_run_at"],
+            "source": run_fields.get("source", "poll"),
+            "magazine": kwargs.get("magazine"),
+            "magazines": run_fields.get("magazines") or ([kwargs["magazine"]] if kwargs.get("magazine") else []),
+            "duration_ms": run_fields.get("duration_ms"),
+            "magazines_attempted": kwargs.get("magazines_attempted", 0),
+            "articles_extracted": kwargs.get("articles_extracted", 0),
+            "avg_word_count": kwargs.get("avg_word_count", 0),
+            "low_yield": bool(low_yield),
+        }
+    )
 
 
 def get_last_poll_stats() -> dict:
     return dict(_last_poll_stats)
 
 
+def get_poll_history(limit: int = 50, magazine: str | None = None) -> list[dict]:
+    """Most recent poll runs first, optionally only those that covered ``magazine``."""
+    runs = [r for r in reversed(_poll_history) if not magazine or magazine in r["magazines"]]
+    return runs[: max(0, limit)]
+
+
 def _quality_check_articles(raw: list[dict]) -> dict:
     """Reject listings that look like nav/header scrape, not issue TOC."""
     cleaned: list[dict] = []
@@ -89,16 +144,103 @@ USER_DATA_DIR = os.path.join(os.getcwd(), "user_data")
 SCREENSHOTS_DIR = os.path.join(os.getcwd(), "screenshots")
 
 
+def _env_flag(name: str, default: str) -> bool:
+    return os.environ.get(name, default).strip().lower() not in ("0", "false", "no", "off", "")
+
+
+def _default_headless() -> bool:
+    """READLY_HEADLESS=1/0, or ``auto``: headless on Linux hosts without a display, headed elsewhere."""
+    raw = os.environ.get("READLY_HEADLESS", "auto").strip().lower()
+    if raw in ("1", "true", "yes", "on"):
+        return True
+    if raw in ("0", "false", "no", "off"):
+        return False
+    return sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+HEADLESS = _default_headless()
+# Launch the browser during server startup instead of on the first tool call.
+PREWARM_BROWSER = _env_flag("READLY_PREWARM", "1")
+WATCHDOG_INTERVAL = float(os.environ.get("READLY_WATCHDOG_INTERVAL", "30"))
+# smart_scrape keeps captured pages in memory for the PDF; also write each PNG under screenshots/.
+ARCHIVE_SCREENSHOTS = _env_flag("READLY_ARCHIVE_SCREENSHOTS", "1")
+
+# Text-only operations never need these; aborting them saves bandwidth and load time.
+BLOCK_RESOURCES = _env_flag("READLY_BLOCK_RESOURCES", "1")
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+_TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "scorecardresearch.com",
+    "optimizely.com",
+    "clarity.ms",
+    "bat.bing.com",
+    "amplitude.com",
+    "mixpanel.com",
+    "nr-data.net",
+)
+
+
+def _should_block(resource_type: str, url: str) -> bool:
+    if resource_type in _BLOCKED_RESOURCE_TYPES:
+        return True
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host == h or host.endswith("." + h) for h in _TRACKER_HOSTS)
+
+
+# Below this the page most likely showed a paywall/login stub rather than the article.
+MIN_ARTICLE_WORDS = 50
+
+# Overall deadline for match_magazine_articles; partial results are returned after it.
+MATCH_TIMEOUT = float(os.environ.get("READLY_MATCH_TIMEOUT", "60"))
+
+# Extra tabs in the persistent context used for parallel article extraction.
+# The main tab (``BrowserManager.page``) is never part of the pool.
+PAGE_POOL_SIZE = int(os.environ.get("READLY_PAGE_POOL_SIZE", "4"))
+
+
 class BrowserManager:
     """
     Manages a persistent Playwright session using async API.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        article_cache: ArticleCache | None = None,
+        article_index: ArticleIndex | None = None,
+    ):
         self.playwright: Playwright | None = None
         self.context: BrowserContext | None = None
         self.page: Page | None = None
         self._lock: asyncio.Lock | None = None
+        self.pool_size = max(1, pool_size if pool_size is not None else PAGE_POOL_SIZE)
+        self.pool_gate = PriorityGate(self.pool_size)
+        self._idle_pages: list[Page] = []
+        self._pool_created = 0
+        self.listing_cache = ListingCache()
+        self.search_cache = TTLCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+        self.ranker = BM25Ranker()
+        self._background: set[asyncio.Task] = set()
+        self.article_cache = article_cache if article_cache is not None else ArticleCache()
+        self.article_index = article_index if article_index is not None else ArticleIndex()
+        self.ingest_snapshot = IngestSnapshot()
+        self.fingerprints = FingerprintIndex()
+        self.block_resources = BLOCK_RESOURCES
+        self._full_render = False
+        self._routed = False
+        self._main_page_degraded = False
+        self._blocked_requests = 0
+        self.headless = HEADLESS
+        self.restarts = 0
+        self._watchdog_task: asyncio.Task | None = None
+        self._context_lost: asyncio.Event | None = None
 
     def _get_lock(self):
         """Get or create the lock."""
@@ -112,49 +254,251 @@ class BrowserManager:
                 self._lock = asyncio.Lock()
         return self._lock
 
-    async def start_browser(self, headless=False):
+    async def acquire_page(self, priority: int | None = None) -> Page:
+        """
+        Lease a worker page from the pool, opening a new tab while below ``pool_size``.
+
+        Waiters are served by ``priority`` (defaults to the running job's priority).
+        """
+        if not self.context:
+            raise RuntimeError("Browser not started")
+        await self.pool_gate.acquire(current_priority.get() if priority is None else priority)
+        if self._idle_pages:
+            return self._idle_pages.pop()
+        try:
+            page = await self.context.new_page()
+        except BaseException:
+            self.pool_gate.release()
+            raise
+        self._pool_created += 1
+        return page
+
+    def release_page(self, page: Page) -> None:
+        """Return a leased page to the pool; closed pages free their slot instead."""
+        try:
+            closed = page.is_closed()
+        except Exception:
+            closed = True
+        if closed or self.context is None:
+            self._pool_created = max(0, self._pool_created - 1)
+        else:
+            self._idle_pages.append(page)
+        self.pool_gate.release()
+
+    @asynccontextmanager
+    async def lease_page(self, priority: int | None = None) -> AsyncIterator[Page]:
+        """Async context manager around ``acquire_page`` / ``release_page``."""
+        page = await self.acquire_page(priority)
+        try:
+            yield page
+        finally:
+            self.release_page(page)
+
+    def pool_stats(self) -> dict:
+        idle = len(self._idle_pages)
+        return {
+            "size": self.pool_size,
+            "open": self._pool_created,
+            "idle": idle,
+            "leased": self.pool_gate.in_use,
+        }
+
+    async def start_browser(self, headless: bool | None = None):
         """
         Starts the Playwright browser with a persistent context.
+
+        ``headless`` defaults to the configured mode (``READLY_HEADLESS``).
         """
-        lock = self._get_lock()
-        async with lock:
-            if self.context:
+        async with self._get_lock():
+            return await self._launch(self.headless if headless is None else headless)
+
+    async def _launch(self, headless: bool) -> Page:
+        """Body of ``start_browser``; the caller holds the start lock."""
+        if self.context:
+            try:
+                if self.page and not self.page.is_closed():
+                    return self.page
+                # Main tab closed but the context may still be alive
+                self.page = await self.context.new_page()
+                return self.page
+            except Exception:
+                # Context seemingly dead, restart
+                await self.close()
+
+        print(f"Starting browser (Headless: {headless})...")
+        self.playwright = await async_playwright().start()
+
+        if not os.path.exists(USER_DATA_DIR):
+            os.makedirs(USER_DATA_DIR)
+
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            user_data_dir=USER_DATA_DIR,
+            headless=headless,
+            viewport={"width": 1920, "height": 1080},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            locale="en-GB",
+            # Grant permissions if needed
+            permissions=["clipboard-read", "clipboard-write"],
+        )
+        self._routed = False
+        await self._sync_routing()
+        await install_extraction_script(self.context)
+        self.context.on("close", self._on_context_close)
+
+        pages = self.context.pages
+        if pages:
+            self.page = pages[0]
+        else:
+            self.page = await self.context.new_page()
+
+        return self.page
+
+    def _on_context_close(self, *_args) -> None:
+        if self._context_lost is not None:
+            self._context_lost.set()
+
+    async def probe(self, timeout: float = 5.0) -> bool:
+        """True if the context answers a cheap CDP round trip and the main tab is open."""
+        if not self.context or not self.page:
+            return False
+        try:
+            if self.page.is_closed():
+                return False
+            await asyncio.wait_for(self.context.cookies(), timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _watchdog(self, interval: float) -> None:
+        """Relaunch a dead context in the background so user requests never pay for it."""
+        lost = self._context_lost = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(lost.wait(), timeout=interval)
+            except TimeoutError:
+                pass
+            lost.clear()
+            if await self.probe():
+                continue
+            # Under the start lock, so a relaunch never overlaps a start_browser()
+            # from a request; re-probe in case that request already relaunched.
+            async with self._get_lock():
+                if await self.probe():
+                    continue
+                log.warning("Browser context is not responding; relaunching")
+                self.restarts += 1
+                await self.close()
                 try:
-                    # Check if context is still valid
-                    pages = self.context.pages
-                    if pages:
-                        return self.page
-                except Exception:
-                    # Context seemingly dead, restart
-                    await self.close()
-
-            print(f"Starting browser (Headless: {headless})...")
-            self.playwright = await async_playwright().start()
-
-            if not os.path.exists(USER_DATA_DIR):
-                os.makedirs(USER_DATA_DIR)
-
-            self.context = await self.playwright.chromium.launch_persistent_context(
-                user_data_dir=USER_DATA_DIR,
-                headless=headless,
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                locale="en-GB",
-                # Grant permissions if needed
-                permissions=["clipboard-read", "clipboard-write"],
-            )
+                    await self._launch(self.headless)
+                except Exception as exc:
+                    log.error("Browser relaunch failed: %s", exc)
+
+    def start_watchdog(self, interval: float | None = None) -> None:
+        if self._watchdog_task and not self._watchdog_task.done():
+            return
+        self._watchdog_task = asyncio.create_task(self._watchdog(interval or WATCHDOG_INTERVAL))
+
+    async def prewarm(self) -> None:
+        """Launch the browser ahead of the first request, then keep it alive with the watchdog."""
+        try:
+            await self.start_browser()
+        except Exception as exc:
+            log.error("Browser prewarm failed: %s", exc)
+        self.start_watchdog()
+
+    async def shutdown(self) -> None:
+        if self._watchdog_task:
+            self._watchdog_task.cancel()
+            try:
+                await self._watchdog_task
+            except asyncio.CancelledError:
+                pass
+            self._watchdog_task = None
+        await self.close()
 
-            pages = self.context.pages
-            if pages:
-                self.page = pages[0]
+    def lifecycle_stats(self) -> dict:
+        return {
+            "headless": self.headless,
+            "restarts": self.restarts,
+            "watchdog_running": bool(self._watchdog_task and not self._watchdog_task.done()),
+        }
+
+    def _blocking_active(self) -> bool:
+        return self.block_resources and not self._full_render
+
+    async def _sync_routing(self) -> None:
+        """
+        Install the request filter only while blocking is active.
+
+        Any context route disables Chromium's HTTP cache, so the handler is
+        removed again whenever blocking is switched off or suspended.
+        """
+        active = self._blocking_active() and self.context is not None
+        if active == self._routed:
+            return
+        self._routed = active
+        try:
+            if active:
+                await self.context.route("**/*", self._route_request)
             else:
-                self.page = await self.context.new_page()
+                await self.context.unroute("**/*", self._route_request)
+        except Exception:
+            self._routed = not active
+            raise
+
+    async def _route_request(self, route: Route) -> None:
+        """Context-wide request filter: abort heavy/tracker requests while in text mode."""
+        request = route.request
+        if _should_block(request.resource_type, request.url):
+            self._blocked_requests += 1
+            try:
+                if request.frame.page is self.page:
+                    self._main_page_degraded = True
+            except Exception:
+                pass
+            await route.abort()
+            return
+        await route.continue_()
+
+    async def set_resource_blocking(self, enabled: bool) -> None:
+        """Switch text-mode resource blocking on or off for the whole context."""
+        self.block_resources = bool(enabled)
+        await self._sync_routing()
 
-            return self.page
+    @asynccontextmanager
+    async def full_render(self, reload: bool = True) -> AsyncIterator[None]:
+        """
+        Suspend resource blocking, e.g. for screenshot scraping.
+
+        The request filter is removed for the duration, and if the main tab was
+        loaded with images blocked it is reloaded once so screenshots show the
+        fully rendered page.
+        """
+        outer = not self._full_render
+        self._full_render = True
+        try:
+            await self._sync_routing()
+            if reload and self._main_page_degraded and self.page:
+                self._main_page_degraded = False
+                await self.page.reload()
+                await wait_ready(self.page, "navigation")
+            yield
+        finally:
+            if outer:
+                self._full_render = False
+                await self._sync_routing()
+
+    def resource_blocking_stats(self) -> dict:
+        return {
+            "enabled": self.block_resources,
+            "active": self._routed,
+            "full_render": self._full_render,
+            "blocked_requests": self._blocked_requests,
+        }
 
     async def go_to_readly(self):
         if not self.page:
-            await self.start_browser(headless=False)
+            await self.start_browser()
 
         token = os.environ.get("READLY_AUTH_TOKEN", "")
         domain = os.environ.get("READLY_DOMAIN", "www.readly.co")
@@ -193,91 +537,106 @@ class BrowserManager:
         Takes a screenshot of the current viewport.
         Returns the absolute path to the screenshot.
         """
+        return self.archive_screenshot(issue_name, page_num, await self.capture_page())
+
+    async def capture_page(self) -> bytes:
+        """Screenshot the current viewport and return the PNG bytes, without touching disk."""
         if not self.page:
             raise RuntimeError("Browser not started")
 
-        # Sanitize issue name for directory usage
-        issue_safe_name = "".join([c for c in issue_name if c.isalnum() or c in (" ", "-", "_")]).strip()
-        save_dir = os.path.join(SCREENSHOTS_DIR, issue_safe_name)
-        if not os.path.exists(save_dir):
-            os.makedirs(save_dir)
-
-        filename = f"page_{page_num:03d}.png"
-        filepath = os.path.join(save_dir, filename)
-
         # Reset mouse to avoid hover overlays
         try:
             await self.page.mouse.move(0, 0)
         except Exception:
             pass  # Ignore if move fails
 
-        await asyncio.sleep(0.5)
+        await wait_ready(self.page, "screenshot")
+
+        return await self.page.screenshot(full_page=False)
+
+    @staticmethod
+    def archive_screenshot(issue_name: str, page_num: int, png: bytes) -> str:
+        """Write captured PNG bytes to ``screenshots/<issue>/page_NNN.png``; returns the path."""
+        # Sanitize issue name for directory usage
+        issue_safe_name = "".join([c for c in issue_name if c.isalnum() or c in (" ", "-", "_")]).strip()
+        save_dir = os.path.join(SCREENSHOTS_DIR, issue_safe_name)
+        os.makedirs(save_dir, exist_ok=True)
 
-        await self.page.screenshot(path=filepath, full_page=False)
+        filepath = os.path.join(save_dir, f"page_{page_num:03d}.png")
+        with open(filepath, "wb") as f:
+            f.write(png)
         return filepath
 
-    async def turn_page_right(self):
+    async def turn_page_right(self) -> dict:
+        """Turn to the next page and wait until the reader shows it; returns the readiness signals."""
         if not self.page:
             raise RuntimeError("Browser not started")
 
+        before = await reader_state(self.page)
         # Press Right Arrow
         await self.page.keyboard.press("ArrowRight")
+        return await wait_ready(self.page, "page_turn", before=before)
 
-    async def _scroll_lazy_issue_index(self) -> None:
-        """Scroll issue index to trigger lazy-loaded article cards."""
-        prev_count = 0
-        for _ in range(5):
-            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(1.0)
-            count = await self.page.evaluate("""() => document.querySelectorAll('a[href*="/read/"]').length""")
-            if count == prev_count:
-                break
-            prev_count = count
-        await self.page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(0.5)
+    async def list_articles(self, page: Page | None = None, refresh: bool = False) -> dict:
+        """Parse the current Readly magazine page DOM to extract article titles and URLs.
 
-    async def list_articles(self) -> dict:
-        """Parse the current Readly magazine page DOM to extract article titles and URLs."""
-        if not self.page:
+        Validated listings are cached per issue URL and served stale-while-revalidate;
+        ``refresh=True`` forces a fresh scan.
+        """
+        page = page or self.page
+        if not page:
             raise RuntimeError("Browser not started")
 
-        await self.page.wait_for_load_state("domcontentloaded")
-        await asyncio.sleep(1.5)
-        await self._scroll_lazy_issue_index()
-
-        page_title = await self.page.title()
-        page_url = self.page.url
+        issue_url = page.url
+        if not refresh:
+            cached, stale = self.listing_cache.lookup(issue_url)
+            if cached is not None:
+                if stale:
+                    self._revalidate_listing(issue_url)
+                return {**cached, "cached": True, "stale": stale}
+
+        listing = await self._scan_listing(page)
+        if not listing.get("extraction_failed"):
+            self.listing_cache.store(issue_url, listing)
+        return {**listing, "cached": False}
+
+    def _revalidate_listing(self, issue_url: str) -> None:
+        """Refresh a stale listing on a pooled tab without blocking the caller."""
+        if not self.listing_cache.begin_refresh(issue_url):
+            return
 
-        articles = await self.page.evaluate("""() => {
-            const results = [];
-            const seen = new Set();
-            const selectors = [
-                'a[href*="/read/"]',
-                'a[href*="article"]',
-                '[class*="track"] a',
-                '[class*="article"] a',
-                '[data-testid*="article"]',
-                'article a',
-                '.issue-page a'
-            ];
-            for (const sel of selectors) {
-                for (const el of document.querySelectorAll(sel)) {
-                    const text = el.textContent.trim();
-                    const href = el.href || '';
-                    if (text.length > 10 && !seen.has(href) && (href.includes('readly.co') || href.includes('readly.com'))) {
-                        seen.add(href);
-                        results.push({title: text.substring(0, 200), url: href});
-                    }
-                }
-            }
-            if (results.length === 0) {
-                for (const h of document.querySelectorAll('h1,h2,h3,h4')) {
-                    const text = h.textContent.trim();
-                    if (text.length > 10) results.push({title: text, url: ''});
-                }
-            }
-            return results;
-        }""")
+        async def _refresh() -> None:
+            try:
+                async with self.lease_page(PRIORITY_BATCH) as page:
+                    await page.goto(issue_url)
+                    listing = await self._scan_listing(page)
+                if not listing.get("extraction_failed"):
+                    self.listing_cache.store(issue_url, listing)
+            except Exception as exc:
+                log.warning("Listing revalidation failed for %s: %s", issue_url, exc)
+            finally:
+                self.listing_cache.end_refresh(issue_url)
+
+        task = asyncio.create_task(_refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def invalidate_listing(self, issue_url: str | None = None) -> int:
+        """Drop the cached listing for ``issue_url`` (or all listings)."""
+        return self.listing_cache.invalidate(issue_url)
+
+    async def _scan_listing(self, page: Page) -> dict:
+        """Scroll the issue index and run the article selector scan plus quality gate."""
+        await wait_ready(page, "issue")
+        harvested = await harvest(page, "listing")
+        log.debug("Issue index harvest: %s", {k: v for k, v in harvested.items() if k != "items"})
+
+        scan = await extract_listing(page)
+        page_title = scan.get("title", "")
+        page_url = scan.get("url") or page.url
+        # The harvest keeps cards a virtualized index has already recycled; the final
+        # scan adds the heading fallback for pages without article links.
+        articles = harvested.get("items") or scan.get("articles") or []
 
         checked = _quality_check_articles(articles)
         if checked.get("extraction_failed"):
@@ -304,87 +663,146 @@ class BrowserManager:
         }
 
     async def extract_article_text(self, article_index: int = 0) -> dict:
-        """Navigate to an article and extract its full text content."""
+        """Extract the full text of an article on the current issue page by ``list_articles`` index.
+
+        The article is loaded on a pooled tab, so the main tab stays on the issue page
+        and consecutive calls reuse the same listing.
+        """
         if not self.page:
             raise RuntimeError("Browser not started")
 
-        await self.page.wait_for_load_state("domcontentloaded")
-        await asyncio.sleep(1.5)
-
-        # Find the article link by index
-        href = await self.page.evaluate(f"""((index) => {{
-            const results = [];
-            const seen = new Set();
-            const selectors = [
-                'a[href*="/read/"]',
-                'a[href*="article"]',
-                '[class*="track"] a',
-                '[class*="article"] a',
-            ];
-            for (const sel of selectors) {{
-                for (const el of document.querySelectorAll(sel)) {{
-                    const txt = el.textContent.trim();
-                    const h = el.href || '';
-                    if (txt.length > 10 && !seen.has(h) && (h.includes('readly.co') || h.includes('readly.com'))) {{
-                        seen.add(h);
-                        results.push(h);
-                    }}
-                }}
-                if (results.length > index) break;
-            }}
-            return results[index] || '';
-        }})({article_index})""")
+        listing = await self.list_articles()
+        articles = listing.get("articles") or []
+        if not 0 <= article_index < len(articles):
+            return {"error": f"Article at index {article_index} not found on this page"}
 
+        href = articles[article_index].get("url") or ""
         if not href:
-            return {"error": f"Article at index {article_index} not found on this page"}
+            return {"error": f"Article at index {article_index} has no URL"}
 
-        await self.page.goto(href)
-        await self.page.wait_for_load_state("domcontentloaded")
-        await asyncio.sleep(2)
+        return first_chunk(await self._fetch_article(href, listing))
 
-        title = await self.page.title()
-        text = await self.page.evaluate("""() => {
-            const selectors = [
-                '[class*="body"]', '[class*="content"]', '[class*="article"]',
-                'article', 'main', '.reader-content', '[class*="text"]',
-                '[class*="magazine"]', '[class*="reader"]'
-            ];
-            for (const sel of selectors) {
-                const el = document.querySelector(sel);
-                if (el && el.textContent.length > 50) {
-                    return el.textContent.trim();
-                }
-            }
-            return document.body ? document.body.textContent.trim() : '';
-        }""")
+    async def extract_article_url(self, url: str) -> dict:
+        """Extract an article directly from its URL on a pooled tab."""
+        href = (url or "").strip()
+        if not href.startswith("http"):
+            return {"error": "invalid_url", "url": href}
+        return first_chunk(await self._fetch_article(href))
 
-        author = await self.page.evaluate("""() => {
-            const sel = document.querySelector(
-                '[class*="author"], [class*="byline"], [class*="writer"], [rel="author"]'
-            );
-            return sel ? sel.textContent.trim() : '';
-        }""")
+    async def _fetch_article(self, href: str, listing: dict | None = None) -> dict:
+        """Serve an article from the article cache, or extract it on a pooled tab and cache it.
+
+        Fresh extractions are also added to the full-text index, tagged with the
+        magazine and issue from ``listing`` when the article came from one. Articles
+        that near-duplicate one seen earlier carry ``duplicate_of`` and are not indexed.
+        """
+        cached = self.article_cache.get(href)
+        if cached is not None:
+            return self._with_duplicate({**cached, "cached": True}, listing)
+        async with self.lease_page() as page:
+            article = await self._extract_from_url(page, href)
+        if article.get("word_count", 0) >= MIN_ARTICLE_WORDS:
+            self.article_cache.put(article)
+            article = self._with_duplicate(article, listing)
+            if not article.get("duplicate_of"):
+                self._index_article(article, listing)
+        return {**article, "cached": False}
+
+    def _with_duplicate(self, article: dict, listing: dict | None) -> dict:
+        if DEDUPE_MODE == "off":
+            return article
+        try:
+            match = self.fingerprints.check(article, magazine=magazine_from_issue((listing or {}).get("issue_title")))
+        except Exception as exc:
+            log.warning("Fingerprinting %s failed: %s", article.get("url"), exc)
+            return article
+        if not match:
+            return article
+        return {**article, "duplicate_of": match["duplicate_of"], "duplicate": match}
+
+    def _index_article(self, article: dict, listing: dict | None) -> None:
+        if not ARTICLE_INDEX_ENABLED:
+            return
+        listing = listing or {}
+        try:
+            self.article_index.add(
+                article,
+                magazine=magazine_from_issue(listing.get("issue_title")),
+                issue=listing.get("issue_title") or "",
+                issue_url=listing.get("page_url") or "",
+            )
+        except Exception as exc:
+            log.warning("Indexing %s failed: %s", article.get("url"), exc)
+
+    def get_article_text(
+        self,
+        handle: str,
+        offset: int = 0,
+        limit: int = ARTICLE_CHUNK_CHARS,
+        paragraph_start: int | None = None,
+        paragraph_end: int | None = None,
+    ) -> dict:
+        """Page through the stored full text of an extracted article by ``handle`` (or article URL)."""
+        key = (handle or "").strip()
+        if key.startswith("http"):
+            key = article_handle(key)
+        article = self.article_cache.get_by_handle(key)
+        if article is None:
+            return {"error": "unknown_handle", "handle": handle}
+        return text_chunk(article, offset, limit, paragraph_start, paragraph_end)
+
+    async def _extract_from_url(self, page: Page, href: str) -> dict:
+        """Load an article URL on ``page`` and extract title, author and text."""
+        await page.goto(href)
+        await wait_ready(page, "article")
+
+        extracted = await extract_article(page)
+        paragraphs = extracted.get("paragraphs")
+        # One paragraph per blank-line-separated block, so paragraph paging lines up.
+        text = "\n\n".join(paragraphs) if paragraphs is not None else extracted.get("text") or ""
 
         return {
-            "title": title,
+            "title": extracted.get("title", ""),
             "url": href,
-            "author": author,
-            "text": text[:20000] if text else "",
-            "word_count": len(text.split()) if text else 0,
+            "author": extracted.get("author", ""),
+            "text": text,
+            "word_count": len(text.split()),
+            "content_method": extracted.get("content_method"),
+            "meta": extracted.get("meta") or {},
         }
 
-    async def search_magazines(self, query: str) -> dict:
-        """Navigate to Readly searching for magazines by keyword."""
-        if not self.page:
+    async def search_magazines(
+        self,
+        query: str,
+        page: Page | None = None,
+        *,
+        pooled: bool = False,
+        refresh: bool = False,
+    ) -> dict:
+        """Navigate to Readly searching for magazines by keyword.
+
+        Results are cached per normalised query (LRU + TTL). With ``pooled=True`` a
+        cache miss is searched on a pooled tab instead of the main tab.
+        """
+        key = normalize_query(query)
+        if not refresh:
+            cached = self.search_cache.get(key)
+            if cached is not None:
+                return {**cached, "query": query, "cached": True}
+        if pooled and page is None:
+            async with self.lease_page() as leased:
+                return await self.search_magazines(query, leased, refresh=True)
+
+        page = page or self.page
+        if not page:
             raise RuntimeError("Browser not started")
 
         domain = os.environ.get("READLY_DOMAIN", "www.readly.co")
         search_url = f"https://{domain}/search?q={query}"
-        await self.page.goto(search_url)
-        await self.page.wait_for_load_state("domcontentloaded")
-        await asyncio.sleep(2)
+        await page.goto(search_url)
+        await wait_ready(page, "search")
 
-        results = await self.page.evaluate("""() => {
+        results = await page.evaluate("""() => {
             const items = [];
             const selectors = [
                 'a[href*="/magazine/"]',
@@ -412,22 +830,26 @@ class BrowserManager:
             return items.slice(0, 20);
         }""")
 
-        return {
+        found = {
             "query": query,
             "results": results,
             "count": len(results),
         }
+        # Empty results usually mean the page was not ready or logged out; don't pin them.
+        if results:
+            self.search_cache.set(key, found)
+        return {**found, "cached": False}
 
-    async def open_url(self, url: str) -> dict:
+    async def open_url(self, url: str, page: Page | None = None) -> dict:
         """Navigate browser to a Readly magazine/issue URL."""
-        if not self.page:
+        page = page or self.page
+        if not page:
             raise RuntimeError("Browser not started")
         if not url.strip().startswith("http"):
             return {"success": False, "error": "invalid_url"}
-        await self.page.goto(url.strip())
-        await self.page.wait_for_load_state("domcontentloaded")
-        await asyncio.sleep(2)
-        return {"success": True, "url": self.page.url, "title": await self.page.title()}
+        await page.goto(url.strip())
+        await wait_ready(page, "navigation")
+        return {"success": True, "url": page.url, "title": await page.title()}
 
     async def open_latest_issue(self, magazine_name: str) -> dict:
         """Search for magazine_name and open the best catalogue/issue result."""
@@ -468,77 +890,287 @@ class BrowserManager:
             "issue_title": opened.get("title"),
         }
 
-    async def read_all_articles(self, max_articles: int = 10) -> dict:
-        """Extract full text for articles on the current issue page."""
+    async def _extract_meta(self, meta: dict, listing: dict | None = None) -> dict:
+        href = meta.get("url") or ""
+        if not href:
+            return {"error": "no_article_url"}
+        try:
+            return await self._fetch_article(href, listing)
+        except Exception as exc:
+            log.warning("Article extraction failed for %s: %s", href, exc)
+            return {"error": str(exc)}
+
+    @staticmethod
+    def _skip_entry(meta: dict, extracted: dict, skip_duplicates: bool = False) -> dict | None:
+        """Return the ``skipped`` entry for an unusable (or, with ``skip_duplicates``, duplicate) extraction."""
+        if extracted.get("error"):
+            error = extracted["error"]
+        elif extracted.get("word_count", 0) < MIN_ARTICLE_WORDS:
+            error = "low_word_count"
+        elif skip_duplicates and extracted.get("duplicate_of"):
+            return {
+                "index": meta.get("index"),
+                "title": meta.get("title"),
+                "error": "duplicate",
+                "duplicate_of": extracted["duplicate_of"],
+            }
+        else:
+            return None
+        return {"index": meta.get("index"), "title": meta.get("title"), "error": error}
+
+    @staticmethod
+    def _skip_duplicates(duplicates: str | None) -> bool:
+        return (duplicates or DEDUPE_MODE).strip().lower() == "skip"
+
+    async def _extract_many(self, articles_meta: list[dict]) -> tuple[list[dict], list[dict]]:
+        """Extract listed articles by URL on pooled tabs; returns ``(results, skipped)``."""
+        outcomes = await asyncio.gather(*(self._extract_meta(meta) for meta in articles_meta))
+
+        results: list[dict] = []
+        skipped: list[dict] = []
+        for meta, extracted in zip(articles_meta, outcomes, strict=True):
+            entry = self._skip_entry(meta, extracted)
+            if entry:
+                skipped.append(entry)
+            else:
+                results.append(first_chunk(extracted))
+        return results, skipped
+
+    async def read_articles(self, urls: list[str]) -> dict:
+        """Extract full text for a list of article URLs (e.g. from a prior ``list_articles``)."""
+        metas = [{"index": i, "title": None, "url": u.strip()} for i, u in enumerate(urls or []) if u and u.strip()]
+        results, skipped = await self._extract_many(metas)
+        avg_wc = sum(a.get("word_count", 0) for a in results) / len(results) if results else 0
+        return {
+            "success": len(results) > 0,
+            "articles": results,
+            "count": len(results),
+            "cache_hits": sum(1 for a in results if a.get("cached")),
+            "skipped": skipped,
+            "avg_word_count": int(avg_wc),
+        }
+
+    async def iter_articles(self, max_articles: int = 10, duplicates: str | None = None) -> AsyncIterator[dict]:
+        """Extract articles on the current issue page, yielding each one as soon as it is ready.
+
+        Yields ``{"event": ...}`` dicts: one ``issue`` header (or a single ``error``),
+        then an ``article`` or ``skipped`` event per listed article in completion
+        order, then a ``done`` summary. Closing the generator early cancels the
+        extractions still in flight. Near-duplicates of earlier articles carry
+        ``duplicate_of``; with ``duplicates="skip"`` they are skipped instead
+        (default ``READLY_DEDUPE``).
+        """
         if not self.page:
             raise RuntimeError("Browser not started")
 
         issue_url = self.page.url
         listing = await self.list_articles()
         if listing.get("extraction_failed"):
-            return {
-                "success": False,
-                "issue_url": issue_url,
-                "error": listing.get("reason", "list_articles failed"),
-                "articles": [],
-                "count": 0,
-            }
+            yield {"event": "error", "issue_url": issue_url, "error": listing.get("reason", "list_articles failed")}
+            return
 
         cap = max(1, int(max_articles))
         articles_meta = (listing.get("articles") or [])[:cap]
-        results: list[dict] = []
-        skipped: list[dict] = []
+        yield {
+            "event": "issue",
+            "issue_title": listing.get("issue_title"),
+            "issue_url": issue_url,
+            "total": len(articles_meta),
+        }
 
-        for i, meta in enumerate(articles_meta):
-            if self.page.url != issue_url:
-                await self.page.goto(issue_url)
-                await self.page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(1.5)
-                listing = await self.list_articles()
-                if listing.get("extraction_failed"):
-                    break
-                articles_meta = listing.get("articles") or []
-                if i >= len(articles_meta):
-                    break
-                meta = articles_meta[i]
+        async def _extract(meta: dict) -> tuple[dict, dict]:
+            return meta, await self._extract_meta(meta, listing)
 
-            extracted = await self.extract_article_text(int(meta.get("index", i)))
-            if extracted.get("error"):
-                skipped.append(
-                    {
-                        "index": meta.get("index"),
-                        "title": meta.get("title"),
-                        "error": extracted["error"],
-                    }
-                )
-                continue
-            if extracted.get("word_count", 0) < 50:
-                skipped.append(
-                    {
-                        "index": meta.get("index"),
-                        "title": meta.get("title"),
-                        "error": "low_word_count",
-                    }
-                )
-                continue
-            results.append(extracted)
+        skip_duplicates = self._skip_duplicates(duplicates)
+        started = time.monotonic()
+        tasks = [asyncio.create_task(_extract(meta)) for meta in articles_meta]
+        count = skipped = cache_hits = words = dupes = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                meta, extracted = await next_done
+                dupes += 1 if extracted.get("duplicate_of") else 0
+                entry = self._skip_entry(meta, extracted, skip_duplicates)
+                if entry:
+                    skipped += 1
+                    yield {"event": "skipped", **entry}
+                    continue
+                count += 1
+                words += extracted.get("word_count", 0)
+                cache_hits += 1 if extracted.get("cached") else 0
+                yield {"event": "article", "index": meta.get("index"), **first_chunk(extracted)}
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        avg_wc = sum(a.get("word_count", 0) for a in results) / len(results) if results else 0
+        avg_wc = int(words / count) if count else 0
         record_poll_stats(
             magazines_attempted=1,
-            articles_extracted=len(results),
-            avg_word_count=int(avg_wc),
+            articles_extracted=count,
+            avg_word_count=avg_wc,
             magazine=listing.get("issue_title"),
+            source="read_all_articles",
+            duration_ms=int((time.monotonic() - started) * 1000),
         )
+        yield {
+            "event": "done",
+            "count": count,
+            "skipped": skipped,
+            "cache_hits": cache_hits,
+            "duplicates": dupes,
+            "avg_word_count": avg_wc,
+        }
 
+    async def read_all_articles(
+        self,
+        max_articles: int = 10,
+        on_progress: Callable[[int, int], Awaitable[None]] | None = None,
+        duplicates: str | None = None,
+    ) -> dict:
+        """Extract full text for articles on the current issue page.
+
+        Costs one listing pass (reused if ``list_articles`` already ran on this page)
+        plus one load per article; articles are loaded concurrently on pooled tabs.
+        ``on_progress(done, total)`` is awaited after each article finishes;
+        ``duplicates`` is ``"mark"`` or ``"skip"`` as for ``iter_articles``.
+        """
+        issue: dict = {}
+        results: list[dict] = []
+        skipped: list[dict] = []
+        summary: dict = {}
+        async for event in self.iter_articles(max_articles, duplicates):
+            kind = event.pop("event")
+            if kind == "error":
+                return {**event, "success": False, "articles": [], "count": 0}
+            if kind == "issue":
+                issue = event
+            elif kind == "article":
+                results.append(event)
+            elif kind == "skipped":
+                skipped.append(event)
+            else:
+                summary = event
+            if on_progress and kind in ("article", "skipped"):
+                await on_progress(len(results) + len(skipped), issue.get("total", 0))
+
+        # Completion order is arbitrary; report articles in listing order like before.
+        results.sort(key=lambda a: a["index"])
+        for article in results:
+            del article["index"]
         return {
             "success": len(results) > 0,
-            "issue_title": listing.get("issue_title"),
-            "issue_url": issue_url,
+            "issue_title": issue.get("issue_title"),
+            "issue_url": issue.get("issue_url"),
             "articles": results,
             "count": len(results),
-            "skipped": skipped,
-            "avg_word_count": int(avg_wc),
+            "cache_hits": summary.get("cache_hits", 0),
+            "duplicates": summary.get("duplicates", 0),
+            "skipped": sorted(skipped, key=lambda e: e.get("index") or 0),
+            "avg_word_count": summary.get("avg_word_count", 0),
+        }
+
+    async def _magazine_listing(self, mag_name: str, slots: asyncio.Semaphore, refresh: bool = False) -> dict:
+        """Open ``mag_name``'s latest issue on a pooled tab and return its article listing.
+
+        ``refresh`` rescans the issue instead of serving the listing cache."""
+        async with slots, self.lease_page() as page:
+            search = await self.search_magazines(mag_name, page=page)
+            results = search.get("results") or []
+            if not results:
+                return {}
+            opened = await self.open_url(results[0].get("url") or "", page=page)
+            if not opened.get("success"):
+                return {}
+            return await self.list_articles(page=page, refresh=refresh)
+
+    def _ranking_documents(self, mag_name: str, listing: dict) -> list[dict]:
+        """Listed articles as ranking documents, with full text where the article cache has it."""
+        articles = listing.get("articles") or []
+        texts = self.article_cache.peek_texts([a.get("url") or "" for a in articles])
+        return [
+            {
+                "magazine": mag_name,
+                "title": str(a.get("title") or ""),
+                "url": a.get("url"),
+                "index": a.get("index"),
+                "issue_title": listing.get("issue_title"),
+                "text": texts.get(a.get("url") or "", ""),
+            }
+            for a in articles
+        ]
+
+    @staticmethod
+    def _hit(ranked: dict) -> dict:
+        doc = ranked["doc"]
+        return {
+            "magazine": doc["magazine"],
+            "title": doc["title"],
+            "url": doc["url"],
+            "index": doc["index"],
+            "issue_title": doc["issue_title"],
+            "match_score": ranked["score"],
+            "matched_terms": ranked["matched_terms"],
+            "text_ranked": bool(doc["text"]),
+        }
+
+    async def _gather_listings(
+        self,
+        names: list[str],
+        *,
+        concurrency: int | None,
+        timeout: float | None,
+        on_listing: Callable[[str, dict], bool] | None = None,
+        refresh: bool = False,
+    ) -> dict:
+        """
+        Fetch the latest-issue listing of each magazine concurrently on pooled tabs.
+
+        ``on_listing(name, listing)`` runs as each listing arrives; returning True
+        stops the fan-out early. Unfinished magazines are cancelled at the deadline.
+        ``refresh`` bypasses the listing cache.
+        """
+        slots = asyncio.Semaphore(max(1, min(concurrency or self.pool_size, self.pool_size)))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + (timeout if timeout is not None else MATCH_TIMEOUT)
+        tasks = {asyncio.create_task(self._magazine_listing(name, slots, refresh)): name for name in names}
+        pending = set(tasks)
+        listings: dict[str, dict] = {}
+        failed: list[str] = []
+        timed_out = stopped = False
+        try:
+            while pending and not stopped:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks[task]
+                    try:
+                        listings[name] = task.result()
+                    except Exception as exc:
+                        log.warning("Listing %s for matching failed: %s", name, exc)
+                        failed.append(name)
+                        continue
+                    if on_listing and on_listing(name, listings[name]):
+                        stopped = True
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        unfinished = [tasks[t] for t in pending]
+        return {
+            "listings": listings,
+            "magazines_searched": names,
+            "magazines_completed": list(listings),
+            "magazines_failed": failed,
+            "magazines_unfinished": unfinished,
+            "partial": bool(unfinished),
+            "timed_out": timed_out,
+            "elapsed_ms": int((loop.time() - started) * 1000),
         }
 
     async def match_magazine_articles(
@@ -547,62 +1179,161 @@ class BrowserManager:
         magazine_names: list[str] | None = None,
         *,
         max_per_magazine: int = 3,
+        max_hits: int = 15,
+        concurrency: int | None = None,
+        timeout: float | None = None,
     ) -> dict:
-        """Search Readly magazines and list articles whose titles overlap the query."""
-        import re
-
-        if not self.page:
-            await self.start_browser(headless=False)
+        """Search Readly magazines and list articles relevant to the query, ranked by BM25.
 
-        names = [n.strip() for n in (magazine_names or []) if n and n.strip()]
-        if not names:
-            names = ["New Scientist"]
+        Titles are always ranked; article text is ranked too when the article is
+        already in the article cache. Magazines are processed concurrently on pooled
+        tabs (at most ``concurrency`` at a time). Each magazine contributes at most
+        ``max_per_magazine`` hits; the call stops once ``max_hits`` hits exist or
+        ``timeout`` seconds have passed, returning what it has with ``partial=True``.
+        """
+        if not self.context:
+            await self.start_browser()
 
-        query_words = [
-            w.lower()
-            for w in re.findall(r"[a-z0-9]{4,}", query.lower())
-            if w not in ("with", "from", "using", "paper", "that", "this")
-        ][:8]
+        names = [n.strip() for n in (magazine_names or []) if n and n.strip()] or ["New Scientist"]
+        cap = max(1, int(max_per_magazine))
+        limit = max(1, int(max_hits))
         hits: list[dict] = []
 
-        for mag_name in names:
-            search = await self.search_magazines(mag_name)
-            results = search.get("results") or []
-            if not results:
-                continue
-            opened = await self.open_url(results[0].get("url") or "")
-            if not opened.get("success"):
-                continue
-            listing = await self.list_articles()
-            for article in listing.get("articles") or []:
-                title = str(article.get("title") or "")
-                blob = title.lower()
-                score = sum(1 for w in query_words if w in blob)
-                if score >= 2 or (len(query_words) == 1 and query_words[0] in blob):
-                    hits.append(
-                        {
-                            "magazine": mag_name,
-                            "title": title,
-                            "url": article.get("url"),
-                            "index": article.get("index"),
-                            "issue_title": listing.get("issue_title"),
-                            "match_score": score,
-                        }
-                    )
-            if len([h for h in hits if h.get("magazine") == mag_name]) >= max_per_magazine:
-                continue
+        def _score(name: str, listing: dict) -> bool:
+            ranked = self.ranker.rank([query], self._ranking_documents(name, listing), top_k=cap)[0]
+            hits.extend(self._hit(r) for r in ranked)
+            return len(hits) >= limit
+
+        gathered = await self._gather_listings(names, concurrency=concurrency, timeout=timeout, on_listing=_score)
+        gathered.pop("listings")
+        hits.sort(key=lambda h: h["match_score"], reverse=True)
+        return {"query": query, **gathered, "hits": hits[:limit], "count": len(hits[:limit])}
 
-        hits.sort(key=lambda h: int(h.get("match_score") or 0), reverse=True)
+    async def match_queries(
+        self,
+        queries: list[str],
+        magazine_names: list[str] | None = None,
+        *,
+        max_per_magazine: int = 3,
+        max_hits: int = 15,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """Rank many queries (e.g. a day's paper titles) against the same magazines in one pass.
+
+        Every magazine is listed once; all queries are then scored as one BM25 batch.
+        Returns one ``{"query", "hits", "count"}`` entry per query, in input order.
+        """
+        if not self.context:
+            await self.start_browser()
+
+        names = [n.strip() for n in (magazine_names or []) if n and n.strip()] or ["New Scientist"]
+        queries = [q.strip() for q in queries if q and q.strip()]
+        gathered = await self._gather_listings(names, concurrency=concurrency, timeout=timeout)
+        documents = [
+            doc for name, listing in gathered.pop("listings").items() for doc in self._ranking_documents(name, listing)
+        ]
+
+        cap = max(1, int(max_per_magazine))
+        limit = max(1, int(max_hits))
+        results = []
+        for query, ranked in zip(queries, self.ranker.rank(queries, documents), strict=True):
+            per_magazine: dict[str, int] = {}
+            hits: list[dict] = []
+            for r in ranked:
+                mag = r["doc"]["magazine"]
+                if per_magazine.get(mag, 0) < cap:
+                    per_magazine[mag] = per_magazine.get(mag, 0) + 1
+                    hits.append(self._hit(r))
+                if len(hits) >= limit:
+                    break
+            results.append({"query": query, "hits": hits, "count": len(hits)})
+        return {**gathered, "documents": len(documents), "results": results}
+
+    async def ingest(
+        self,
+        magazine_names: list[str],
+        *,
+        extract: bool = True,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        duplicates: str | None = None,
+    ) -> dict:
+        """Poll magazines and return only what changed since the last poll.
+
+        Lists each magazine's latest issue, diffs it against the ingest snapshot
+        and (with ``extract``) extracts just the new or previously failed articles.
+        Articles that extract but are too short are marked done and not retried,
+        as are near-duplicates of earlier articles when ``duplicates="skip"``.
+        """
+        skip_duplicates = self._skip_duplicates(duplicates)
+        if not self.context:
+            await self.start_browser()
+
+        names = [n.strip() for n in magazine_names if n and n.strip()]
+        started = time.monotonic()
+        # Diffing needs the issue as it is now, not a cached (possibly stale) listing.
+        gathered = await self._gather_listings(names, concurrency=concurrency, timeout=timeout, refresh=True)
+
+        async def _ingest_one(name: str, listing: dict) -> dict:
+            if not listing.get("articles"):
+                return {"magazine": name, "error": listing.get("reason") or "no_listing", "new_articles": []}
+            delta = self.ingest_snapshot.diff(name, listing)
+            entry = {
+                "magazine": name,
+                "issue_title": listing.get("issue_title"),
+                "issue_url": listing.get("page_url"),
+                "new_issue": delta["new_issue"],
+                "known_articles": delta["known"],
+                "pending_articles": len(delta["pending"]),
+            }
+            if not extract:
+                return {**entry, "new_articles": [{"title": a["title"], "url": a["url"]} for a in delta["pending"]]}
+            outcomes = await asyncio.gather(*(self._extract_meta(meta, listing) for meta in delta["pending"]))
+            new_articles, skipped, done_skipping = [], [], []
+            for meta, extracted in zip(delta["pending"], outcomes, strict=True):
+                skip = self._skip_entry(meta, extracted, skip_duplicates)
+                if not skip:
+                    new_articles.append(first_chunk(extracted))
+                    continue
+                skipped.append(skip)
+                if skip["error"] in ("low_word_count", "duplicate"):
+                    done_skipping.append(meta["url"])
+            self.ingest_snapshot.mark([a["url"] for a in new_articles], STATE_EXTRACTED)
+            self.ingest_snapshot.mark(done_skipping, STATE_SKIPPED)
+            duplicates_found = sum(1 for a in outcomes if a.get("duplicate_of"))
+            return {**entry, "new_articles": new_articles, "skipped": skipped, "duplicates": duplicates_found}
+
+        listings = gathered.pop("listings")
+        magazines = await asyncio.gather(*(_ingest_one(name, listing) for name, listing in listings.items()))
+        new_count = sum(len(m["new_articles"]) for m in magazines)
+        if extract:
+            words = [a.get("word_count", 0) for m in magazines for a in m["new_articles"]]
+            record_poll_stats(
+                magazines_attempted=len(names),
+                articles_extracted=new_count,
+                avg_word_count=int(sum(words) / len(words)) if words else 0,
+                failed_magazines=[m["magazine"] for m in magazines if m.get("error")] + gathered["magazines_failed"],
+                magazine=names[0] if len(names) == 1 else None,
+                magazines=names,
+                source="ingest",
+                duration_ms=int((time.monotonic() - started) * 1000),
+                # An empty delta is the normal case for incremental polls; only errors are low yield.
+                low_yield=any(m.get("error") for m in magazines) or bool(gathered["magazines_failed"]),
+            )
         return {
-            "query": query,
-            "magazines_searched": names,
-            "hits": hits[:15],
-            "count": len(hits[:15]),
+            **gathered,
+            "success": bool(listings),
+            "magazines": magazines,
+            "new_issues": sum(1 for m in magazines if m.get("new_issue")),
+            "new_articles": new_count,
+            "elapsed_ms": int((time.monotonic() - started) * 1000),
         }
 
-    async def list_library(self) -> dict:
+    async def list_library(self, page: Page | None = None) -> dict:
         """Scrape the Readly newsstand/magazine library page for all available issues."""
-        if not self.page:
+        page = page or self.page
+        if not page:
             raise RuntimeError("Browser not started")
 
         domain = os.environ.get("READLY_DOMAIN", "www.readly.co")
@@ -610,76 +1341,18 @@ class BrowserManager:
         newsstand_url = f"https://{domain}/at/newsstand"
         if token:
             newsstand_url = f"{newsstand_url}?readlyAuth={token}"
-        await self.page.goto(newsstand_url)
-        await self.page.wait_for_load_state("domcontentloaded")
-        await asyncio.sleep(3)
-        # Scroll to trigger lazy loading
-        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await asyncio.sleep(1.5)
-        await self.page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(0.5)
-
-        magazines = await self.page.evaluate("""() => {
-            const results = [];
-            const seen = new Set();
-
-            // Strategy 1: Look for article/cover elements with magazine info
-            const candidates = document.querySelectorAll(
-                'a, article, [class*="tile"], [class*="card"], [class*="cover"], ' +
-                '[class*="magazine"], [class*="issue"], [class*="publication"], ' +
-                '[class*="item"], figure, [class*="grid"] > div'
-            );
-
-            for (const el of candidates) {
-                const link = el.tagName === 'A' ? el : el.querySelector('a');
-                const href = link ? (link.href || '') : '';
-                const img = el.querySelector('img');
-                const imgSrc = img ? (img.src || '') : '';
-                const titleEl = el.querySelector(
-                    '[class*="title"], [class*="name"], h1, h2, h3, h4, ' +
-                    '[class*="heading"], figcaption, [class*="label"]'
-                );
-                const title = titleEl
-                    ? titleEl.textContent.trim()
-                    : (img ? img.alt || '' : el.textContent.trim());
-
-                if (title && title.length > 3 && !seen.has(title)) {
-                    seen.add(title);
-                    results.push({
-                        title: title.substring(0, 200),
-                        url: href || window.location.href,
-                        cover_url: imgSrc || '',
-                        type: href.includes('/magazine/') ? 'magazine'
-                            : href.includes('/issue/') ? 'issue'
-                            : href.includes('/read/') ? 'article' : 'unknown',
-                    });
-                }
-            }
-
-            // Strategy 2: Fallback — grab all <img> with meaningful alt text
-            if (results.length < 3) {
-                for (const img of document.querySelectorAll('img[alt]')) {
-                    const alt = img.alt.trim();
-                    if (alt.length > 5 && !seen.has(alt)) {
-                        seen.add(alt);
-                        const parent = img.closest('a');
-                        results.push({
-                            title: alt.substring(0, 200),
-                            url: parent ? parent.href : '',
-                            cover_url: img.src || '',
-                            type: 'magazine',
-                        });
-                    }
-                }
-            }
-
-            return results.slice(0, 50);
-        }""")
+        await page.goto(newsstand_url)
+        await wait_ready(page, "library")
+        harvested = await harvest(page, "library")
+        magazines = harvested.get("items") or []
+        if len(magazines) < 3:
+            magazines = (await extract_library(page)).get("items") or []
 
         return {
             "magazines": magazines,
             "count": len(magazines),
-            "page_url": self.page.url,
+            "page_url": page.url,
+            "harvest": {k: harvested.get(k) for k in ("steps", "reason", "elapsed_ms")},
         }
 
     async def close(self):
@@ -694,6 +1367,11 @@ class BrowserManager:
             self.context = None
             self.page = None
             self.playwright = None
+            self._idle_pages = []
+            self._pool_created = 0
+            self.listing_cache.invalidate()
+            self._main_page_degraded = False
+            self._routed = False
 
 
 # Global instance for the application
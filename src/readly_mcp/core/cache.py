@@ -0,0 +1,301 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+
+from .storage import SQLiteStore
+
+log = logging.getLogger(__name__)
+
+# Published magazine articles do not change, so entries live for a long time.
+ARTICLE_CACHE_TTL = float(os.environ.get("READLY_ARTICLE_CACHE_TTL", str(30 * 24 * 3600)))
+ARTICLE_CACHE_MAX_MB = float(os.environ.get("READLY_ARTICLE_CACHE_MAX_MB", "200"))
+# Issue listings are served fresh for LISTING_TTL, then stale (with a background
+# refresh) until LISTING_STALE_TTL.
+LISTING_TTL = float(os.environ.get("READLY_LISTING_TTL", "900"))
+LISTING_STALE_TTL = float(os.environ.get("READLY_LISTING_STALE_TTL", str(24 * 3600)))
+SEARCH_CACHE_TTL = float(os.environ.get("READLY_SEARCH_CACHE_TTL", "3600"))
+SEARCH_CACHE_SIZE = int(os.environ.get("READLY_SEARCH_CACHE_SIZE", "256"))
+
+
+def article_handle(url: str) -> str:
+    """Short stable id for an article URL, used to page through its stored text."""
+    return hashlib.sha1(url.encode("utf-8"), usedforsecurity=False).hexdigest()[:16]
+
+
+class ArticleCache(SQLiteStore):
+    """
+    On-disk cache of extracted articles keyed by article URL.
+
+    Entries expire after ``ttl_seconds``; once the stored text exceeds
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS articles (
+            url TEXT PRIMARY KEY,
+            handle TEXT NOT NULL,
+            title TEXT,
+            author TEXT,
+            text TEXT,
+            word_count INTEGER,
+            meta TEXT,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS articles_accessed ON articles (accessed_at);
+        CREATE UNIQUE INDEX IF NOT EXISTS articles_handle ON articles (handle);
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float = ARTICLE_CACHE_TTL,
+        max_bytes: int = int(ARTICLE_CACHE_MAX_MB * 1024 * 1024),
+    ):
+        super().__init__("articles.sqlite3", path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str) -> dict | None:
+        article = self._load("url", url)
+        if article is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return article
+
+    def get_by_handle(self, handle: str) -> dict | None:
+        """Look up an article by the ``handle`` returned with its first text chunk."""
+        return self._load("handle", handle)
+
+    def _load(self, column: str, value: str) -> dict | None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(f"SELECT * FROM articles WHERE {column} = ?", (value,)).fetchone()  # noqa: S608
+            if row is not None and now - row["created_at"] > self.ttl_seconds:
+                conn.execute("DELETE FROM articles WHERE url = ?", (row["url"],))
+                conn.commit()
+                row = None
+            if row is None:
+                return None
+            conn.execute("UPDATE articles SET accessed_at = ? WHERE url = ?", (now, row["url"]))
+            conn.commit()
+        return {
+            "title": row["title"],
+            "url": row["url"],
+            "handle": row["handle"],
+            "author": row["author"],
+            "text": row["text"],
+            "word_count": row["word_count"],
+            "meta": json.loads(row["meta"] or "{}"),
+        }
+
+    def put(self, article: dict) -> None:
+        url = article.get("url")
+        if not url:
+            return
+        text = article.get("text") or ""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    article_handle(url),
+                    article.get("title") or "",
+                    article.get("author") or "",
+                    text,
+                    int(article.get("word_count") or 0),
+                    json.dumps(article.get("meta") or {}),
+                    len(text.encode("utf-8")),
+                    now,
+                    now,
+                ),
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def peek_texts(self, urls: list[str]) -> dict[str, str]:
+        """Cached text for any of ``urls``, without touching hit/miss stats or LRU order."""
+        urls = [u for u in urls if u]
+        if not urls:
+            return {}
+        found: dict[str, str] = {}
+        with self._lock:
+            conn = self._connect()
+            # Stay well below SQLite's bound-parameter limit.
+            for i in range(0, len(urls), 500):
+                chunk = urls[i : i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(f"SELECT url, text FROM articles WHERE url IN ({marks})", chunk)  # noqa: S608
+                found.update({row["url"]: row["text"] for row in rows})
+        return found
+
+    def _evict(self, conn, now: float) -> None:
+        conn.execute("DELETE FROM articles WHERE created_at < ?", (now - self.ttl_seconds,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        victims = []
+        for row in conn.execute("SELECT url, size FROM articles ORDER BY accessed_at"):
+            if total - freed <= self.max_bytes:
+                break
+            victims.append((row["url"],))
+            freed += row["size"]
+        conn.executemany("DELETE FROM articles WHERE url = ?", victims)
+        log.debug("Article cache evicted %d entries (%d bytes)", len(victims), freed)
+
+    def invalidate(self, url: str | None = None) -> int:
+        with self._lock:
+            conn = self._connect()
+            if url:
+                cur = conn.execute("DELETE FROM articles WHERE url = ?", (url,))
+            else:
+                cur = conn.execute("DELETE FROM articles")
+            conn.commit()
+            return cur.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            conn = self._connect()
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles").fetchone()
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "path": self.path,
+        }
+
+
+class ListingCache:
+    """
+    In-memory cache of validated issue listings keyed by issue URL.
+
+    ``lookup`` returns ``(listing, stale)``; callers serve stale entries
+    immediately and revalidate them in the background.
+    """
+
+    def __init__(
+        self, ttl_seconds: float = LISTING_TTL, stale_seconds: float = LISTING_STALE_TTL, max_entries: int = 256
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = max(stale_seconds, ttl_seconds)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._refreshing: set[str] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def lookup(self, url: str) -> tuple[dict | None, bool]:
+        entry = self._entries.get(url)
+        if entry is None:
+            self.misses += 1
+            return None, False
+        stored_at, listing = entry
+        age = time.monotonic() - stored_at
+        if age > self.stale_seconds:
+            del self._entries[url]
+            self.misses += 1
+            return None, False
+        self._entries.move_to_end(url)
+        if age > self.ttl_seconds:
+            self.stale_hits += 1
+            return listing, True
+        self.hits += 1
+        return listing, False
+
+    def store(self, url: str, listing: dict) -> None:
+        self._entries[url] = (time.monotonic(), listing)
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def begin_refresh(self, url: str) -> bool:
+        """Claim the background refresh for ``url``; False if one is already running."""
+        if url in self._refreshing:
+            return False
+        self._refreshing.add(url)
+        self.refreshes += 1
+        return True
+
+    def end_refresh(self, url: str) -> None:
+        self._refreshing.discard(url)
+
+    def invalidate(self, url: str | None = None) -> int:
+        if url is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        return 1 if self._entries.pop(url, None) is not None else 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refreshing": len(self._refreshing),
+        }
+
+
+class TTLCache:
+    """Small in-memory LRU cache whose entries also expire after ``ttl_seconds``."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str | None = None) -> int:
+        if key is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        return 1 if self._entries.pop(key, None) is not None else 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive cache key for search queries."""
+    return " ".join((query or "").lower().split())
@@ -0,0 +1,77 @@
+import os
+import re
+
+from .cache import article_handle
+
+# Characters of article text returned inline; the rest stays server-side and is
+# fetched with ``text_chunk`` by handle.
+ARTICLE_CHUNK_CHARS = int(os.environ.get("READLY_ARTICLE_CHUNK_CHARS", "20000"))
+
+_PARAGRAPH_BREAK_RE = re.compile(r"\s*\n\s*")
+
+
+def split_paragraphs(text: str) -> list[str]:
+    """Split extracted text on line breaks into non-empty paragraphs."""
+    return [p for p in _PARAGRAPH_BREAK_RE.split(text or "") if p.strip()]
+
+
+def first_chunk(article: dict, limit: int = ARTICLE_CHUNK_CHARS) -> dict:
+    """
+    Replace an article's full ``text`` with its first ``limit`` characters.
+
+    Adds ``handle``, ``total_chars``, ``has_more`` and ``next_offset`` so the
+    client can fetch the rest with ``text_chunk``.
+    """
+    text = article.get("text") or ""
+    if not article.get("url"):
+        return article
+    limit = max(1, int(limit))
+    return {
+        **article,
+        "text": text[:limit],
+        "handle": article.get("handle") or article_handle(article["url"]),
+        "total_chars": len(text),
+        "has_more": len(text) > limit,
+        "next_offset": limit if len(text) > limit else None,
+    }
+
+
+def text_chunk(
+    article: dict,
+    offset: int = 0,
+    limit: int = ARTICLE_CHUNK_CHARS,
+    paragraph_start: int | None = None,
+    paragraph_end: int | None = None,
+) -> dict:
+    """
+    A slice of a stored article's text, by character ``offset``/``limit`` or by
+    paragraph range ``[paragraph_start, paragraph_end)`` when either is given.
+    """
+    text = article.get("text") or ""
+    result = {
+        "handle": article.get("handle"),
+        "url": article.get("url"),
+        "title": article.get("title"),
+        "total_chars": len(text),
+    }
+    if paragraph_start is not None or paragraph_end is not None:
+        paragraphs = split_paragraphs(text)
+        start = max(0, paragraph_start or 0)
+        end = len(paragraphs) if paragraph_end is None else min(len(paragraphs), max(start, paragraph_end))
+        return {
+            **result,
+            "paragraphs": paragraphs[start:end],
+            "paragraph_start": start,
+            "paragraph_end": end,
+            "total_paragraphs": len(paragraphs),
+            "has_more": end < len(paragraphs),
+        }
+    offset = max(0, int(offset))
+    end = offset + max(1, int(limit))
+    return {
+        **result,
+        "text": text[offset:end],
+        "offset": offset,
+        "has_more": end < len(text),
+        "next_offset": end if end < len(text) else None,
+    }
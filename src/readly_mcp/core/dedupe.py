@@ -0,0 +1,173 @@
+import hashlib
+import os
+import re
+import time
+
+from .storage import SQLiteStore
+
+# What batch extraction does with near-duplicates by default: "mark" (tag them
+# with ``duplicate_of``), "skip" (drop them from results) or "off" (no fingerprinting).
+DEDUPE_MODE = os.environ.get("READLY_DEDUPE", "mark").strip().lower()
+DEDUPE_DISTANCE = int(os.environ.get("READLY_DEDUPE_DISTANCE", "3"))
+
+SIMHASH_BITS = 64
+SHINGLE_WORDS = 3
+# Four 16-bit bands: two fingerprints within 3 bits of each other agree exactly on
+# at least one band (pigeonhole), so band lookups find every such candidate.
+_BANDS = 4
+_BAND_BITS = SIMHASH_BITS // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_MIN_WORDS = 20
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(text: str, shingle: int = SHINGLE_WORDS) -> int | None:
+    """
+    64-bit SimHash over overlapping ``shingle``-word windows of ``text``.
+
+    Returns ``None`` for texts too short to fingerprint reliably.
+    """
+    words = _WORD_RE.findall((text or "").lower())
+    if len(words) < _MIN_WORDS:
+        return None
+    counts = [0] * SIMHASH_BITS
+    for i in range(len(words) - shingle + 1):
+        h = _hash64(" ".join(words[i : i + shingle]))
+        for bit in range(SIMHASH_BITS):
+            counts[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, c in enumerate(counts) if c > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _bands(fp: int) -> list[int]:
+    return [fp >> (i * _BAND_BITS) & _BAND_MASK for i in range(_BANDS)]
+
+
+def _to_sql(fp: int) -> int:
+    # SQLite integers are signed 64-bit.
+    return fp - (1 << 64) if fp >= 1 << 63 else fp
+
+
+def _from_sql(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class FingerprintIndex(SQLiteStore):
+    """
+    SimHash fingerprints of extracted articles, for near-duplicate detection.
+
+    The first article seen with a given fingerprint is canonical; later articles
+    within ``max_distance`` bits (syndicated pieces, reprints across issues and
+    magazines) are recorded as duplicates of it. Decisions are stored per URL,
+    so re-checking an article is a single lookup.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS fingerprints (
+            url TEXT PRIMARY KEY,
+            fingerprint INTEGER NOT NULL,
+            band0 INTEGER NOT NULL,
+            band1 INTEGER NOT NULL,
+            band2 INTEGER NOT NULL,
+            band3 INTEGER NOT NULL,
+            title TEXT,
+            magazine TEXT,
+            duplicate_of TEXT,
+            distance INTEGER,
+            added_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS fingerprints_band0 ON fingerprints (band0);
+        CREATE INDEX IF NOT EXISTS fingerprints_band1 ON fingerprints (band1);
+        CREATE INDEX IF NOT EXISTS fingerprints_band2 ON fingerprints (band2);
+        CREATE INDEX IF NOT EXISTS fingerprints_band3 ON fingerprints (band3);
+    """
+
+    _CANDIDATES_SQL = """
+        SELECT url, fingerprint, title, magazine FROM fingerprints
+        WHERE duplicate_of IS NULL AND url != ?
+          AND (band0 = ? OR band1 = ? OR band2 = ? OR band3 = ?)
+        ORDER BY added_at
+    """
+
+    def __init__(self, path: str | None = None, max_distance: int = DEDUPE_DISTANCE):
+        super().__init__("fingerprints.sqlite3", path)
+        self.max_distance = max(0, max_distance)
+
+    def check(self, article: dict, *, magazine: str = "") -> dict | None:
+        """
+        Fingerprint ``article`` and return its canonical original if it is a near-duplicate.
+
+        Returns ``{"duplicate_of", "title", "magazine", "distance"}`` or ``None``;
+        a new article that is not a duplicate becomes canonical for later checks.
+        """
+        url = article.get("url")
+        if not url:
+            return None
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                """SELECT f.duplicate_of, f.distance, c.title, c.magazine FROM fingerprints f
+                   LEFT JOIN fingerprints c ON c.url = f.duplicate_of WHERE f.url = ?""",
+                (url,),
+            ).fetchone()
+            if row is not None:
+                return self._match(row["duplicate_of"], row["title"], row["magazine"], row["distance"])
+        fp = simhash(article.get("text") or "")
+        if fp is None:
+            return None
+        bands = _bands(fp)
+        with self._lock:
+            conn = self._connect()
+            best = None
+            for cand in conn.execute(self._CANDIDATES_SQL, (url, *bands)):
+                distance = hamming(fp, _from_sql(cand["fingerprint"]))
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, cand)
+            conn.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    _to_sql(fp),
+                    *bands,
+                    article.get("title") or "",
+                    magazine,
+                    best[1]["url"] if best else None,
+                    best[0] if best else None,
+                    time.time(),
+                ),
+            )
+            conn.commit()
+        if best is None:
+            return None
+        distance, cand = best
+        return self._match(cand["url"], cand["title"], cand["magazine"], distance)
+
+    @staticmethod
+    def _match(url: str | None, title: str | None, magazine: str | None, distance: int | None) -> dict | None:
+        if not url:
+            return None
+        return {"duplicate_of": url, "title": title or "", "magazine": magazine or "", "distance": distance}
+
+    def stats(self) -> dict:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT COUNT(*) AS total, COUNT(duplicate_of) AS duplicates FROM fingerprints")
+                .fetchone()
+            )
+        return {"articles": row["total"], "duplicates": row["duplicates"], "max_distance": self.max_distance}
+
+    def reset(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            cur = conn.execute("DELETE FROM fingerprints")
+            conn.commit()
+            return cur.rowcount
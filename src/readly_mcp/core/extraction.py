@@ -0,0 +1,409 @@
+import logging
+
+from playwright.async_api import BrowserContext, Page
+
+log = logging.getLogger(__name__)
+
+# Registered once per context with ``add_init_script`` so every document carries
+# ``window.__readlyExtract``; each extraction is then a single short evaluate that
+# returns every field (text, author, JSON-LD/meta metadata, page title and URL).
+EXTRACTION_SCRIPT = r"""(() => {
+    if (window.__readlyExtract) return;
+
+    const clean = (s) => (s || '').replace(/\s+/g, ' ').trim();
+
+    const metaContent = (...names) => {
+        for (const name of names) {
+            const el = document.querySelector(`meta[property="${name}"], meta[name="${name}"], meta[itemprop="${name}"]`);
+            if (el && el.content) return clean(el.content);
+        }
+        return '';
+    };
+
+    const personName = (value) => {
+        if (!value) return '';
+        if (typeof value === 'string') return clean(value);
+        if (Array.isArray(value)) return value.map(personName).filter(Boolean).join(', ');
+        return clean(value.name || '');
+    };
+
+    const jsonLd = () => {
+        const items = [];
+        for (const el of document.querySelectorAll('script[type="application/ld+json"]')) {
+            try {
+                const data = JSON.parse(el.textContent);
+                const queue = Array.isArray(data) ? data : [data];
+                while (queue.length) {
+                    const item = queue.shift();
+                    if (!item || typeof item !== 'object') continue;
+                    if (Array.isArray(item['@graph'])) queue.push(...item['@graph']);
+                    items.push(item);
+                }
+            } catch (e) { /* malformed JSON-LD is common; ignore it */ }
+        }
+        return items.find((i) => /Article|NewsArticle|BlogPosting|Report/.test([].concat(i['@type'] || []).join(' '))) || null;
+    };
+
+    const metadata = () => {
+        const ld = jsonLd();
+        const meta = {
+            headline: (ld && clean(ld.headline)) || metaContent('og:title', 'twitter:title'),
+            description: (ld && clean(ld.description)) || metaContent('description', 'og:description'),
+            author: (ld && personName(ld.author)) || metaContent('author', 'article:author'),
+            published: (ld && ld.datePublished) || metaContent('article:published_time', 'datePublished'),
+            section: (ld && clean(ld.articleSection)) || metaContent('article:section'),
+            publisher: (ld && personName(ld.publisher)) || metaContent('og:site_name'),
+            image: metaContent('og:image'),
+        };
+        if (ld && ld['@type']) meta.type = [].concat(ld['@type']).join(',');
+        return Object.fromEntries(Object.entries(meta).filter(([, v]) => v));
+    };
+
+    const POSITIVE = /article|body|content|entry|main|page|post|text|story|reader|chapter/i;
+    const NEGATIVE = /comment|footer|nav|menu|sidebar|share|social|promo|sponsor|banner|header|related|breadcrumb|cookie|modal|popup|subscribe|newsletter|(^|[\s_-])ads?([\s_-]|$)/i;
+    const SKIP_TAGS = new Set(['NAV', 'HEADER', 'FOOTER', 'ASIDE', 'FORM', 'BUTTON', 'SCRIPT', 'STYLE', 'NOSCRIPT', 'SVG', 'FIGCAPTION']);
+    const BLOCKS = 'p, h2, h3, h4, blockquote, pre, li';
+
+    const classWeight = (el) => {
+        const cls = typeof el.className === 'string' ? el.className : '';
+        const names = `${cls} ${el.id || ''}`;
+        return (POSITIVE.test(names) ? 25 : 0) - (NEGATIVE.test(names) ? 25 : 0);
+    };
+
+    const linkDensity = (el) => {
+        const total = el.textContent.length || 1;
+        let links = 0;
+        for (const a of el.querySelectorAll('a')) links += a.textContent.length;
+        return links / total;
+    };
+
+    const boilerplate = (el, root) => {
+        for (let node = el; node && node !== root; node = node.parentElement) {
+            if (SKIP_TAGS.has(node.tagName) || classWeight(node) < 0) return true;
+        }
+        return false;
+    };
+
+    // Readability-style scoring: every substantial paragraph scores its parent and
+    // (half) its grandparent; the best container, discounted by link density, is
+    // taken as the article body.
+    const scoreCandidates = () => {
+        const scores = new Map();
+        for (const p of document.querySelectorAll('p, pre, td, blockquote, div')) {
+            if (p.tagName === 'DIV' && p.querySelector('p, div, section, article, table, ul, ol')) continue;
+            const text = clean(p.textContent);
+            if (text.length < 25) continue;
+            const score = 1 + text.split(',').length + Math.min(3, Math.floor(text.length / 100));
+            const parent = p.parentElement;
+            const grand = parent && parent.parentElement;
+            for (const [node, share] of [[parent, 1], [grand, 0.5]]) {
+                if (!node || node === document.documentElement || node === document.body) continue;
+                if (!scores.has(node)) {
+                    scores.set(node, classWeight(node) + (/^(ARTICLE|MAIN|SECTION)$/.test(node.tagName) ? 5 : 0));
+                }
+                scores.set(node, scores.get(node) + score * share);
+            }
+        }
+        let best = null;
+        let bestScore = 0;
+        for (const [node, score] of scores) {
+            const adjusted = score * (1 - linkDensity(node));
+            scores.set(node, adjusted);
+            if (adjusted > bestScore) {
+                best = node;
+                bestScore = adjusted;
+            }
+        }
+        return {best, bestScore, scores};
+    };
+
+    const paragraphsOf = (roots) => {
+        const out = [];
+        for (const root of roots) {
+            for (const el of within(root, BLOCKS)) {
+                // Nested blocks (a <p> inside a <li> or <blockquote>) are covered by their container.
+                if (el !== root && el.parentElement.closest('li, blockquote') && root.contains(el.parentElement.closest('li, blockquote'))) continue;
+                if (boilerplate(el, root)) continue;
+                const text = clean(el.textContent);
+                if (!text || (text.length < 80 && linkDensity(el) > 0.5)) continue;
+                if (out[out.length - 1] !== text) out.push(text);
+            }
+        }
+        return out;
+    };
+
+    const linesOf = (el) => ((el && (el.innerText || el.textContent)) || '').split('\n').map(clean).filter(Boolean);
+
+    const mainContent = () => {
+        const {best, bestScore, scores} = scoreCandidates();
+        if (best && bestScore >= 20) {
+            // Siblings scoring close to the winner are usually the rest of the same article.
+            const threshold = Math.max(10, bestScore * 0.2);
+            const siblings = best.parentElement ? [...best.parentElement.children] : [best];
+            const roots = siblings.filter((el) => el === best || (scores.get(el) || 0) >= threshold);
+            const paragraphs = paragraphsOf(roots);
+            if (paragraphs.join(' ').length >= 200) return {paragraphs, method: 'scored'};
+        }
+        const selectors = [
+            '[class*="body"]', '[class*="content"]', '[class*="article"]',
+            'article', 'main', '.reader-content', '[class*="text"]',
+            '[class*="magazine"]', '[class*="reader"]'
+        ];
+        for (const sel of selectors) {
+            const el = document.querySelector(sel);
+            if (el && el.textContent.length > 50) return {paragraphs: linesOf(el), method: 'selector'};
+        }
+        return {paragraphs: linesOf(document.body), method: 'body'};
+    };
+
+    const article = () => {
+        const meta = metadata();
+        const byline = document.querySelector('[class*="author"], [class*="byline"], [class*="writer"], [rel="author"]');
+        const content = mainContent();
+        return {
+            title: document.title,
+            url: location.href,
+            author: byline ? byline.textContent.trim() : (meta.author || ''),
+            paragraphs: content.paragraphs,
+            content_method: content.method,
+            meta,
+        };
+    };
+
+    // Elements matching ``sel`` at or under ``root`` (a document or an added node).
+    const within = (root, sel) => {
+        const found = root.matches && root.matches(sel) ? [root] : [];
+        return root.querySelectorAll ? found.concat([...root.querySelectorAll(sel)]) : found;
+    };
+
+    const LISTING_SELECTORS = [
+        'a[href*="/read/"]',
+        'a[href*="article"]',
+        '[class*="track"] a',
+        '[class*="article"] a',
+        '[data-testid*="article"]',
+        'article a',
+        '.issue-page a'
+    ];
+
+    // Collectors return ``[{key, item}]``; the harvester dedupes on ``key``.
+    const listingItems = (root) => {
+        const out = [];
+        for (const sel of LISTING_SELECTORS) {
+            for (const el of within(root, sel)) {
+                const text = el.textContent.trim();
+                const href = el.href || '';
+                if (text.length > 10 && (href.includes('readly.co') || href.includes('readly.com'))) {
+                    out.push({key: href, item: {title: text.substring(0, 200), url: href}});
+                }
+            }
+        }
+        return out;
+    };
+
+    const LIBRARY_CANDIDATES =
+        'a, article, [class*="tile"], [class*="card"], [class*="cover"], ' +
+        '[class*="magazine"], [class*="issue"], [class*="publication"], ' +
+        '[class*="item"], figure, [class*="grid"] > div';
+
+    const libraryItems = (root) => {
+        const out = [];
+        for (const el of within(root, LIBRARY_CANDIDATES)) {
+            const link = el.tagName === 'A' ? el : el.querySelector('a');
+            const href = link ? (link.href || '') : '';
+            const img = el.querySelector('img');
+            const titleEl = el.querySelector(
+                '[class*="title"], [class*="name"], h1, h2, h3, h4, ' +
+                '[class*="heading"], figcaption, [class*="label"]'
+            );
+            const title = titleEl ? titleEl.textContent.trim() : (img ? img.alt || '' : el.textContent.trim());
+            if (title && title.length > 3) {
+                out.push({key: title, item: {
+                    title: title.substring(0, 200),
+                    url: href || window.location.href,
+                    cover_url: img ? (img.src || '') : '',
+                    type: href.includes('/magazine/') ? 'magazine'
+                        : href.includes('/issue/') ? 'issue'
+                        : href.includes('/read/') ? 'article' : 'unknown',
+                }});
+            }
+        }
+        return out;
+    };
+
+    const dedupe = (pairs) => {
+        const seen = new Map();
+        for (const {key, item} of pairs) if (key && !seen.has(key)) seen.set(key, item);
+        return [...seen.values()];
+    };
+
+    const listing = () => {
+        let results = dedupe(listingItems(document));
+        if (results.length === 0) {
+            results = [];
+            for (const h of document.querySelectorAll('h1,h2,h3,h4')) {
+                const text = h.textContent.trim();
+                if (text.length > 10) results.push({title: text, url: ''});
+            }
+        }
+        return {title: document.title, url: location.href, articles: results, meta: metadata()};
+    };
+
+    const library = () => {
+        const results = dedupe(libraryItems(document));
+        // Fallback: grab all <img> with meaningful alt text.
+        if (results.length < 3) {
+            const seen = new Set(results.map((r) => r.title));
+            for (const img of document.querySelectorAll('img[alt]')) {
+                const alt = img.alt.trim();
+                if (alt.length > 5 && !seen.has(alt)) {
+                    seen.add(alt);
+                    const parent = img.closest('a');
+                    results.push({title: alt.substring(0, 200), url: parent ? parent.href : '', cover_url: img.src || '', type: 'magazine'});
+                }
+            }
+        }
+        return {url: location.href, items: results};
+    };
+
+    // The element that actually scrolls the list: virtualized lists often live in an
+    // inner overflow container rather than the document.
+    const findScroller = () => {
+        let best = document.scrollingElement || document.documentElement;
+        let bestRange = best.scrollHeight - best.clientHeight;
+        for (const el of document.querySelectorAll('body *')) {
+            const range = el.scrollHeight - el.clientHeight;
+            if (range > bestRange + 100 && /(auto|scroll)/.test(getComputedStyle(el).overflowY)) {
+                best = el;
+                bestRange = range;
+            }
+        }
+        return best;
+    };
+
+    const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
+
+    // Scroll in steps while a MutationObserver records every matching node as it is
+    // added, so items survive DOM recycling. Stops when the bottom is reached and
+    // nothing new appears within ``bottomWaitMs``, or after ``maxMs``.
+    const harvest = async (opts = {}) => {
+        const o = Object.assign(
+            {kind: 'listing', stepRatio: 0.85, quietMs: 150, stepMaxMs: 1000, bottomWaitMs: 1200, maxMs: 20000},
+            opts,
+        );
+        const collect = o.kind === 'library' ? libraryItems : listingItems;
+        const items = new Map();
+        const add = (pairs) => {
+            for (const {key, item} of pairs) if (key && !items.has(key)) items.set(key, item);
+        };
+        let lastMutation = 0;
+        const observer = new MutationObserver((records) => {
+            lastMutation = performance.now();
+            for (const r of records) for (const n of r.addedNodes) if (n.nodeType === 1) add(collect(n));
+        });
+        const waitQuiet = async () => {
+            const t0 = performance.now();
+            do { await sleep(50); } while (performance.now() - lastMutation < o.quietMs && performance.now() - t0 < o.stepMaxMs);
+        };
+        const mutatedWithin = async (ms) => {
+            const t0 = performance.now();
+            while (performance.now() - t0 < ms) {
+                if (lastMutation > t0) return true;
+                await sleep(50);
+            }
+            return false;
+        };
+
+        const scroller = findScroller();
+        const started = performance.now();
+        let steps = 0;
+        let reason = 'complete';
+        observer.observe(document.documentElement, {childList: true, subtree: true});
+        try {
+            add(collect(document));
+            while (true) {
+                if (performance.now() - started > o.maxMs) { reason = 'timeout'; break; }
+                const before = items.size;
+                const top = scroller.scrollTop;
+                scroller.scrollBy(0, Math.max(200, scroller.clientHeight * o.stepRatio));
+                steps += 1;
+                await waitQuiet();
+                add(collect(document));
+                const atBottom = scroller.scrollTop === top ||
+                    scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 2;
+                if (items.size > before || !atBottom) continue;
+                // At the bottom with nothing new: give lazy loading a chance to append.
+                const deadline = performance.now() + o.bottomWaitMs;
+                while (items.size === before && performance.now() < deadline) {
+                    if (!(await mutatedWithin(deadline - performance.now()))) break;
+                    await waitQuiet();
+                    add(collect(document));
+                }
+                if (items.size === before) break;
+            }
+        } finally {
+            observer.disconnect();
+            scroller.scrollTo(0, 0);
+        }
+        return {items: [...items.values()], steps, reason, elapsed_ms: Math.round(performance.now() - started)};
+    };
+
+    Object.defineProperty(window, '__readlyExtract', {
+        value: Object.freeze({article, listing, library, harvest, metadata}),
+        configurable: false,
+        enumerable: false,
+    });
+})();"""
+
+_CALL_JS = "([kind, arg]) => window.__readlyExtract ? window.__readlyExtract[kind](arg) : null"
+
+# Used when the document predates the init script (e.g. the main tab of a freshly
+# launched persistent context); it installs the extractor, so later calls are short.
+_INSTALL_AND_CALL_JS = "([kind, arg]) => { " + EXTRACTION_SCRIPT + " return window.__readlyExtract[kind](arg); }"
+
+
+async def install_extraction_script(context: BrowserContext) -> None:
+    """Register the extraction script for every future document in ``context``."""
+    await context.add_init_script(EXTRACTION_SCRIPT)
+
+
+async def _run(page: Page, kind: str, arg: dict | None = None) -> dict:
+    result = await page.evaluate(_CALL_JS, [kind, arg])
+    if result is None:
+        log.debug("Extraction script missing on %s; installing inline", page.url)
+        result = await page.evaluate(_INSTALL_AND_CALL_JS, [kind, arg])
+    return result or {}
+
+
+async def extract_article(page: Page) -> dict:
+    """
+    Return ``title``, ``url``, ``author``, ``paragraphs``, ``content_method`` and
+    ``meta`` for the article on ``page``.
+
+    ``paragraphs`` holds only the main article body as picked by the in-page
+    content scorer (``content_method`` ``scored``), falling back to the first
+    matching content selector (``selector``) or the whole body (``body``).
+    """
+    return await _run(page, "article")
+
+
+async def extract_listing(page: Page) -> dict:
+    """Return ``title``, ``url``, raw ``articles`` and ``meta`` for the issue index on ``page``."""
+    return await _run(page, "listing")
+
+
+async def extract_library(page: Page) -> dict:
+    """Return ``items`` (title, url, cover_url, type) for the tiles currently in the library DOM."""
+    return await _run(page, "library")
+
+
+async def harvest(page: Page, kind: str = "listing", **options) -> dict:
+    """
+    Collect every item of a lazy or virtualized list (``kind`` ``listing`` or ``library``).
+
+    Scrolls in steps while a MutationObserver records items as they are added, and
+    stops once the end is reached and nothing new loads. ``options`` override the
+    step timing (``quietMs``, ``stepMaxMs``, ``bottomWaitMs``, ``maxMs``). Returns
+    ``items`` in first-seen order plus ``steps``, ``reason`` and ``elapsed_ms``.
+    """
+    return await _run(page, "harvest", {"kind": kind, **options})
@@ -0,0 +1,137 @@
+import logging
+import os
+import re
+import time
+
+from .storage import SQLiteStore
+
+log = logging.getLogger(__name__)
+
+ARTICLE_INDEX_ENABLED = os.environ.get("READLY_ARTICLE_INDEX", "1").strip().lower() not in ("0", "false", "no", "off")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+# bm25() takes one weight per column in schema order (url, magazine, issue, issue_url,
+# title, author, published, text, indexed_at); snippet() reads column 7 (text).
+_SEARCH_SQL = """
+    SELECT url, magazine, issue, issue_url, title, author, published,
+           bm25(articles_fts, 0, 2, 1, 0, 5, 1.5, 0, 1, 0) AS score,
+           snippet(articles_fts, 7, '[', ']', ' ... ', 24) AS snippet
+    FROM articles_fts WHERE articles_fts MATCH ?
+"""
+
+
+def magazine_from_issue(issue_title: str | None) -> str:
+    """Best-effort magazine name from an issue page title (``"New Scientist - 12 Oct 2026 | Readly"``)."""
+    title = (issue_title or "").split("|")[0]
+    return re.split(r"\s[-\u2013\u2014]\s", title, maxsplit=1)[0].strip()
+
+
+def _fts_query(query: str, match_all: bool = True) -> str:
+    # Quote every token so user input can never be parsed as FTS5 syntax.
+    tokens = [f'"{t}"' for t in _TOKEN_RE.findall(query.lower())]
+    return (" AND " if match_all else " OR ").join(tokens)
+
+
+class ArticleIndex(SQLiteStore):
+    """
+    Local SQLite FTS5 index of extracted articles.
+
+    Articles are added as they are extracted; ``search`` answers queries with
+    BM25 ranking and highlighted snippets without touching the browser.
+    """
+
+    schema = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+            url UNINDEXED,
+            magazine,
+            issue,
+            issue_url UNINDEXED,
+            title,
+            author,
+            published UNINDEXED,
+            text,
+            indexed_at UNINDEXED,
+            tokenize = 'porter unicode61'
+        );
+    """
+
+    def __init__(self, path: str | None = None):
+        super().__init__("index.sqlite3", path)
+
+    def add(self, article: dict, *, magazine: str = "", issue: str = "", issue_url: str = "") -> None:
+        """Insert or replace ``article`` (keyed by URL)."""
+        url = article.get("url")
+        if not url or not article.get("text"):
+            return
+        meta = article.get("meta") or {}
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM articles_fts WHERE url = ?", (url,))
+            conn.execute(
+                "INSERT INTO articles_fts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    magazine or meta.get("publisher") or "",
+                    issue,
+                    issue_url,
+                    article.get("title") or "",
+                    article.get("author") or "",
+                    meta.get("published") or "",
+                    article["text"],
+                    time.time(),
+                ),
+            )
+            conn.commit()
+
+    def search(self, query: str, limit: int = 10, magazine: str | None = None) -> dict:
+        """
+        Rank indexed articles against ``query``.
+
+        All query terms must match; if nothing does, any term may match.
+        """
+        started = time.monotonic()
+        hits: list[dict] = []
+        mode = "all"
+        for match_all in (True, False):
+            fts = _fts_query(query, match_all)
+            if not fts:
+                break
+            hits = self._query(fts, max(1, int(limit)), magazine)
+            mode = "all" if match_all else "any"
+            if hits:
+                break
+        return {
+            "query": query,
+            "match": mode,
+            "hits": hits,
+            "count": len(hits),
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 2),
+        }
+
+    def _query(self, fts: str, limit: int, magazine: str | None) -> list[dict]:
+        sql = _SEARCH_SQL
+        params: list = [fts]
+        if magazine:
+            sql += " AND magazine LIKE ?"
+            params.append(f"%{magazine}%")
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        # bm25() is lower-is-better; flip it so clients see higher-is-better scores.
+        return [{**dict(row), "score": round(-row["score"], 4)} for row in rows]
+
+    def remove(self, url: str | None = None) -> int:
+        with self._lock:
+            conn = self._connect()
+            if url:
+                cur = conn.execute("DELETE FROM articles_fts WHERE url = ?", (url,))
+            else:
+                cur = conn.execute("DELETE FROM articles_fts")
+            conn.commit()
+            return cur.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM articles_fts").fetchone()[0]
+        return {"entries": entries, "enabled": ARTICLE_INDEX_ENABLED, "path": self.path}
@@ -0,0 +1,134 @@
+import time
+
+from .storage import SQLiteStore
+
+# Article states in the snapshot. "pending" articles (never extracted, or whose
+# extraction errored) are offered again on the next poll; the others are done.
+STATE_PENDING = "pending"
+STATE_EXTRACTED = "extracted"
+STATE_SKIPPED = "skipped"
+
+
+class IngestSnapshot(SQLiteStore):
+    """
+    Per-magazine snapshot of the issues and article URLs/titles seen so far.
+
+    ``diff`` compares a fresh issue listing with the snapshot and returns only
+    the articles that still need extracting, so a poll costs what changed.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS ingest_issues (
+            magazine TEXT NOT NULL,
+            issue_url TEXT NOT NULL,
+            issue_title TEXT,
+            first_seen REAL NOT NULL,
+            last_seen REAL NOT NULL,
+            PRIMARY KEY (magazine, issue_url)
+        );
+        CREATE TABLE IF NOT EXISTS ingest_articles (
+            url TEXT PRIMARY KEY,
+            magazine TEXT NOT NULL,
+            issue_url TEXT NOT NULL,
+            title TEXT,
+            state TEXT NOT NULL,
+            first_seen REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS ingest_articles_issue ON ingest_articles (issue_url);
+    """
+
+    def __init__(self, path: str | None = None):
+        super().__init__("ingest.sqlite3", path)
+
+    def diff(self, magazine: str, listing: dict) -> dict:
+        """
+        Record ``listing`` for ``magazine`` and return what is new.
+
+        Returns ``new_issue`` (issue URL never seen for this magazine), ``pending``
+        (listed articles not yet extracted, in listing order) and ``known`` (count
+        of listed articles already done).
+        """
+        issue_url = listing.get("page_url") or ""
+        articles = [a for a in listing.get("articles") or [] if a.get("url")]
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            new_issue = (
+                conn.execute(
+                    "SELECT 1 FROM ingest_issues WHERE magazine = ? AND issue_url = ?", (magazine, issue_url)
+                ).fetchone()
+                is None
+            )
+            conn.execute(
+                """INSERT INTO ingest_issues VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (magazine, issue_url) DO UPDATE SET last_seen = excluded.last_seen,
+                   issue_title = excluded.issue_title""",
+                (magazine, issue_url, listing.get("issue_title") or "", now, now),
+            )
+            states = self._states(conn, [a["url"] for a in articles])
+            conn.executemany(
+                "INSERT OR IGNORE INTO ingest_articles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (a["url"], magazine, issue_url, a.get("title") or "", STATE_PENDING, now, now)
+                    for a in articles
+                    if a["url"] not in states
+                ],
+            )
+            conn.commit()
+        pending = [a for a in articles if states.get(a["url"], STATE_PENDING) == STATE_PENDING]
+        return {"new_issue": new_issue, "pending": pending, "known": len(articles) - len(pending)}
+
+    @staticmethod
+    def _states(conn, urls: list[str]) -> dict[str, str]:
+        states: dict[str, str] = {}
+        for i in range(0, len(urls), 500):
+            chunk = urls[i : i + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(f"SELECT url, state FROM ingest_articles WHERE url IN ({marks})", chunk)  # noqa: S608
+            states.update({row["url"]: row["state"] for row in rows})
+        return states
+
+    def mark(self, urls: list[str], state: str) -> None:
+        if not urls:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "UPDATE ingest_articles SET state = ?, updated_at = ? WHERE url = ?", [(state, now, u) for u in urls]
+            )
+            conn.commit()
+
+    def snapshot(self, magazine: str | None = None) -> dict:
+        """Issues per magazine with article counts by state."""
+        sql = """
+            SELECT i.magazine, i.issue_url, i.issue_title, i.first_seen, i.last_seen,
+                   COUNT(a.url) AS articles,
+                   COALESCE(SUM(a.state = 'extracted'), 0) AS extracted,
+                   COALESCE(SUM(a.state = 'pending'), 0) AS pending
+            FROM ingest_issues i LEFT JOIN ingest_articles a ON a.issue_url = i.issue_url
+        """
+        params: tuple = ()
+        if magazine:
+            sql += " WHERE i.magazine = ?"
+            params = (magazine,)
+        sql += " GROUP BY i.magazine, i.issue_url ORDER BY i.magazine, i.first_seen DESC"
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        magazines: dict[str, list[dict]] = {}
+        for row in rows:
+            magazines.setdefault(row["magazine"], []).append({k: row[k] for k in row.keys() if k != "magazine"})
+        return {"magazines": magazines}
+
+    def reset(self, magazine: str | None = None) -> int:
+        with self._lock:
+            conn = self._connect()
+            if magazine:
+                cur = conn.execute("DELETE FROM ingest_issues WHERE magazine = ?", (magazine,))
+                conn.execute("DELETE FROM ingest_articles WHERE magazine = ?", (magazine,))
+            else:
+                cur = conn.execute("DELETE FROM ingest_issues")
+                conn.execute("DELETE FROM ingest_articles")
+            conn.commit()
+            return cur.rowcount
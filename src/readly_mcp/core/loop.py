@@ -0,0 +1,106 @@
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import AsyncIterator, Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class BrowserLoop:
+    """
+    Event loop, on its own daemon thread, that owns the browser.
+
+    stdio and the HTTP bridge serve requests on separate event loops, but the
+    Playwright objects, the scheduler's gates, the watchdog and the watch-list
+    poller all belong to the loop they were created on. Every browser operation
+    is therefore handed to this loop, whichever transport it came from.
+    """
+
+    def __init__(self, name: str = "readly-browser"):
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The owner loop, started on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def _serve() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_serve, name=self.name, daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def is_current(self) -> bool:
+        """True when called from a coroutine already running on the owner loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule ``coro`` on the owner loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_soon(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Run a plain callback on the owner loop from any thread."""
+        self.loop.call_soon_threadsafe(fn, *args)
+
+    async def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Await ``coro`` on the owner loop; cancelling the caller cancels the job."""
+        if self.is_current():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    async def stream(self, agen: AsyncIterator[T]) -> AsyncIterator[T]:
+        """Iterate an async generator that runs on the owner loop."""
+        if self.is_current():
+            async for item in agen:
+                yield item
+            return
+        caller = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def _put(item: Any) -> None:
+            if not caller.is_closed():
+                caller.call_soon_threadsafe(queue.put_nowait, item)
+
+        async def _pump() -> None:
+            try:
+                async for item in agen:
+                    _put((item, None))
+            except Exception as exc:
+                _put((_DONE, exc))
+            else:
+                _put((_DONE, None))
+            finally:
+                await agen.aclose()
+
+        pump = self.submit(_pump())
+        try:
+            while True:
+                item, exc = await queue.get()
+                if item is _DONE:
+                    if exc is not None:
+                        raise exc
+                    return
+                yield item
+        finally:
+            pump.cancel()
+
+
+# Global instance for the application
+browser_loop = BrowserLoop()
@@ -0,0 +1,73 @@
+import io
+import os
+from collections import deque
+
+from PIL import Image
+
+# dHash side length: a 16x16 difference grid gives a 256-bit hash, fine enough to
+# tell two text-heavy magazine pages apart while ignoring animation and cursor noise.
+PAGE_HASH_SIZE = int(os.environ.get("READLY_PAGE_HASH_SIZE", "16"))
+# Pages within this many bits are the same page.
+PAGE_HASH_DISTANCE = int(os.environ.get("READLY_PAGE_HASH_DISTANCE", "8"))
+# How many recent pages are remembered for loop detection, and how many repeats
+# of earlier pages in a row count as a loop.
+PAGE_LOOP_WINDOW = int(os.environ.get("READLY_PAGE_LOOP_WINDOW", "12"))
+PAGE_LOOP_REPEATS = int(os.environ.get("READLY_PAGE_LOOP_REPEATS", "2"))
+
+PAGE_NEW = "new"
+PAGE_SAME = "same"
+PAGE_LOOP = "loop"
+
+
+def dhash(image: bytes | Image.Image, size: int = PAGE_HASH_SIZE) -> int:
+    """Difference hash of an image (encoded bytes or a PIL image): one bit per horizontal gradient."""
+    img = Image.open(io.BytesIO(image)) if isinstance(image, bytes) else image
+    img.draft("L", (size * 4, size * 4))
+    pixels = img.convert("L").resize((size + 1, size), Image.Resampling.BILINEAR).tobytes()
+    value = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            value = value << 1 | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class PageSequence:
+    """
+    Classifies each captured page of a scrape against the ones before it.
+
+    ``observe`` returns ``same`` when the page matches the previous one (the
+    reader did not turn: end of issue), ``loop`` once ``repeats`` pages in a row
+    match pages seen earlier in the last ``window`` (the reader is cycling
+    through spreads it already showed), and ``new`` otherwise.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = PAGE_HASH_DISTANCE,
+        window: int = PAGE_LOOP_WINDOW,
+        repeats: int = PAGE_LOOP_REPEATS,
+    ):
+        self.max_distance = max_distance
+        self.repeats = max(1, repeats)
+        self.recent: deque[tuple[int, int]] = deque(maxlen=max(2, window))
+        self._repeat_run = 0
+
+    def observe(self, page_num: int, page_hash: int) -> tuple[str, int | None]:
+        """Classify ``page_hash``; returns the verdict and the page number it matched."""
+        if self.recent and hamming(page_hash, self.recent[-1][1]) <= self.max_distance:
+            return PAGE_SAME, self.recent[-1][0]
+        earlier = next(
+            (num for num, h in reversed(self.recent) if hamming(page_hash, h) <= self.max_distance),
+            None,
+        )
+        self.recent.append((page_num, page_hash))
+        if earlier is None:
+            self._repeat_run = 0
+            return PAGE_NEW, None
+        self._repeat_run += 1
+        return (PAGE_LOOP if self._repeat_run >= self.repeats else PAGE_NEW), earlier
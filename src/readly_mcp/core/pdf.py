@@ -1,41 +1,185 @@
+import glob
+import io
+import logging
+import multiprocessing
 import os
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 
 from fpdf import FPDF
 from PIL import Image
+from pypdf import PdfWriter
 
+log = logging.getLogger(__name__)
 
-def create_pdf(image_paths: list[str], output_path: str):
+# Pages per on-disk part file while building a PDF incrementally; bounds memory to one chunk.
+PDF_CHUNK_PAGES = int(os.environ.get("READLY_PDF_CHUNK_PAGES", "20"))
+
+# Default page image encoding (see PageEncoding).
+PDF_IMAGE_FORMAT = os.environ.get("READLY_PDF_IMAGE_FORMAT", "png").strip().lower()
+PDF_IMAGE_QUALITY = int(os.environ.get("READLY_PDF_IMAGE_QUALITY", "80"))
+PDF_GRAYSCALE = os.environ.get("READLY_PDF_GRAYSCALE", "0").strip().lower() in ("1", "true", "yes", "on")
+PDF_DPI = int(os.environ.get("READLY_PDF_DPI", "0"))
+# Processes that build IncrementalPdf part files in parallel; 1 (the default) builds them
+# in-process. Raise it only where scripts/bench_pdf.py shows a gain on the host.
+PDF_WORKERS = int(os.environ.get("READLY_PDF_WORKERS", "1"))
+PDF_ENCODE_WORKERS = int(os.environ.get("READLY_PDF_ENCODE_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Screenshots are taken at one device pixel per CSS pixel, i.e. 96 DPI.
+CAPTURE_DPI = 96
+
+_encode_pool: ThreadPoolExecutor | None = None
+_part_pool: ProcessPoolExecutor | None = None
+_part_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PageEncoding:
     """
-    Stitches a list of image paths into a single PDF.
+    How page images are stored in the PDF.
+
+    ``png`` keeps captures lossless (and, with no other option set, embeds them
+    untouched); ``jpeg`` re-encodes at ``quality`` and is embedded as-is by the
+    PDF writer. ``grayscale`` suits text-heavy magazines; ``dpi`` below the
+    capture resolution downscales the image while the page keeps its size.
     """
-    if not image_paths:
-        print("No images to compile.")
-        return
 
+    format: str = PDF_IMAGE_FORMAT
+    quality: int = PDF_IMAGE_QUALITY
+    grayscale: bool = PDF_GRAYSCALE
+    dpi: int = PDF_DPI
+
+    def __post_init__(self):
+        if self.format == "webp":
+            # PDF has no WebP filter: it would be decoded and stored as Flate, larger than JPEG.
+            raise ValueError("WebP images cannot be embedded in PDF; use image_format='jpeg'")
+        if self.format not in ("png", "jpeg"):
+            raise ValueError(f"Unsupported image format {self.format!r}; use 'png' or 'jpeg'")
+        if not 1 <= self.quality <= 95:
+            raise ValueError("quality must be between 1 and 95")
+        if self.dpi < 0:
+            raise ValueError("dpi must be positive (0 keeps the capture resolution)")
+
+    @property
+    def scale(self) -> float:
+        return min(1.0, self.dpi / CAPTURE_DPI) if self.dpi else 1.0
+
+    @property
+    def passthrough(self) -> bool:
+        return self.format == "png" and not self.grayscale and self.scale == 1.0
+
+
+def encode_page(page: str | bytes, encoding: PageEncoding) -> tuple[str | bytes, tuple[int, int]]:
+    """Re-encode one page image per ``encoding``; returns the image and the page size (capture pixels)."""
+    with _open_page(page) as img:
+        size = img.size
+        if encoding.passthrough:
+            return page, size
+        out = img.convert("L") if encoding.grayscale else img.convert("RGB")
+        if encoding.scale < 1.0:
+            target = (max(1, round(size[0] * encoding.scale)), max(1, round(size[1] * encoding.scale)))
+            out = out.resize(target, Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        if encoding.format == "jpeg":
+            out.save(buf, "JPEG", quality=encoding.quality, optimize=True)
+        else:
+            out.save(buf, "PNG")
+        return buf.getvalue(), size
+
+
+def encode_pool() -> ThreadPoolExecutor:
+    """Shared worker pool for page encoding (Pillow releases the GIL while coding images)."""
+    global _encode_pool
+    if _encode_pool is None:
+        _encode_pool = ThreadPoolExecutor(max_workers=max(1, PDF_ENCODE_WORKERS), thread_name_prefix="pdf-encode")
+    return _encode_pool
+
+
+def part_pool() -> ProcessPoolExecutor:
+    """Shared process pool for building part files, started once and reused by every build."""
+    global _part_pool
+    with _part_pool_lock:
+        if _part_pool is None:
+            # spawn, not fork: the server process runs event loops and browser threads.
+            _part_pool = ProcessPoolExecutor(
+                max_workers=max(1, PDF_WORKERS), mp_context=multiprocessing.get_context("spawn")
+            )
+        return _part_pool
+
+
+def _open_page(page: str | bytes) -> Image.Image:
+    return Image.open(io.BytesIO(page) if isinstance(page, bytes) else page)
+
+
+def _new_pdf() -> FPDF:
     # Use 'point' unit for compatibility with pixel dimensions if needed,
     # though standard FPDF flow usually works fine.
     pdf = FPDF(unit="pt")
 
     # Disable auto page break to handle full-page images manually
     pdf.set_auto_page_break(False)
+    return pdf
+
+
+def _add_image_page(pdf: FPDF, page: str | bytes, size: tuple[int, int] | None = None) -> None:
+    # Page size defaults to the image size (only the header is read for it).
+    if size is None:
+        with _open_page(page) as img:
+            size = img.size
+    width, height = size
+
+    # Add page matching image size
+    pdf.add_page(format=(width, height))
+
+    # Place image at 0,0; given the encoded bytes, fpdf decodes PNGs once and copies JPEGs as-is
+    pdf.image(io.BytesIO(page) if isinstance(page, bytes) else page, x=0, y=0, w=width, h=height)
+
+
+def _write_part(pages: list[tuple[str | bytes, tuple[int, int] | None]], path: str) -> None:
+    """Part pool entry point: write ``(image, size)`` pages as one part file."""
+    pdf = _new_pdf()
+    for page, size in pages:
+        _add_image_page(pdf, page, size)
+    pdf.output(f"{path}.tmp")
+    os.replace(f"{path}.tmp", path)
+
+
+def create_pdf(image_paths: list[str | bytes], output_path: str, encoding: PageEncoding | None = None):
+    """
+    Stitches a list of images into a single PDF.
+
+    Pages are image paths or encoded image bytes (e.g. PNG screenshots kept in
+    memory). With ``encoding``, pages are re-encoded on the encode pool while
+    earlier ones are being added to the PDF.
+    """
+    if not image_paths:
+        print("No images to compile.")
+        return
 
+    pdf = _new_pdf()
+
+    pages = []
     for img_path in image_paths:
-        if not os.path.exists(img_path):
+        if isinstance(img_path, str) and not os.path.exists(img_path):
             print(f"Warning: Image not found {img_path}")
             continue
+        pages.append(img_path)
+    encoded = [
+        encode_pool().submit(encode_page, page, encoding) if encoding and not encoding.passthrough else None
+        for page in pages
+    ]
 
+    for num, (img_path, future) in enumerate(zip(pages, encoded, strict=True), 1):
+        label = img_path if isinstance(img_path, str) else f"page {num}"
         try:
-            # Open image to get dimensions
-            with Image.open(img_path) as img:
-                width, height = img.size
-
-                # Add page matching image size
-                pdf.add_page(format=(width, height))
-
-                # Place image at 0,0
-                pdf.image(img_path, x=0, y=0, w=width, h=height)
+            if future is None:
+                _add_image_page(pdf, img_path)
+            else:
+                _add_image_page(pdf, *future.result())
         except Exception as e:
-            print(f"Failed to process image {img_path}: {e}")
+            print(f"Failed to process image {label}: {e}")
 
     try:
         # Ensure output directory exists
@@ -45,3 +189,147 @@ def create_pdf(image_paths: list[str], output_path: str):
         print(f"Successfully created PDF: {output_path}")
     except Exception as e:
         print(f"Failed to save PDF: {e}")
+
+
+def _part_files(parts_dir: str) -> list[str]:
+    return sorted(glob.glob(os.path.join(parts_dir, "part_*.pdf")))
+
+
+def merge_pdfs(paths: list[str], output_path: str) -> None:
+    """Concatenate PDFs into ``output_path`` (written to a temp file, then swapped in)."""
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    if len(paths) == 1:
+        shutil.copyfile(paths[0], tmp_path)
+    else:
+        writer = PdfWriter()
+        for path in paths:
+            writer.append(path)
+        with open(tmp_path, "wb") as f:
+            writer.write(f)
+        writer.close()
+    os.replace(tmp_path, output_path)
+
+
+def finalize_parts(parts_dir: str, output_path: str) -> int:
+    """
+    Merge the part files left in ``parts_dir`` into ``output_path`` and remove them.
+
+    Works on the parts of any interrupted ``IncrementalPdf`` build. Returns the
+    number of parts merged (0 if there were none).
+    """
+    parts = _part_files(parts_dir)
+    if parts:
+        merge_pdfs(parts, output_path)
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    return len(parts)
+
+
+class IncrementalPdf:
+    """
+    Builds a PDF page by page while a scrape runs.
+
+    Pages are embedded into an in-memory chunk that is written out as a part
+    file (``<output>.parts/part_NNNN.pdf``) every ``chunk_pages`` pages, so
+    memory stays bounded by one chunk and everything up to the last part is
+    already on disk. ``finalize`` (or ``checkpoint``) merges the parts into
+    ``output_path``; since pages were encoded as they arrived, that is a cheap
+    concatenation at any moment, including after a stop or an error. Parts
+    left behind by a crashed build are recovered into ``<output>_recovered.pdf``
+    when a new build for the same output starts.
+
+    With ``workers`` above 1 (default ``READLY_PDF_WORKERS``) a full chunk is
+    handed to the shared part pool instead, so parts are built on other cores,
+    off the server process, while the scrape goes on; at most ``workers``
+    chunks are in flight at once. A part that fails to build is left out of the
+    merge: its pages are taken off ``pages`` and counted in ``lost_pages``.
+    """
+
+    def __init__(self, output_path: str, chunk_pages: int = PDF_CHUNK_PAGES, workers: int | None = None):
+        self.output_path = output_path
+        self.parts_dir = f"{output_path}.parts"
+        self.chunk_pages = max(1, chunk_pages)
+        self.workers = max(1, PDF_WORKERS if workers is None else workers)
+        self.pages = 0
+        self.lost_pages = 0
+        self._pdf: FPDF | None = None
+        self._pending: list[tuple[str | bytes, tuple[int, int] | None]] = []
+        self._building: deque[tuple[Future, int]] = deque()
+        self._chunk_pages = 0
+        self._parts = 0
+        # add_page runs in a worker thread; checkpoint may be called from another.
+        self._lock = threading.Lock()
+        self._recover()
+        os.makedirs(self.parts_dir, exist_ok=True)
+
+    def _recover(self) -> None:
+        if not _part_files(self.parts_dir):
+            return
+        root, ext = os.path.splitext(self.output_path)
+        recovered = f"{root}_recovered{ext}"
+        merged = finalize_parts(self.parts_dir, recovered)
+        log.warning("Recovered %d part(s) of an interrupted PDF build into %s", merged, recovered)
+
+    def add_page(self, page: str | bytes, size: tuple[int, int] | None = None) -> None:
+        """
+        Embed one page image (path or encoded bytes), on a page of ``size`` (default
+        the image size); flushes a part when the chunk is full.
+        """
+        with self._lock:
+            if self.workers > 1:
+                self._pending.append((page, size))
+            else:
+                if self._pdf is None:
+                    self._pdf = _new_pdf()
+                _add_image_page(self._pdf, page, size)
+            self.pages += 1
+            self._chunk_pages += 1
+            if self._chunk_pages >= self.chunk_pages:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._chunk_pages:
+            return
+        self._parts += 1
+        path = os.path.join(self.parts_dir, f"part_{self._parts:04d}.pdf")
+        if self.workers > 1:
+            while len(self._building) >= self.workers:
+                self._collect(self._building.popleft())
+            self._building.append((part_pool().submit(_write_part, self._pending, path), len(self._pending)))
+            self._pending = []
+        else:
+            self._pdf.output(f"{path}.tmp")
+            os.replace(f"{path}.tmp", path)
+            self._pdf = None
+        self._chunk_pages = 0
+
+    def _collect(self, building: tuple[Future, int]) -> None:
+        future, pages = building
+        try:
+            future.result()
+        except Exception as exc:
+            self.pages -= pages
+            self.lost_pages += pages
+            log.error("Failed to build a PDF part (%d pages lost): %s", pages, exc)
+
+    def _drain(self) -> None:
+        self._flush()
+        while self._building:
+            self._collect(self._building.popleft())
+
+    def checkpoint(self) -> str | None:
+        """Write everything added so far to ``output_path`` and keep building."""
+        with self._lock:
+            self._drain()
+            parts = _part_files(self.parts_dir)
+            if not parts:
+                return None
+            merge_pdfs(parts, self.output_path)
+            return self.output_path
+
+    def finalize(self) -> str | None:
+        """Write the finished PDF to ``output_path`` and remove the part files."""
+        with self._lock:
+            self._drain()
+            merged = finalize_parts(self.parts_dir, self.output_path)
+            return self.output_path if merged else None
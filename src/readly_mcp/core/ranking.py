@@ -0,0 +1,178 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    """
+    a about above after again against all also am an and any are as at be because been before being below
+    between both but by can could did do does doing down during each few for from further had has have having
+    he her here hers herself him himself his how i if in into is it its itself just me more most my myself no
+    nor not now of off on once only or other our ours ourselves out over own same she should so some such than
+    that the their theirs them themselves then there these they this those through to too under until up very
+    was we were what when where which while who whom why will with would you your yours yourself yourselves
+    new via using use based towards toward paper study approach method methods results analysis
+    """.split()
+)
+
+# Checked in order, first match wins; (suffix, replacement, minimum stem length left behind).
+_SUFFIXES = (
+    ("ational", "ate", 2),
+    ("ization", "ize", 2),
+    ("fulness", "ful", 2),
+    ("iveness", "ive", 2),
+    ("ousness", "ous", 2),
+    ("ements", "", 3),
+    ("ement", "", 3),
+    ("ments", "", 3),
+    ("ities", "", 3),
+    ("ingly", "", 3),
+    ("ches", "ch", 1),
+    ("shes", "sh", 1),
+    ("ment", "", 3),
+    ("ness", "", 3),
+    ("ings", "", 3),
+    ("sses", "ss", 1),
+    ("ity", "", 3),
+    ("ies", "y", 2),
+    ("ing", "", 3),
+    ("ers", "", 3),
+    ("ed", "", 3),
+    ("er", "", 3),
+    ("xes", "x", 1),
+    ("s", "", 3),
+)
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """Light suffix-stripping stemmer (``computing``/``computers``/``computed`` -> ``comput``)."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, repl, min_stem in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= min_stem:
+            if suffix == "s" and word.endswith(("ss", "us", "is")):
+                break
+            word = word[: len(word) - len(suffix)] + repl
+            break
+    # Drop a final "e" so "milestone(s)" and "secure"/"security" meet.
+    return word[:-1] if len(word) > 4 and word.endswith("e") else word
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase, split on non-alphanumerics, drop stopwords and single characters, stem."""
+    return [stem(w) for w in _WORD_RE.findall((text or "").lower()) if len(w) > 1 and w not in STOPWORDS]
+
+
+@dataclass
+class _Field:
+    """Tokenised field of the documents in one ranking batch, with an inverted index."""
+
+    weight: float
+    lengths: list[int] = field(default_factory=list)
+    postings: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+
+    def add(self, doc_id: int, tokens: list[str]) -> None:
+        self.lengths.append(len(tokens))
+        for term, tf in Counter(tokens).items():
+            self.postings.setdefault(term, []).append((doc_id, tf))
+
+
+class BM25Ranker:
+    """
+    BM25 over article titles (weighted) and, when known, article text.
+
+    Document frequencies accumulate over every distinct document the ranker has
+    seen, so IDF reflects the magazine content observed so far rather than one
+    listing. ``rank`` scores a batch of queries against a batch of documents by
+    walking each query term's postings once.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, title_weight: float = 2.5, text_weight: float = 1.0):
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.text_weight = text_weight
+        self.doc_freq: Counter[str] = Counter()
+        self.n_docs = 0
+        self._title_len = 0
+        self._text_len = 0
+        self._text_docs = 0
+        self._seen: set[str] = set()
+
+    def observe(self, key: str, title_tokens: list[str], text_tokens: list[str]) -> None:
+        """Add one document to the corpus statistics (once per ``key``)."""
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.n_docs += 1
+        self._title_len += len(title_tokens)
+        if text_tokens:
+            self._text_len += len(text_tokens)
+            self._text_docs += 1
+        self.doc_freq.update(set(title_tokens) | set(text_tokens))
+
+    def idf(self, term: str) -> float:
+        df = self.doc_freq.get(term, 0)
+        return math.log(1 + (self.n_docs - df + 0.5) / (df + 0.5))
+
+    def _field_scores(self, fld: _Field, term: str, idf: float, avg_len: float, scores: dict[int, float]) -> None:
+        k1, b = self.k1, self.b
+        for doc_id, tf in fld.postings.get(term, ()):
+            norm = k1 * (1 - b + b * fld.lengths[doc_id] / avg_len)
+            scores[doc_id] = scores.get(doc_id, 0.0) + fld.weight * idf * tf * (k1 + 1) / (tf + norm)
+
+    def rank(
+        self,
+        queries: list[str],
+        documents: list[dict],
+        *,
+        min_terms: int = 2,
+        top_k: int | None = None,
+    ) -> list[list[dict]]:
+        """
+        Score every query against every document.
+
+        ``documents`` are dicts with ``title`` and optional ``text`` (plus ``url``
+        used as the corpus key). Returns, per query, ``{"doc", "score",
+        "matched_terms"}`` entries sorted by score; a document must contain at
+        least ``min_terms`` distinct query terms (or all of them, if fewer).
+        """
+        titles = _Field(self.title_weight)
+        texts = _Field(self.text_weight)
+        for doc_id, doc in enumerate(documents):
+            title_tokens = tokenize(doc.get("title") or "")
+            text_tokens = tokenize(doc.get("text") or "")
+            titles.add(doc_id, title_tokens)
+            texts.add(doc_id, text_tokens)
+            self.observe(doc.get("url") or doc.get("title") or str(doc_id), title_tokens, text_tokens)
+
+        avg_title = max(1.0, self._title_len / max(1, self.n_docs))
+        avg_text = max(1.0, self._text_len / max(1, self._text_docs))
+        ranked: list[list[dict]] = []
+        for query in queries:
+            terms = list(dict.fromkeys(tokenize(query)))
+            scores: dict[int, float] = {}
+            matched: dict[int, set[str]] = {}
+            for term in terms:
+                idf = self.idf(term)
+                self._field_scores(titles, term, idf, avg_title, scores)
+                self._field_scores(texts, term, idf, avg_text, scores)
+                for fld in (titles, texts):
+                    for doc_id, _ in fld.postings.get(term, ()):
+                        matched.setdefault(doc_id, set()).add(term)
+            need = min(min_terms, len(terms))
+            hits = [
+                {"doc": documents[d], "score": round(score, 4), "matched_terms": sorted(matched[d])}
+                for d, score in scores.items()
+                if need and len(matched[d]) >= need
+            ]
+            hits.sort(key=lambda h: h["score"], reverse=True)
+            ranked.append(hits[:top_k] if top_k else hits)
+        return ranked
+
+    def stats(self) -> dict:
+        return {"documents": self.n_docs, "terms": len(self.doc_freq)}
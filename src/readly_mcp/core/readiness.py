@@ -0,0 +1,197 @@
+import logging
+import time
+from dataclasses import dataclass
+
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WaitProfile:
+    """
+    Readiness signals for one kind of page operation.
+
+    Signals are checked in order (selector, reader page change, network idle,
+    images decoded, DOM settle) and each one returns as soon as it is satisfied;
+    ``timeout_ms`` caps the whole wait. ``page_change`` waits for the reader's
+    visible page (see ``reader_state``) to differ from the state captured before
+    the action; ``images_loaded`` waits until every visible image has decoded.
+    """
+
+    name: str
+    timeout_ms: int = 8000
+    selector: str | None = None
+    network_idle_ms: int = 0
+    dom_quiet_ms: int = 0
+    page_change: bool = False
+    images_loaded: bool = False
+
+
+WAIT_PROFILES: dict[str, WaitProfile] = {
+    "navigation": WaitProfile("navigation", timeout_ms=8000, dom_quiet_ms=300),
+    "issue": WaitProfile(
+        "issue",
+        timeout_ms=8000,
+        selector='a[href*="/read/"], [class*="article"] a, article a',
+        dom_quiet_ms=400,
+    ),
+    "article": WaitProfile(
+        "article",
+        timeout_ms=10000,
+        selector='article, main, .reader-content, [class*="article"], [class*="reader"]',
+        dom_quiet_ms=400,
+    ),
+    "search": WaitProfile(
+        "search",
+        timeout_ms=8000,
+        selector='a[href*="/magazine/"], a[href*="/catalogue/"]',
+        dom_quiet_ms=300,
+    ),
+    "library": WaitProfile(
+        "library",
+        timeout_ms=10000,
+        selector='img[alt], [class*="cover"], [class*="tile"]',
+        network_idle_ms=2000,
+        dom_quiet_ms=400,
+    ),
+    "scroll": WaitProfile("scroll", timeout_ms=1500, dom_quiet_ms=250),
+    "page_turn": WaitProfile("page_turn", timeout_ms=5000, page_change=True, network_idle_ms=2000, dom_quiet_ms=300),
+    "screenshot": WaitProfile("screenshot", timeout_ms=3000, images_loaded=True, dom_quiet_ms=200),
+}
+
+# Large elements at least partly in the viewport: the reader's page images or canvases.
+_VISIBLE_JS = """const visible = (el) => {
+    const r = el.getBoundingClientRect();
+    return r.width > 200 && r.height > 200 && r.bottom > 0 && r.right > 0
+        && r.top < innerHeight && r.left < innerWidth;
+};"""
+
+# Identifies the page the reader shows: URL, page counter, and the sources
+# (or sizes and page attributes, for canvases) of the visible page elements.
+_READER_STATE_JS = f"""() => {{
+    {_VISIBLE_JS}
+    const counter = document.querySelector(
+        '[class*="page-number" i], [class*="pagenumber" i], [class*="page-count" i], [aria-label*="page" i]'
+    );
+    const images = [...document.images].filter(visible).map((img) => img.currentSrc || img.src);
+    const canvases = [...document.querySelectorAll("canvas")].filter(visible)
+        .map((c) => `${{c.width}}x${{c.height}}:${{c.dataset.page || c.getAttribute("aria-label") || ""}}`);
+    return [location.href, counter ? counter.textContent.trim() : "", ...images, ...canvases].join("|");
+}}"""
+
+_PAGE_CHANGED_JS = f"(before) => ({_READER_STATE_JS})() !== before"
+
+_IMAGES_LOADED_JS = f"""() => {{
+    {_VISIBLE_JS}
+    return [...document.images].filter(visible).every((img) => img.complete && img.naturalWidth > 0);
+}}"""
+
+# Resolves once no DOM mutation has been seen for ``quietMs`` (true), or after
+# ``timeoutMs`` with the DOM still changing (false).
+_DOM_SETTLE_JS = """([quietMs, timeoutMs]) => new Promise((resolve) => {
+    const root = document.documentElement || document;
+    let quiet = null;
+    let hard = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(quiet);
+        quiet = setTimeout(() => done(true), quietMs);
+    });
+    const done = (settled) => {
+        observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(hard);
+        resolve(settled);
+    };
+    observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+    quiet = setTimeout(() => done(true), quietMs);
+    hard = setTimeout(() => done(false), timeoutMs);
+})"""
+
+
+def get_wait_profile(profile: str | WaitProfile) -> WaitProfile:
+    if isinstance(profile, WaitProfile):
+        return profile
+    try:
+        return WAIT_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown wait profile: {profile}") from None
+
+
+async def reader_state(page: Page) -> str | None:
+    """Signature of the page the reader currently shows (``None`` if it cannot be read)."""
+    try:
+        return await page.evaluate(_READER_STATE_JS)
+    except Exception as exc:
+        log.debug("Reader state unavailable: %s", exc)
+        return None
+
+
+async def wait_ready(page: Page, profile: str | WaitProfile = "navigation", before: str | None = None) -> dict:
+    """
+    Wait until ``page`` is ready for the operation described by ``profile``.
+
+    ``before`` is the ``reader_state`` taken before the action, for profiles
+    that wait for a page change. Never raises on timeout: readiness is best
+    effort and the caller's own extraction logic decides whether the page
+    content is usable.
+    """
+    prof = get_wait_profile(profile)
+    started = time.monotonic()
+    deadline = started + prof.timeout_ms / 1000
+    signals: dict = {}
+
+    def remaining_ms() -> int:
+        return max(1, int((deadline - time.monotonic()) * 1000))
+
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=remaining_ms())
+    except PlaywrightTimeoutError:
+        signals["domcontentloaded"] = False
+
+    if prof.selector:
+        try:
+            await page.wait_for_selector(prof.selector, state="attached", timeout=remaining_ms())
+            signals["selector"] = True
+        except PlaywrightTimeoutError:
+            signals["selector"] = False
+
+    if prof.page_change and before is not None:
+        try:
+            await page.wait_for_function(_PAGE_CHANGED_JS, arg=before, timeout=remaining_ms(), polling=100)
+            signals["page_changed"] = True
+        except PlaywrightTimeoutError:
+            signals["page_changed"] = False
+        except Exception as exc:
+            log.debug("Page change wait aborted (%s): %s", prof.name, exc)
+            signals["page_changed"] = False
+
+    if prof.network_idle_ms:
+        try:
+            await page.wait_for_load_state("networkidle", timeout=min(prof.network_idle_ms, remaining_ms()))
+            signals["network_idle"] = True
+        except PlaywrightTimeoutError:
+            signals["network_idle"] = False
+
+    if prof.images_loaded:
+        try:
+            await page.wait_for_function(_IMAGES_LOADED_JS, timeout=remaining_ms(), polling=100)
+            signals["images_loaded"] = True
+        except PlaywrightTimeoutError:
+            signals["images_loaded"] = False
+        except Exception as exc:
+            log.debug("Image load wait aborted (%s): %s", prof.name, exc)
+            signals["images_loaded"] = False
+
+    if prof.dom_quiet_ms:
+        try:
+            signals["dom_settled"] = bool(await page.evaluate(_DOM_SETTLE_JS, [prof.dom_quiet_ms, remaining_ms()]))
+        except Exception as exc:
+            # Navigation during the wait destroys the execution context.
+            log.debug("DOM settle wait aborted (%s): %s", prof.name, exc)
+            signals["dom_settled"] = False
+
+    elapsed_ms = int((time.monotonic() - started) * 1000)
+    log.debug("wait_ready %s: %d ms %s", prof.name, elapsed_ms, signals)
+    return {"profile": prof.name, "elapsed_ms": elapsed_ms, **signals}
@@ -0,0 +1,218 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .browser import BrowserManager
+
+log = logging.getLogger(__name__)
+
+# Lower value runs first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_SCRAPE = 5
+PRIORITY_BATCH = 10
+
+_PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_SCRAPE: "scrape",
+    PRIORITY_BATCH: "batch",
+}
+
+# "main" jobs own the user-visible tab (BrowserManager.page); "pool" jobs get a pooled tab;
+# "shared" jobs hold no page themselves and only lease pooled tabs at their priority.
+LANE_MAIN = "main"
+LANE_POOL = "pool"
+LANE_SHARED = "shared"
+
+# Priority of the job currently running in this task; nested page leases inherit it.
+current_priority: ContextVar[int] = ContextVar("readly_job_priority", default=PRIORITY_INTERACTIVE)
+
+
+def priority_name(priority: int) -> str:
+    return _PRIORITY_NAMES.get(priority, str(priority))
+
+
+class PriorityGate:
+    """
+    Counting semaphore whose waiters are served lowest priority value first (FIFO within a priority).
+
+    Not thread-safe: use it from a single event loop (the browser loop, see core/loop.py).
+    """
+
+    def __init__(self, capacity: int = 1):
+        self.capacity = max(1, capacity)
+        self._in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def depth(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    def depth_by_priority(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for prio, _, fut in self._waiters:
+            if not fut.done():
+                name = priority_name(prio)
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> None:
+        if self._in_use < self.capacity and not self.depth:
+            self._in_use += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._seq), fut)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was handed over just before cancellation; pass it on.
+                self.release()
+            elif entry in self._waiters:
+                # A release() that ran between cancel() and here already popped it.
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def release(self) -> None:
+        # Hand the slot straight to the next live waiter so nobody can barge in.
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._in_use = max(0, self._in_use - 1)
+
+
+class BrowserScheduler:
+    """
+    Runs browser operations as prioritised jobs with exclusive page ownership.
+
+    Main-lane jobs are serialised on the user-visible tab, so e.g. ``list_library``
+    can no longer navigate away in the middle of ``smart_scrape``. Pool-lane jobs
+    each lease their own tab and run concurrently with the main lane.
+    """
+
+    def __init__(self, manager: "BrowserManager", queue_timeout: float | None = None):
+        self.manager = manager
+        self.queue_timeout = queue_timeout
+        self._main = PriorityGate(1)
+        self._running: dict[int, dict] = {}
+        self._ids = itertools.count(1)
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "total_wait_ms": 0,
+            "max_wait_ms": 0,
+            "last_wait_ms": 0,
+        }
+
+    def _record_wait(self, job: dict) -> None:
+        wait_ms = int((time.monotonic() - job["enqueued"]) * 1000)
+        job["wait_ms"] = wait_ms
+        job["started"] = time.monotonic()
+        self._stats["total_wait_ms"] += wait_ms
+        self._stats["last_wait_ms"] = wait_ms
+        self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+
+    @asynccontextmanager
+    async def exclusive(
+        self,
+        label: str,
+        *,
+        priority: int = PRIORITY_INTERACTIVE,
+        lane: str = LANE_MAIN,
+        timeout: float | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Hold a page exclusively for the duration of the block.
+
+        Yields the main tab for ``LANE_MAIN``, a leased tab for ``LANE_POOL`` and
+        ``None`` for ``LANE_SHARED``.
+        Raises ``TimeoutError`` if the page is not granted within ``timeout``.
+        """
+        job_id = next(self._ids)
+        job = {"label": label, "lane": lane, "priority": priority_name(priority), "enqueued": time.monotonic()}
+        self._stats["submitted"] += 1
+        token = current_priority.set(priority)
+        wait = timeout if timeout is not None else self.queue_timeout
+        page = None
+        try:
+            try:
+                if lane == LANE_MAIN:
+                    await asyncio.wait_for(self._main.acquire(priority), timeout=wait)
+                elif lane == LANE_POOL:
+                    page = await asyncio.wait_for(self.manager.acquire_page(priority), timeout=wait)
+            except TimeoutError:
+                self._stats["timed_out"] += 1
+                log.warning("Job %s timed out waiting for a %s page", label, lane)
+                raise
+            self._record_wait(job)
+            self._running[job_id] = job
+            try:
+                yield self.manager.page if lane == LANE_MAIN else page
+                self._stats["completed"] += 1
+            except BaseException:
+                self._stats["failed"] += 1
+                raise
+            finally:
+                self._running.pop(job_id, None)
+                if lane == LANE_MAIN:
+                    self._main.release()
+                elif lane == LANE_POOL:
+                    self.manager.release_page(page)
+        finally:
+            current_priority.reset(token)
+
+    async def run(
+        self,
+        label: str,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        priority: int = PRIORITY_INTERACTIVE,
+        lane: str = LANE_MAIN,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run ``fn`` as a job. Pool-lane jobs receive their leased tab as ``page=``."""
+        async with self.exclusive(label, priority=priority, lane=lane, timeout=timeout) as page:
+            if lane == LANE_POOL:
+                kwargs["page"] = page
+            return await fn(*args, **kwargs)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        running = [
+            {
+                "label": job["label"],
+                "lane": job["lane"],
+                "priority": job["priority"],
+                "wait_ms": job.get("wait_ms", 0),
+                "running_ms": int((now - job.get("started", now)) * 1000),
+            }
+            for job in self._running.values()
+        ]
+        started = self._stats["completed"] + self._stats["failed"] + len(running)
+        pool_gate = self.manager.pool_gate
+        return {
+            **{k: v for k, v in self._stats.items() if k != "total_wait_ms"},
+            "avg_wait_ms": int(self._stats["total_wait_ms"] / started) if started else 0,
+            "queue_depth": self._main.depth + pool_gate.depth,
+            "main": {"busy": self._main.in_use > 0, "queued": self._main.depth_by_priority()},
+            "pool": {**self.manager.pool_stats(), "queued": pool_gate.depth_by_priority()},
+            "running": running,
+        }
@@ -0,0 +1,40 @@
+import os
+import sqlite3
+import threading
+
+# Local state (article cache, indexes, snapshots) lives next to user_data/ by default.
+DATA_DIR = os.environ.get("READLY_DATA_DIR") or os.path.join(os.getcwd(), "data")
+
+
+class SQLiteStore:
+    """
+    Lazily-opened SQLite database under ``DATA_DIR``.
+
+    One connection is shared across threads (stdio and the HTTP bridge run in
+    different ones) and serialised with a lock.
+    """
+
+    schema = ""
+
+    def __init__(self, filename: str, path: str | None = None):
+        self.path = path or os.path.join(DATA_DIR, filename)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            if self.path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.schema)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
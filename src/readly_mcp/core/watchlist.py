@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import os
+import random
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+# "New Scientist:6h, Wired:12h, The Economist" — entries without an interval use
+# READLY_WATCHLIST_INTERVAL (seconds, or with an s/m/h/d suffix).
+WATCHLIST = os.environ.get("READLY_WATCHLIST", "")
+WATCHLIST_INTERVAL = os.environ.get("READLY_WATCHLIST_INTERVAL", "6h")
+WATCHLIST_CONCURRENCY = int(os.environ.get("READLY_WATCHLIST_CONCURRENCY", "2"))
+WATCHLIST_JITTER = float(os.environ.get("READLY_WATCHLIST_JITTER", "0.1"))
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*$", re.IGNORECASE)
+_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value: str) -> float:
+    match = _DURATION_RE.match(value or "")
+    if not match:
+        raise ValueError(f"Invalid interval: {value!r}")
+    return float(match.group(1)) * _UNITS[match.group(2).lower()]
+
+
+@dataclass
+class WatchEntry:
+    magazine: str
+    interval: float
+    next_due: float = 0.0
+    last_run_at: float | None = None
+    last_duration_ms: int | None = None
+    last_articles: int = 0
+    last_error: str | None = None
+    runs: int = 0
+    failures: int = 0
+
+
+def parse_watchlist(spec: str, default_interval: str = WATCHLIST_INTERVAL) -> list[WatchEntry]:
+    """Parse ``"Name[:interval], ..."`` into watch entries (duplicates keep the first)."""
+    default = parse_duration(default_interval)
+    entries: dict[str, WatchEntry] = {}
+    for item in (spec or "").split(","):
+        name, sep, interval = item.strip().rpartition(":")
+        if not sep or not _DURATION_RE.match(interval):
+            name, interval = item, ""
+        name = name.strip()
+        if name and name not in entries:
+            entries[name] = WatchEntry(name, parse_duration(interval) if interval else default)
+    return list(entries.values())
+
+
+class WatchlistPoller:
+    """
+    In-process scheduler that polls each watched magazine at its own interval.
+
+    Initial runs are spread evenly over the shortest interval and every next run
+    is jittered by ``jitter`` (a fraction of the interval), so browser work
+    arrives as a steady trickle rather than in bursts. At most ``concurrency``
+    polls run at once.
+    """
+
+    def __init__(
+        self,
+        poll: Callable[[str], Awaitable[dict]],
+        entries: list[WatchEntry],
+        *,
+        concurrency: int = WATCHLIST_CONCURRENCY,
+        jitter: float = WATCHLIST_JITTER,
+    ):
+        self.poll = poll
+        self.entries = {e.magazine: e for e in entries}
+        self.concurrency = max(1, concurrency)
+        self.jitter = max(0.0, jitter)
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _jittered(self, interval: float) -> float:
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))  # noqa: S311
+
+    def start(self) -> None:
+        if self.running or not self.entries:
+            return
+        now = time.monotonic()
+        spread = min(e.interval for e in self.entries.values())
+        for i, entry in enumerate(self.entries.values()):
+            entry.next_due = now + spread * i / len(self.entries)
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def trigger(self, magazine: str | None = None) -> None:
+        """Make one magazine (or every magazine) due now."""
+        for entry in self.entries.values():
+            if magazine is None or entry.magazine == magazine:
+                entry.next_due = time.monotonic()
+        if self._wake:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        slots = asyncio.Semaphore(self.concurrency)
+        in_flight: dict[str, asyncio.Task] = {}
+
+        def _finished(task: asyncio.Task) -> None:
+            in_flight.pop(task.get_name(), None)
+            self._wake.set()
+
+        try:
+            while True:
+                now = time.monotonic()
+                for entry in self.entries.values():
+                    if entry.next_due <= now and entry.magazine not in in_flight:
+                        # Reschedule up front; a trigger during the poll waits for it to finish.
+                        entry.next_due = now + self._jittered(entry.interval)
+                        task = asyncio.create_task(self._poll_one(entry, slots), name=entry.magazine)
+                        in_flight[entry.magazine] = task
+                        task.add_done_callback(_finished)
+                idle = [e.next_due for e in self.entries.values() if e.magazine not in in_flight]
+                wait = max(0.0, min(idle) - time.monotonic()) if idle else None
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=wait)
+                except TimeoutError:
+                    pass
+        finally:
+            tasks = list(in_flight.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _poll_one(self, entry: WatchEntry, slots: asyncio.Semaphore) -> None:
+        async with slots:
+            started = time.monotonic()
+            try:
+                result = await self.poll(entry.magazine)
+                failed = not result.get("success", True)
+                entry.last_error = (result.get("error") or "poll_failed") if failed else None
+                entry.last_articles = int(result.get("new_articles") or 0)
+            except Exception as exc:
+                log.warning("Watch-list poll for %s failed: %s", entry.magazine, exc)
+                entry.last_error = str(exc)
+                entry.last_articles = 0
+            entry.runs += 1
+            entry.failures += 1 if entry.last_error else 0
+            entry.last_run_at = time.time()
+            entry.last_duration_ms = int((time.monotonic() - started) * 1000)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "running": self.running,
+            "concurrency": self.concurrency,
+            "jitter": self.jitter,
+            "magazines": [
+                {
+                    "magazine": e.magazine,
+                    "interval_seconds": e.interval,
+                    "due_in_seconds": max(0, int(e.next_due - now)) if self.running else None,
+                    "last_run_at": e.last_run_at,
+                    "last_duration_ms": e.last_duration_ms,
+                    "last_new_articles": e.last_articles,
+                    "last_error": e.last_error,
+                    "runs": e.runs,
+                    "failures": e.failures,
+                }
+                for e in self.entries.values()
+            ],
+        }
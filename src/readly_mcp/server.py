@@ -4,17 +4,44 @@ import asyncio
 import json
 import logging
 import os
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
 from typing import Any
 from urllib.request import Request, urlopen
 
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastmcp import FastMCP
+from fastapi.responses import StreamingResponse
+from fastmcp import Context, FastMCP
 
 # Relative imports
-from .core.browser import browser_manager
-from .core.pdf import create_pdf
+from .core.browser import ARCHIVE_SCREENSHOTS, PREWARM_BROWSER, browser_manager, get_poll_history
+from .core.chunks import ARTICLE_CHUNK_CHARS
+from .core.dedupe import DEDUPE_MODE
+from .core.loop import browser_loop
+from .core.pagehash import PAGE_LOOP, PAGE_SAME, PageSequence, dhash
+from .core.pdf import (
+    PDF_DPI,
+    PDF_GRAYSCALE,
+    PDF_IMAGE_FORMAT,
+    PDF_IMAGE_QUALITY,
+    IncrementalPdf,
+    PageEncoding,
+    encode_page,
+    encode_pool,
+)
+from .core.scheduler import (
+    LANE_MAIN,
+    LANE_POOL,
+    LANE_SHARED,
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SCRAPE,
+    BrowserScheduler,
+)
+from .core.watchlist import WATCHLIST, WatchlistPoller, parse_watchlist
 
 # Configure logging
 logging.basicConfig(
@@ -23,112 +50,234 @@ logging.basicConfig(
 )
 logger = logging.getLogger("readly-mcp")
 
+# stdio and the HTTP bridge each run the lifespan (in separate event loops);
+# only the first one to start owns the browser prewarm, watchdog and watch-list poller.
+# Those, like every other browser job, run on the browser's own loop (see core/loop.py).
+_background_lock = threading.Lock()
+_background_claimed = False
+_prewarm_task: asyncio.Task | None = None
+
+
+def _claim_background() -> bool:
+    global _background_claimed
+    with _background_lock:
+        if _background_claimed:
+            return False
+        _background_claimed = True
+        return True
+
+
+async def _start_background() -> None:
+    global _prewarm_task
+    if PREWARM_BROWSER:
+        _prewarm_task = asyncio.create_task(browser_manager.prewarm())
+    watchlist_poller.start()
+
+
+async def _stop_background() -> None:
+    await watchlist_poller.stop()
+    if _prewarm_task and not _prewarm_task.done():
+        _prewarm_task.cancel()
+    await browser_manager.shutdown()
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Pre-warm the browser in the background so the first tool call does not pay the launch cost,
+    and start polling the configured watch list."""
+    global _background_claimed
+    owner = _claim_background()
+    if owner:
+        await browser_loop.run(_start_background())
+    try:
+        yield {}
+    finally:
+        if owner:
+            await browser_loop.run(_stop_background())
+            with _background_lock:
+                _background_claimed = False
+
+
 # Initialize FastMCP
 mcp = FastMCP(
     name="Readly Scraper",
     instructions="MCP server for scraping Readly magazines and generating PDFs",
     version="0.2.1",
+    lifespan=_lifespan,
+)
+
+# All browser work goes through the scheduler: interactive tool calls are served
+# ahead of batch ingestion, and each job owns its page while it runs.
+browser_scheduler = BrowserScheduler(
+    browser_manager,
+    queue_timeout=float(os.environ.get("READLY_QUEUE_TIMEOUT", "300")),
 )
 
+
+async def _poll_watched_magazine(magazine: str) -> dict:
+    return await _run_job(
+        "watchlist_poll", browser_manager.ingest, [magazine], priority=PRIORITY_BATCH, lane=LANE_SHARED
+    )
+
+
+# Magazines from READLY_WATCHLIST are polled incrementally in-process (see core/watchlist.py).
+watchlist_poller = WatchlistPoller(_poll_watched_magazine, parse_watchlist(WATCHLIST))
+
 # Global ephemeral state
 scraping_state: dict[str, Any] = {
     "is_running": False,
     "current_page": 0,
     "issue_name": "",
     "screenshots": [],
+    "pages_captured": 0,
+    "pdf_path": None,
     "status": "Idle",
     "stop_flag": False,
 }
+# PDF being assembled by the running scrape (for checkpoints from the API).
+_scrape_pdf: IncrementalPdf | None = None
+
 
+def _scrape_output_path(issue_name: str) -> str:
+    desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", "readly")
+    os.makedirs(desktop_path, exist_ok=True)
+    return os.path.join(desktop_path, f"{issue_name}_full.pdf")
 
-async def scraping_worker(issue_name: str, duration_per_page: float, max_pages: int):
+
+async def scraping_worker(
+    issue_name: str,
+    duration_per_page: float,
+    max_pages: int,
+    archive_screenshots: bool = ARCHIVE_SCREENSHOTS,
+    encoding: PageEncoding | None = None,
+):
     """
     Background worker that performing the scraping loop.
+
+    Captured pages go from memory straight into an incrementally built PDF
+    (``IncrementalPdf``), so a stop, an error or a crash still leaves a usable
+    PDF of the pages captured so far. Each page is re-encoded per ``encoding``
+    on the encode pool while the next one is being read and captured. With
+    ``archive_screenshots`` each kept page is also written under ``screenshots/<issue>/``.
     """
-    global scraping_state
+    global scraping_state, _scrape_pdf
 
     logger.info(f"Starting scrape for {issue_name}...")
     scraping_state["status"] = "Running"
     scraping_state["screenshots"] = []
+    scraping_state["pages_captured"] = 0
+    scraping_state["pdf_path"] = None
     scraping_state["current_page"] = 0
     scraping_state["stop_flag"] = False
 
+    pdf: IncrementalPdf | None = None
+    # Pages are held back until they can no longer turn out to be the start of a
+    # reader loop, so a detected loop never has to be cut out of the PDF.
+    held: deque[asyncio.Future] = deque()
+    owns_main_tab = False
+    encoding = encoding or PageEncoding()
+    loop = asyncio.get_running_loop()
+
+    async def _emit(encoded: asyncio.Future) -> None:
+        await asyncio.to_thread(pdf.add_page, *await encoded)
+        scraping_state["pages_captured"] = pdf.pages
+
     try:
         # 1. Ensure browser is open
-        await browser_manager.start_browser(headless=False)
-
-        last_screenshot_path = None
-
-        for i in range(1, max_pages + 1):
-            if scraping_state["stop_flag"]:
-                logger.info("Scraping stopped by user.")
-                break
-
-            scraping_state["current_page"] = i
-
-            # 2. Capture Page
-            logger.info(f"Capturing page {i}...")
-            screenshot_path = await browser_manager.take_page_screenshot(issue_name, i)
-
-            # 3. Simple Duplicate Check (End of Issue Detection)
-            if last_screenshot_path:
-                try:
-                    with (
-                        open(screenshot_path, "rb") as f1,
-                        open(last_screenshot_path, "rb") as f2,
-                    ):
-                        if f1.read() == f2.read():
-                            logger.info("Page identical to previous one. End of issue detected.")
-                            os.remove(screenshot_path)
-                            break
-                except FileNotFoundError:
-                    pass
-
-            scraping_state["screenshots"].append(screenshot_path)
-            last_screenshot_path = screenshot_path
-
-            # 4. Wait (Simulate Reading)
-            logger.info(f"Reading page {i} for {duration_per_page} seconds...")
-            slept = 0
-            while slept < duration_per_page:
+        await browser_manager.start_browser()
+        pdf = _scrape_pdf = await asyncio.to_thread(IncrementalPdf, _scrape_output_path(issue_name))
+
+        # Own the main tab for the whole run and suspend text-mode resource
+        # blocking, since screenshots need images and fonts.
+        async with (
+            browser_scheduler.exclusive("smart_scrape", priority=PRIORITY_SCRAPE, lane=LANE_MAIN),
+            browser_manager.full_render(),
+        ):
+            owns_main_tab = True
+            pages = PageSequence()
+
+            for i in range(1, max_pages + 1):
                 if scraping_state["stop_flag"]:
+                    logger.info("Scraping stopped by user.")
                     break
-                await asyncio.sleep(1)
-                slept += 1
 
-            if scraping_state["stop_flag"]:
-                break
+                scraping_state["current_page"] = i
 
-            # 5. Turn Page
-            logger.info("Turning page...")
-            await browser_manager.turn_page_right()
+                # 2. Capture Page
+                logger.info(f"Capturing page {i}...")
+                png = await browser_manager.capture_page()
 
-            # Wait for animation/load
-            await asyncio.sleep(2)
-
-        # 6. Compile PDF
-        if scraping_state["screenshots"]:
-            logger.info("Compiling PDF...")
-            scraping_state["status"] = "Compiling PDF"
+                # 3. End-of-issue / loop detection on a perceptual hash of the captured bytes
+                verdict, matched = pages.observe(i, await asyncio.to_thread(dhash, png))
+                if verdict == PAGE_SAME:
+                    logger.info("Page matches the previous one. End of issue detected.")
+                    break
+                if verdict == PAGE_LOOP:
+                    # The held-back pages leading into the loop were repeats as well.
+                    logger.info(f"Page {i} repeats page {matched}: reader is looping. Stopping.")
+                    if held:
+                        for path in scraping_state["screenshots"][-len(held) :]:
+                            os.remove(path)
+                        del scraping_state["screenshots"][-len(held) :]
+                        held.clear()
+                    break
 
-            pdf_name = f"{issue_name}_full.pdf"
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", "readly")
-            if not os.path.exists(desktop_path):
-                os.makedirs(desktop_path)
+                held.append(loop.run_in_executor(encode_pool(), encode_page, png, encoding))
+                if len(held) >= pages.repeats:
+                    await _emit(held.popleft())
+                if archive_screenshots:
+                    scraping_state["screenshots"].append(
+                        await asyncio.to_thread(browser_manager.archive_screenshot, issue_name, i, png)
+                    )
+
+                # 4. Wait (Simulate Reading)
+                logger.info(f"Reading page {i} for {duration_per_page} seconds...")
+                slept = 0
+                while slept < duration_per_page:
+                    if scraping_state["stop_flag"]:
+                        break
+                    await asyncio.sleep(1)
+                    slept += 1
 
-            output_path = os.path.join(desktop_path, pdf_name)
-            create_pdf(scraping_state["screenshots"], output_path)
+                if scraping_state["stop_flag"]:
+                    break
 
-            logger.info(f"Done! PDF saved to {output_path}")
-            scraping_state["status"] = "Completed"
-        else:
-            logger.info("No screenshots captured.")
-            scraping_state["status"] = "Failed: No pages captured"
+                # 5. Turn Page
+                logger.info("Turning page...")
+                # Returns once the reader shows a different page and its requests have settled.
+                await browser_manager.turn_page_right()
 
+        scraping_state["status"] = "Compiling PDF"
     except Exception as e:
-        logger.error(f"Error during scraping: {e}")
-        scraping_state["status"] = f"Error: {e!s}"
+        if isinstance(e, TimeoutError) and not owns_main_tab:
+            reason = f"browser busy: the main tab was not free within {browser_scheduler.queue_timeout:.0f} s"
+        else:
+            reason = str(e) or type(e).__name__
+        logger.error(f"Error during scraping: {reason}")
+        scraping_state["status"] = f"Error: {reason}"
     finally:
+        # 6. Finish the PDF with whatever was captured, on every exit path.
+        try:
+            if pdf is not None:
+                while held:
+                    await _emit(held.popleft())
+                scraping_state["pdf_path"] = await asyncio.to_thread(pdf.finalize)
+                scraping_state["pages_captured"] = pdf.pages
+        except Exception as e:
+            logger.error(f"Failed to finish PDF: {e}")
+            scraping_state["status"] = f"Error: {e!s}"
+        _scrape_pdf = None
+        if scraping_state["status"] == "Compiling PDF":
+            if scraping_state["pdf_path"]:
+                logger.info(f"Done! PDF saved to {scraping_state['pdf_path']}")
+                scraping_state["status"] = "Completed"
+                if pdf.lost_pages:
+                    scraping_state["status"] = (
+                        f"Completed with errors: {pdf.lost_pages} page(s) could not be written to the PDF"
+                    )
+            else:
+                logger.info("No screenshots captured.")
+                scraping_state["status"] = "Failed: No pages captured"
         scraping_state["is_running"] = False
 
 
@@ -137,17 +286,45 @@ async def scraping_worker(issue_name: str, duration_per_page: float, max_pages:
 
 async def _ensure_browser() -> None:
     try:
-        await browser_manager.start_browser(headless=False)
+        await browser_manager.start_browser()
     except Exception as exc:
         logger.debug("Browser already running: %s", exc)
 
 
+def _busy(label: str) -> dict:
+    busy = {"success": False, "error": "browser_busy", "job": label}
+    if scraping_state["is_running"]:
+        busy["reason"] = (
+            f"smart_scrape of '{scraping_state['issue_name']}' owns the main tab; use stop_scrape to end it"
+        )
+    return busy
+
+
+async def _run_job(label: str, fn, *args, priority: int = PRIORITY_INTERACTIVE, lane: str = LANE_MAIN, **kwargs):
+    """Run a BrowserManager operation as a scheduled job with exclusive page ownership.
+
+    The job runs on the browser loop, so MCP and HTTP callers queue on the same gates.
+    Main-tab jobs fail fast while a scrape, which can hold the tab for hours, is running."""
+
+    async def _job():
+        if lane == LANE_MAIN and scraping_state["is_running"]:
+            return _busy(label)
+        await _ensure_browser()
+        try:
+            return await browser_scheduler.run(label, fn, *args, priority=priority, lane=lane, **kwargs)
+        except TimeoutError:
+            return _busy(label)
+
+    return await browser_loop.run(_job())
+
+
 @mcp.tool()
 async def open_readly_browser() -> str:
     """Opens the browser and navigates to Readly. Auto-logs in if READLY_AUTH_TOKEN env var is set.
     First run without the token will need manual login (persisted via user_data/ cookies)."""
-    await browser_manager.start_browser(headless=False)
-    await browser_manager.go_to_readly()
+    result = await _run_job("open_readly_browser", browser_manager.go_to_readly)
+    if isinstance(result, dict) and result.get("error") == "browser_busy":
+        return f"Error: {result.get('reason') or 'the browser is busy with another job; try again shortly.'}"
     has_token = bool(os.environ.get("READLY_AUTH_TOKEN", ""))
     return (
         "Browser opened and logged in via auth token."
@@ -157,16 +334,32 @@ async def open_readly_browser() -> str:
 
 
 @mcp.tool()
-async def smart_scrape(issue_name: str, interval_seconds: int = 120, max_pages: int = 200) -> str:
-    """Starts the scraping process in the background."""
+async def smart_scrape(
+    issue_name: str,
+    interval_seconds: int = 120,
+    max_pages: int = 200,
+    archive_screenshots: bool = ARCHIVE_SCREENSHOTS,
+    image_format: str = PDF_IMAGE_FORMAT,
+    quality: int = PDF_IMAGE_QUALITY,
+    grayscale: bool = PDF_GRAYSCALE,
+    dpi: int = PDF_DPI,
+) -> str:
+    """Starts the scraping process in the background.
+    Pages go from capture to PDF in memory; archive_screenshots also keeps each page PNG under screenshots/.
+    For smaller PDFs use image_format="jpeg" with quality (1-95), grayscale=True for text-heavy
+    magazines, and/or dpi (e.g. 72) to downscale from the 96 DPI capture; dpi=0 keeps full resolution."""
     if scraping_state["is_running"]:
         return "Error: A scraping job is already running."
+    try:
+        encoding = PageEncoding(image_format.strip().lower(), quality, grayscale, dpi)
+    except ValueError as exc:
+        return f"Error: {exc}"
 
     scraping_state["is_running"] = True
     scraping_state["issue_name"] = issue_name
     scraping_state["stop_flag"] = False
 
-    asyncio.create_task(scraping_worker(issue_name, interval_seconds, max_pages))
+    browser_loop.submit(scraping_worker(issue_name, interval_seconds, max_pages, archive_screenshots, encoding))
     return f"Started scraping '{issue_name}'. Use 'get_status' to check progress."
 
 
@@ -178,7 +371,8 @@ def get_status() -> dict:
         "is_running": scraping_state["is_running"],
         "issue": scraping_state["issue_name"],
         "current_page": scraping_state["current_page"],
-        "pages_captured": len(scraping_state["screenshots"]),
+        "pages_captured": scraping_state["pages_captured"],
+        "pdf_path": scraping_state["pdf_path"],
     }
 
 
@@ -194,54 +388,109 @@ def stop_scrape() -> str:
 @mcp.tool()
 async def open_latest_issue(magazine_name: str) -> dict:
     """Search Readly and open the latest issue for a magazine by name."""
-    await _ensure_browser()
-    return await browser_manager.open_latest_issue(magazine_name)
+    return await _run_job("open_latest_issue", browser_manager.open_latest_issue, magazine_name)
 
 
 @mcp.tool()
-async def read_all_articles(max_articles: int = 10) -> dict:
-    """Batch-extract full text for articles on the current issue page."""
-    await _ensure_browser()
-    return await browser_manager.read_all_articles(max_articles=max_articles)
+async def read_all_articles(max_articles: int = 10, duplicates: str = DEDUPE_MODE, ctx: Context | None = None) -> dict:
+    """Batch-extract full text for articles on the current issue page.
+    Sends a progress notification as each article finishes. Near-duplicates of articles
+    already extracted (reprints, syndicated pieces) carry duplicate_of; duplicates="skip" drops them."""
+
+    # The job runs on the browser loop; progress goes back to this loop, which owns the MCP session.
+    caller_loop = asyncio.get_running_loop()
+
+    async def _progress(done: int, total: int) -> None:
+        report = ctx.report_progress(done, total, f"{done}/{total} articles")
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(report, caller_loop))
+
+    return await _run_job(
+        "read_all_articles",
+        browser_manager.read_all_articles,
+        max_articles=max_articles,
+        on_progress=_progress if ctx else None,
+        duplicates=duplicates,
+    )
 
 
 @mcp.tool()
-async def list_articles() -> dict:
+async def read_articles(urls: list[str]) -> dict:
+    """Batch-extract full text for article URLs returned by list_articles, without revisiting the issue page."""
+    return await _run_job("read_articles", browser_manager.read_articles, urls, lane=LANE_SHARED)
+
+
+@mcp.tool()
+async def list_articles(refresh: bool = False) -> dict:
     """Parse the current Readly magazine page and extract article titles + URLs.
-    Requires the browser to be on a magazine issue page."""
-    await _ensure_browser()
-    return await browser_manager.list_articles()
+    Requires the browser to be on a magazine issue page. Listings are cached per issue;
+    pass refresh=True to force a re-scan."""
+    return await _run_job("list_articles", browser_manager.list_articles, refresh=refresh)
+
+
+@mcp.tool()
+def invalidate_listing_cache(issue_url: str = "") -> dict:
+    """Drop the cached article listing for an issue URL, or all cached listings if empty."""
+    removed = browser_manager.invalidate_listing(issue_url.strip() or None)
+    return {"ok": True, "removed": removed}
 
 
 @mcp.tool()
 async def extract_article_text(article_index: int = 0) -> dict:
     """Extract the full text of an article from the current magazine issue by index.
     Call list_articles first to get available articles and their indices."""
-    try:
-        await browser_manager.start_browser(headless=False)
-    except Exception as exc:
-        logger.debug("Browser already running: %s", exc)
-    return await browser_manager.extract_article_text(article_index)
+    return await _run_job("extract_article_text", browser_manager.extract_article_text, article_index)
+
+
+@mcp.tool()
+def get_article_text(
+    handle: str,
+    offset: int = 0,
+    limit: int = ARTICLE_CHUNK_CHARS,
+    paragraph_start: int | None = None,
+    paragraph_end: int | None = None,
+) -> dict:
+    """Fetch more of an extracted article's text by the handle returned with its first chunk.
+    Page by character offset/limit, or pass paragraph_start/paragraph_end for a paragraph range."""
+    return browser_manager.get_article_text(handle, offset, limit, paragraph_start, paragraph_end)
+
+
+@mcp.tool()
+def search_articles(query: str, limit: int = 10, magazine: str = "") -> dict:
+    """Full-text search over every article extracted so far (local index, no browser).
+    Returns ranked hits with magazine, issue, title, author, URL and a highlighted snippet."""
+    if not query.strip():
+        return {"error": "query is required", "hits": [], "count": 0}
+    return browser_manager.article_index.search(query, limit=limit, magazine=magazine.strip() or None)
+
+
+@mcp.tool()
+async def ingest_updates(magazines: list[str], extract: bool = True, duplicates: str = DEDUPE_MODE) -> dict:
+    """Poll magazines for what changed since the last poll: new issues and the articles not yet ingested.
+    With extract=True (default) only the new articles are extracted; earlier ones are never re-read.
+    duplicates="skip" drops near-duplicates of articles seen before instead of marking them."""
+    if not [m for m in magazines if m and m.strip()]:
+        return {"success": False, "error": "magazines is required"}
+    return await _run_job(
+        "ingest_updates",
+        browser_manager.ingest,
+        magazines,
+        extract=extract,
+        duplicates=duplicates,
+        priority=PRIORITY_BATCH,
+        lane=LANE_SHARED,
+    )
 
 
 @mcp.tool()
 async def search_magazines(query: str) -> dict:
     """Search Readly for magazines matching a keyword query."""
-    try:
-        await browser_manager.start_browser(headless=False)
-    except Exception as exc:
-        logger.debug("Browser already running: %s", exc)
-    return await browser_manager.search_magazines(query)
+    return await _run_job("search_magazines", browser_manager.search_magazines, query, pooled=True, lane=LANE_SHARED)
 
 
 @mcp.tool()
 async def list_library() -> dict:
     """Scrape the Readly newsstand for all available magazines/issues in your library."""
-    try:
-        await browser_manager.start_browser(headless=False)
-    except Exception as exc:
-        logger.debug("Browser already running: %s", exc)
-    return await browser_manager.list_library()
+    return await _run_job("list_library", browser_manager.list_library, lane=LANE_POOL)
 
 
 # --- FastAPI API Bridge ---
@@ -274,13 +523,32 @@ async def api_list_tools():
 
 
 @app.post("/api/scrape/start")
-async def api_start_scrape(issue_name: str, interval: int = 120, max_pages: int = 200):
-    res = await smart_scrape(issue_name, interval, max_pages)
+async def api_start_scrape(
+    issue_name: str,
+    interval: int = 120,
+    max_pages: int = 200,
+    archive: bool = ARCHIVE_SCREENSHOTS,
+    image_format: str = PDF_IMAGE_FORMAT,
+    quality: int = PDF_IMAGE_QUALITY,
+    grayscale: bool = PDF_GRAYSCALE,
+    dpi: int = PDF_DPI,
+):
+    res = await smart_scrape(issue_name, interval, max_pages, archive, image_format, quality, grayscale, dpi)
     if res.startswith("Error"):
         raise HTTPException(status_code=400, detail=res)
     return {"message": res}
 
 
+@app.post("/api/scrape/checkpoint")
+async def api_checkpoint_scrape():
+    """Write the PDF of the pages captured so far while the scrape keeps running."""
+    pdf = _scrape_pdf
+    if pdf is None:
+        raise HTTPException(status_code=409, detail="No scrape running")
+    path = await asyncio.to_thread(pdf.checkpoint)
+    return {"pdf_path": path, "pages": pdf.pages}
+
+
 @app.post("/api/scrape/stop")
 async def api_stop_scrape():
     return {"message": stop_scrape()}
@@ -290,82 +558,242 @@ async def api_stop_scrape():
 async def api_open_latest(name: str = ""):
     if not name.strip():
         raise HTTPException(status_code=400, detail="name parameter required")
-    await _ensure_browser()
-    return await browser_manager.open_latest_issue(name)
+    return await _run_job("open_latest_issue", browser_manager.open_latest_issue, name)
 
 
 @app.get("/api/articles/read-all")
-async def api_read_all_articles(max: int = 10):
-    await _ensure_browser()
-    return await browser_manager.read_all_articles(max_articles=max)
+async def api_read_all_articles(max: int = 10, duplicates: str = ""):
+    return await _run_job(
+        "read_all_articles",
+        browser_manager.read_all_articles,
+        max_articles=max,
+        duplicates=duplicates or None,
+        priority=PRIORITY_BATCH,
+    )
+
+
+@app.get("/api/articles/read-all/stream")
+async def api_stream_all_articles(max: int = 10, duplicates: str = ""):
+    """NDJSON stream of ``read_all_articles``: one line per article as soon as it is extracted."""
+
+    async def _events():
+        # Runs on the browser loop; the response iterates it from the HTTP thread.
+        if scraping_state["is_running"]:
+            yield {"event": "error", **_busy("read_all_articles_stream")}
+            return
+        await _ensure_browser()
+        try:
+            async with browser_scheduler.exclusive("read_all_articles_stream", priority=PRIORITY_BATCH):
+                async for event in browser_manager.iter_articles(max_articles=max, duplicates=duplicates or None):
+                    yield event
+        except TimeoutError:
+            yield {"event": "error", **_busy("read_all_articles_stream")}
+
+    async def _lines():
+        async for event in browser_loop.stream(_events()):
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
+@app.post("/api/articles/read-urls")
+async def api_read_articles(body: dict):
+    urls = body.get("urls")
+    if not isinstance(urls, list) or not urls:
+        raise HTTPException(status_code=400, detail="urls must be a non-empty list")
+    return await _run_job(
+        "read_articles",
+        browser_manager.read_articles,
+        [str(u) for u in urls],
+        priority=PRIORITY_BATCH,
+        lane=LANE_SHARED,
+    )
+
+
+@app.delete("/api/articles/cache")
+async def api_invalidate_article_cache(url: str = ""):
+    """Drop one cached article (``url``) or the whole article cache."""
+    removed = browser_manager.article_cache.invalidate(url.strip() or None)
+    return {"ok": True, "removed": removed}
 
 
 @app.get("/api/articles/list")
-async def api_list_articles():
-    await _ensure_browser()
-    return await browser_manager.list_articles()
+async def api_list_articles(refresh: bool = False):
+    return await _run_job("list_articles", browser_manager.list_articles, refresh=refresh)
+
+
+@app.delete("/api/articles/listing-cache")
+async def api_invalidate_listing_cache(url: str = ""):
+    return invalidate_listing_cache(url)
+
+
+@app.get("/api/articles/text")
+async def api_article_text(
+    handle: str = "",
+    offset: int = 0,
+    limit: int = ARTICLE_CHUNK_CHARS,
+    paragraph_start: int | None = None,
+    paragraph_end: int | None = None,
+):
+    if not handle.strip():
+        raise HTTPException(status_code=400, detail="handle parameter is required")
+    result = get_article_text(handle, offset, limit, paragraph_start, paragraph_end)
+    if result.get("error") == "unknown_handle":
+        raise HTTPException(status_code=404, detail="unknown or expired article handle")
+    return result
 
 
 @app.get("/api/articles/extract")
 async def api_extract_article(index: int = 0):
-    try:
-        await browser_manager.start_browser(headless=False)
-    except Exception as exc:
-        logger.debug("Browser already running: %s", exc)
-    return await browser_manager.extract_article_text(index)
+    return await _run_job("extract_article_text", browser_manager.extract_article_text, index)
 
 
 @app.get("/api/magazines/search")
 async def api_search_magazines(q: str = ""):
     if not q:
         raise HTTPException(status_code=400, detail="q parameter is required")
-    try:
-        await browser_manager.start_browser(headless=False)
-    except Exception as exc:
-        logger.debug("Browser already running: %s", exc)
-    return await browser_manager.search_magazines(q)
+    return await _run_job("search_magazines", browser_manager.search_magazines, q, pooled=True, lane=LANE_SHARED)
+
+
+@app.get("/api/index/search")
+async def api_search_index(q: str = "", limit: int = 10, magazine: str = ""):
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="q parameter is required")
+    return search_articles(q, limit, magazine)
+
+
+@app.delete("/api/index")
+async def api_clear_index(url: str = ""):
+    """Remove one article (``url``) or everything from the full-text index."""
+    removed = browser_manager.article_index.remove(url.strip() or None)
+    return {"ok": True, "removed": removed}
+
+
+@app.get("/api/fingerprints")
+async def api_fingerprints():
+    """Near-duplicate fingerprint index: articles fingerprinted, duplicates found."""
+    return browser_manager.fingerprints.stats()
+
+
+@app.delete("/api/fingerprints")
+async def api_reset_fingerprints():
+    """Forget all fingerprints, so no later article is flagged as a duplicate of an earlier one."""
+    removed = browser_manager.fingerprints.reset()
+    return {"ok": True, "removed": removed}
 
 
 @app.get("/api/library")
 async def api_list_library():
-    try:
-        await browser_manager.start_browser(headless=False)
-    except Exception as exc:
-        logger.debug("Browser already running: %s", exc)
-    return await browser_manager.list_library()
+    return await _run_job("list_library", browser_manager.list_library, lane=LANE_POOL)
 
 
 @app.get("/api/magazines/open")
 async def api_open_magazine(url: str = ""):
     if not url:
         raise HTTPException(status_code=400, detail="url parameter is required")
-    try:
-        await browser_manager.start_browser(headless=False)
-    except Exception as exc:
-        logger.debug("Browser already running: %s", exc)
-    return await browser_manager.open_url(url)
+    return await _run_job("open_url", browser_manager.open_url, url)
 
 
 @app.post("/api/content/match")
 async def api_content_match(body: dict):
-    """Search watch-list magazines on Readly for articles matching a query (e.g. arXiv paper title)."""
+    """Search watch-list magazines on Readly for articles matching a query (e.g. arXiv paper title).
+
+    Pass ``queries`` (a list) instead of ``query`` to rank a whole batch against the same listings.
+    """
     query = str(body.get("query") or "").strip()
-    if not query:
+    queries = body.get("queries")
+    if queries is not None and (not isinstance(queries, list) or not queries):
+        raise HTTPException(status_code=400, detail="queries must be a non-empty list")
+    if not query and not queries:
         raise HTTPException(status_code=400, detail="query is required")
     magazines = body.get("magazines")
     if magazines is not None and not isinstance(magazines, list):
         raise HTTPException(status_code=400, detail="magazines must be a list")
-    try:
-        await browser_manager.start_browser(headless=False)
-    except Exception as exc:
-        logger.debug("Browser already running: %s", exc)
-    return await browser_manager.match_magazine_articles(
+    options = {
+        "max_per_magazine": int(body.get("max_per_magazine") or 3),
+        "max_hits": int(body.get("max_hits") or 15),
+        "concurrency": int(body["concurrency"]) if body.get("concurrency") else None,
+        "timeout": float(body["timeout"]) if body.get("timeout") else None,
+    }
+    if queries:
+        return await _run_job(
+            "match_queries",
+            browser_manager.match_queries,
+            [str(q) for q in queries],
+            magazines,
+            **options,
+            priority=PRIORITY_BATCH,
+            lane=LANE_SHARED,
+        )
+    return await _run_job(
+        "match_magazine_articles",
+        browser_manager.match_magazine_articles,
         query,
         magazines,
-        max_per_magazine=int(body.get("max_per_magazine") or 3),
+        **options,
+        priority=PRIORITY_BATCH,
+        lane=LANE_SHARED,
+    )
+
+
+@app.post("/api/ingest/poll")
+async def api_ingest_poll(body: dict):
+    """Incremental poll: ``{"magazines": [...], "extract": true}`` returns only new issues/articles.
+
+    ``"duplicates": "skip"`` drops near-duplicates of earlier articles (default ``READLY_DEDUPE``).
+    """
+    magazines = body.get("magazines")
+    if not isinstance(magazines, list) or not magazines:
+        raise HTTPException(status_code=400, detail="magazines must be a non-empty list")
+    return await _run_job(
+        "ingest_updates",
+        browser_manager.ingest,
+        [str(m) for m in magazines],
+        extract=bool(body.get("extract", True)),
+        duplicates=body.get("duplicates"),
+        concurrency=int(body["concurrency"]) if body.get("concurrency") else None,
+        timeout=float(body["timeout"]) if body.get("timeout") else None,
+        priority=PRIORITY_BATCH,
+        lane=LANE_SHARED,
     )
 
 
+@app.get("/api/ingest/snapshot")
+async def api_ingest_snapshot(magazine: str = ""):
+    return browser_manager.ingest_snapshot.snapshot(magazine.strip() or None)
+
+
+@app.delete("/api/ingest/snapshot")
+async def api_reset_ingest_snapshot(magazine: str = ""):
+    """Forget what was ingested for one magazine (or all), so the next poll re-reads everything."""
+    removed = browser_manager.ingest_snapshot.reset(magazine.strip() or None)
+    return {"ok": True, "removed": removed}
+
+
+@app.get("/api/watchlist")
+async def api_watchlist():
+    """Watch-list poller state: per-magazine interval, next run, last result."""
+    return watchlist_poller.stats()
+
+
+@app.post("/api/watchlist/run")
+async def api_watchlist_run(magazine: str = ""):
+    """Poll one watched magazine (or all of them) now instead of waiting for its interval."""
+    name = magazine.strip() or None
+    if name and name not in watchlist_poller.entries:
+        raise HTTPException(status_code=404, detail=f"{name} is not on the watch list")
+    if not watchlist_poller.running:
+        raise HTTPException(status_code=409, detail="watch-list poller is not running")
+    browser_loop.call_soon(watchlist_poller.trigger, name)
+    return {"ok": True, "triggered": name or list(watchlist_poller.entries)}
+
+
+@app.get("/api/pipeline/history")
+async def api_poll_history(limit: int = 50, magazine: str = ""):
+    """Per-run poll stats (duration, articles, avg word count, low yield), newest first."""
+    return {"runs": get_poll_history(limit, magazine.strip() or None)}
+
+
 @app.get("/api/pipeline/liveness")
 async def api_pipeline_liveness():
     """Fleet probe: auth token, browser, scrape job state."""
@@ -398,12 +826,28 @@ async def api_pipeline_liveness():
         "version": "0.2.1",
         "auth_token_set": token,
         "browser_active": browser_up,
+        "resource_blocking": browser_manager.resource_blocking_stats(),
+        "browser_lifecycle": browser_manager.lifecycle_stats(),
+        "scheduler": browser_scheduler.stats(),
+        "article_cache": browser_manager.article_cache.stats(),
+        "article_index": browser_manager.article_index.stats(),
+        "fingerprints": browser_manager.fingerprints.stats(),
+        "listing_cache": browser_manager.listing_cache.stats(),
+        "search_cache": browser_manager.search_cache.stats(),
         "scrape_status": scraping_state.get("status"),
         "last_poll": last_poll,
+        "recent_polls": get_poll_history(10),
+        "watchlist": watchlist_poller.stats(),
         "alerts": alerts,
     }
 
 
+@app.get("/api/scheduler")
+async def api_scheduler_stats():
+    """Browser job queue: depth per priority, running jobs and wait times."""
+    return browser_scheduler.stats()
+
+
 @app.post("/api/auth/token")
 async def api_set_auth_token(token: str = ""):
     """Set the Readly auth token (stored in env, not persisted to disk)."""
@@ -422,6 +866,8 @@ async def api_update_settings(body: dict):
         os.environ["READLY_SCRAPE_INTERVAL"] = str(body["scrape_interval"])
     if body.get("max_pages"):
         os.environ["READLY_MAX_PAGES"] = str(body["max_pages"])
+    if "block_resources" in body:
+        await browser_loop.run(browser_manager.set_resource_blocking(bool(body["block_resources"])))
     return {"ok": True, "message": "Settings saved for this session"}
 
 
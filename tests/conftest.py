@@ -33,3 +33,11 @@ def mock_browser_manager(mock_playwright):
     manager.context = mock_playwright["context"]
     manager.page = mock_playwright["page"]
     return manager
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """
+    Keeps SQLite stores created during tests out of the repo's data/ directory.
+    """
+    monkeypatch.setattr("readly_mcp.core.storage.DATA_DIR", str(tmp_path / "data"))
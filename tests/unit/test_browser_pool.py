@@ -0,0 +1,73 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from readly_mcp.core.browser import BrowserManager
+
+
+def _manager(pool_size: int) -> BrowserManager:
+    bm = BrowserManager(pool_size=pool_size)
+    bm.context = MagicMock()
+
+    async def _new_page():
+        page = MagicMock()
+        page.is_closed.return_value = False
+        return page
+
+    bm.context.new_page = AsyncMock(side_effect=_new_page)
+    return bm
+
+
+def test_lease_page_reuses_released_pages():
+    bm = _manager(pool_size=2)
+
+    async def run():
+        async with bm.lease_page() as first:
+            pass
+        async with bm.lease_page() as second:
+            assert second is first
+        return bm.pool_stats()
+
+    stats = asyncio.run(run())
+    assert bm.context.new_page.await_count == 1
+    assert stats == {"size": 2, "open": 1, "idle": 1, "leased": 0}
+
+
+def test_lease_page_bounds_concurrency():
+    bm = _manager(pool_size=2)
+    active = 0
+    peak = 0
+
+    async def worker():
+        nonlocal active, peak
+        async with bm.lease_page():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def run():
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
+    assert bm.context.new_page.await_count == 2
+
+
+def test_watchdog_relaunches_dead_context_under_the_start_lock():
+    bm = BrowserManager(pool_size=1)
+    bm.probe = AsyncMock(return_value=False)
+    bm.close = AsyncMock()
+
+    async def run():
+        relaunched = asyncio.Event()
+        bm._launch = AsyncMock(side_effect=lambda *a, **k: relaunched.set())
+        async with bm._get_lock():  # a request is inside start_browser()
+            bm.start_watchdog(interval=0.01)
+            await asyncio.sleep(0.05)
+            assert not relaunched.is_set()
+        await asyncio.wait_for(relaunched.wait(), timeout=1)
+        await bm.shutdown()
+
+    asyncio.run(run())
+    assert bm.restarts >= 1
+    assert not bm.lifecycle_stats()["watchdog_running"]
@@ -1,4 +1,7 @@
-from readly_mcp.core.browser import _quality_check_articles
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from readly_mcp.core.browser import BrowserManager, _quality_check_articles, _should_block
 
 
 def test_quality_check_accepts_article_links():
@@ -20,3 +23,31 @@ def test_quality_check_rejects_nav_elements():
     out = _quality_check_articles(raw)
     assert out["extraction_failed"]
     assert out["reason"] in ("no_articles_after_filter", "nav_elements_detected")
+
+
+def test_should_block_heavy_resources_and_trackers():
+    assert _should_block("image", "https://cdn.readly.com/cover.jpg")
+    assert _should_block("font", "https://fonts.gstatic.com/x.woff2")
+    assert _should_block("script", "https://www.googletagmanager.com/gtm.js")
+    assert not _should_block("script", "https://go.readly.com/app.js")
+    assert not _should_block("document", "https://www.readly.com/read/x")
+
+
+def test_request_filter_is_only_installed_while_blocking():
+    bm = BrowserManager()
+    bm.block_resources = False
+    bm.context = MagicMock(route=AsyncMock(), unroute=AsyncMock())
+
+    async def run():
+        await bm._sync_routing()
+        assert not bm.context.route.await_count
+        await bm.set_resource_blocking(True)
+        assert bm.context.route.await_count == 1
+        async with bm.full_render(reload=False):
+            assert bm.context.unroute.await_count == 1
+            assert not bm.resource_blocking_stats()["active"]
+        assert bm.context.route.await_count == 2
+        await bm.set_resource_blocking(False)
+        assert bm.context.unroute.await_count == 2
+
+    asyncio.run(run())
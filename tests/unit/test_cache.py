@@ -0,0 +1,82 @@
+from readly_mcp.core.cache import ArticleCache
+
+
+def _article(url: str, words: int = 60) -> dict:
+    text = " ".join(["word"] * words)
+    return {"title": "T", "url": url, "author": "A", "text": text, "word_count": words}
+
+
+def test_article_cache_roundtrip_and_counters(tmp_path):
+    cache = ArticleCache(path=str(tmp_path / "a.sqlite3"))
+    assert cache.get("https://x/1") is None
+    cache.put(_article("https://x/1"))
+    hit = cache.get("https://x/1")
+    assert hit["word_count"] == 60
+    assert hit["author"] == "A"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_article_cache_ttl_expiry(tmp_path):
+    cache = ArticleCache(path=str(tmp_path / "a.sqlite3"), ttl_seconds=-1)
+    cache.put(_article("https://x/1"))
+    assert cache.get("https://x/1") is None
+
+
+def test_article_cache_evicts_least_recently_used(tmp_path):
+    one = len(_article("u")["text"])
+    cache = ArticleCache(path=str(tmp_path / "a.sqlite3"), max_bytes=one * 2)
+    cache.put(_article("https://x/1"))
+    cache.put(_article("https://x/2"))
+    cache.get("https://x/1")
+    cache.put(_article("https://x/3"))
+    assert cache.get("https://x/2") is None
+    assert cache.get("https://x/1") is not None
+    assert cache.get("https://x/3") is not None
+    assert cache.invalidate() == 2
+
+
+def test_listing_cache_fresh_then_stale_then_expired():
+    from readly_mcp.core.cache import ListingCache
+
+    listing = {"articles": [{"title": "A long enough title", "url": "u", "index": 0}], "count": 1}
+    cache = ListingCache(ttl_seconds=60, stale_seconds=120)
+    cache.store("issue", listing)
+    assert cache.lookup("issue") == (listing, False)
+
+    cache.ttl_seconds = 0
+    assert cache.lookup("issue") == (listing, True)
+    assert cache.begin_refresh("issue")
+    assert not cache.begin_refresh("issue")
+    cache.end_refresh("issue")
+
+    cache.stale_seconds = -1
+    assert cache.lookup("issue") == (None, False)
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_listing_cache_invalidate():
+    from readly_mcp.core.cache import ListingCache
+
+    cache = ListingCache()
+    cache.store("a", {})
+    cache.store("b", {})
+    assert cache.invalidate("a") == 1
+    assert cache.invalidate() == 1
+
+
+def test_ttl_cache_lru_and_expiry():
+    from readly_mcp.core.cache import TTLCache, normalize_query
+
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set(normalize_query("  New   Scientist "), 1)
+    cache.set("wired", 2)
+    assert cache.get("new scientist") == 1
+    cache.set("c't", 3)
+    assert cache.get("wired") is None
+    assert cache.get("new scientist") == 1
+
+    cache.ttl_seconds = -1
+    assert cache.get("c't") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
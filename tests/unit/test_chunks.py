@@ -0,0 +1,35 @@
+from readly_mcp.core.browser import BrowserManager
+from readly_mcp.core.cache import ArticleCache
+from readly_mcp.core.chunks import first_chunk, split_paragraphs
+
+
+def _article() -> dict:
+    paragraphs = [f"Paragraph {i} " + "word " * 30 for i in range(10)]
+    text = "\n\n".join(p.strip() for p in paragraphs)
+    return {"url": "https://www.readly.com/read/x", "title": "Long", "text": text, "word_count": len(text.split())}
+
+
+def test_first_chunk_returns_handle_and_keeps_the_rest_server_side():
+    article = _article()
+    head = first_chunk(article, limit=100)
+    assert head["text"] == article["text"][:100]
+    assert head["has_more"] and head["next_offset"] == 100 and head["total_chars"] == len(article["text"])
+
+
+def test_get_article_text_pages_by_offset_and_paragraph(tmp_path):
+    bm = BrowserManager(article_cache=ArticleCache(path=str(tmp_path / "a.sqlite3")))
+    article = _article()
+    bm.article_cache.put(article)
+    handle = first_chunk(article)["handle"]
+
+    pieces, offset = [], 0
+    while offset is not None:
+        chunk = bm.get_article_text(handle, offset=offset, limit=300)
+        pieces.append(chunk["text"])
+        offset = chunk["next_offset"]
+    assert "".join(pieces) == article["text"]
+
+    paras = bm.get_article_text(article["url"], paragraph_start=8, paragraph_end=20)
+    assert paras["paragraphs"] == split_paragraphs(article["text"])[8:]
+    assert paras["total_paragraphs"] == 10 and not paras["has_more"]
+    assert bm.get_article_text("missing")["error"] == "unknown_handle"
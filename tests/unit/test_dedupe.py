@@ -0,0 +1,47 @@
+import asyncio
+import random
+
+from readly_mcp.core.browser import BrowserManager
+from readly_mcp.core.cache import ArticleCache
+from readly_mcp.core.dedupe import FingerprintIndex, hamming, simhash
+
+_WORDS = "ocean climate carbon model satellite research ice sheet warming data glacier storm".split()
+
+
+def _text(seed: int, n: int = 400) -> str:
+    rng = random.Random(seed)  # noqa: S311
+    return " ".join(rng.choice(_WORDS) for _ in range(n))
+
+
+def test_simhash_is_close_for_reprints_and_far_for_other_text():
+    text = _text(1)
+    reprint = "Reprinted from Wired. " + text + " Subscribe for more."
+    assert hamming(simhash(text), simhash(reprint)) <= 3
+    assert hamming(simhash(text), simhash(_text(2))) > 10
+    assert simhash("too short") is None
+
+
+def test_fingerprint_index_points_duplicates_at_the_first_copy():
+    index = FingerprintIndex(path=":memory:")
+    text = _text(3)
+    assert index.check({"url": "a", "title": "Original", "text": text}, magazine="Wired") is None
+    dup = index.check({"url": "b", "title": "Copy", "text": text + " Extra line."})
+    assert dup["duplicate_of"] == "a" and dup["magazine"] == "Wired"
+    assert index.check({"url": "b", "text": ""})["duplicate_of"] == "a"
+    assert index.check({"url": "c", "text": _text(4)}) is None
+    assert index.stats()["duplicates"] == 1
+
+
+def test_cached_duplicates_are_marked_and_skippable(tmp_path):
+    cache = ArticleCache(path=str(tmp_path / "a.sqlite3"))
+    bm = BrowserManager(article_cache=cache)
+    bm.fingerprints = FingerprintIndex(path=":memory:")
+    text = _text(5)
+    for url in ("https://x/1", "https://y/1"):
+        cache.put({"url": url, "title": url, "text": text, "word_count": 400})
+
+    first = asyncio.run(bm._fetch_article("https://x/1"))
+    second = asyncio.run(bm._fetch_article("https://y/1"))
+    assert "duplicate_of" not in first and second["duplicate_of"] == "https://x/1"
+    assert bm._skip_entry({"index": 1}, second) is None
+    assert bm._skip_entry({"index": 1}, second, skip_duplicates=True)["error"] == "duplicate"
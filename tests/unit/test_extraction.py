@@ -0,0 +1,72 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from readly_mcp.core.browser import BrowserManager
+from readly_mcp.core.cache import ArticleCache
+from readly_mcp.core.extraction import EXTRACTION_SCRIPT, extract_article
+
+
+def test_extract_article_is_one_round_trip_when_script_installed():
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"title": "T", "text": "body", "meta": {"author": "A"}})
+    out = asyncio.run(extract_article(page))
+    assert out["meta"] == {"author": "A"}
+    page.evaluate.assert_awaited_once()
+    assert EXTRACTION_SCRIPT not in page.evaluate.await_args.args[0]
+
+
+def test_extract_article_installs_script_on_older_documents():
+    page = MagicMock()
+    page.evaluate = AsyncMock(side_effect=[None, {"title": "T", "text": "body"}])
+    out = asyncio.run(extract_article(page))
+    assert out["title"] == "T"
+    assert EXTRACTION_SCRIPT in page.evaluate.await_args.args[0]
+
+
+def test_extract_from_url_joins_scored_paragraphs(monkeypatch):
+    import readly_mcp.core.browser as browser_mod
+
+    monkeypatch.setattr(browser_mod, "wait_ready", AsyncMock())
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.evaluate = AsyncMock(
+        return_value={"title": "T", "paragraphs": ["First one.", "Second one."], "content_method": "scored"}
+    )
+    out = asyncio.run(BrowserManager()._extract_from_url(page, "https://x"))
+    assert out["text"] == "First one.\n\nSecond one."
+    assert out["content_method"] == "scored"
+    assert out["word_count"] == 4
+
+
+def test_article_cache_keeps_metadata(tmp_path):
+    cache = ArticleCache(path=str(tmp_path / "a.sqlite3"))
+    cache.put({"url": "https://x", "title": "T", "text": "w " * 60, "word_count": 60, "meta": {"published": "2026"}})
+    assert cache.get("https://x")["meta"] == {"published": "2026"}
+
+
+def _harvest_page(harvest_items: list[dict], scan: dict) -> MagicMock:
+    async def evaluate(_js, args):
+        kind, _ = args
+        if kind == "harvest":
+            return {"items": harvest_items, "steps": 4, "reason": "complete", "elapsed_ms": 900}
+        return scan
+
+    page = MagicMock(url="https://www.readly.com/issue")
+    page.evaluate = AsyncMock(side_effect=evaluate)
+    page.goto = AsyncMock()
+    return page
+
+
+def test_scan_listing_keeps_items_harvested_before_dom_recycling(monkeypatch):
+    monkeypatch.setattr("readly_mcp.core.browser.wait_ready", AsyncMock())
+    items = [{"title": f"Feature article number {i}", "url": f"https://www.readly.com/read/{i}"} for i in range(40)]
+    scan = {"title": "Issue", "url": "https://www.readly.com/issue", "articles": items[-5:]}
+    out = asyncio.run(BrowserManager()._scan_listing(_harvest_page(items, scan)))
+    assert out["count"] == 40 and out["articles"][0]["url"].endswith("/0")
+
+
+def test_list_library_falls_back_to_static_scan(monkeypatch):
+    monkeypatch.setattr("readly_mcp.core.browser.wait_ready", AsyncMock())
+    fallback = {"items": [{"title": f"Magazine {i}"} for i in range(3)]}
+    out = asyncio.run(BrowserManager().list_library(page=_harvest_page([], fallback)))
+    assert out["count"] == 3 and out["harvest"]["steps"] == 4
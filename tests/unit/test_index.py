@@ -0,0 +1,31 @@
+from readly_mcp.core.index import ArticleIndex, magazine_from_issue
+
+
+def _article(url: str, title: str, text: str) -> dict:
+    return {"url": url, "title": title, "author": "", "text": text, "meta": {"published": "2026-10-01"}}
+
+
+def test_search_ranks_title_matches_and_returns_snippets(tmp_path):
+    index = ArticleIndex(path=str(tmp_path / "index.sqlite3"))
+    index.add(_article("u1", "Gardening in autumn", "Quantum computers were mentioned once."), magazine="Gardens")
+    index.add(_article("u2", "Quantum computing breakthrough", "Qubits and quantum error correction."), magazine="NS")
+    index.add(_article("u3", "Bird migration", "Swallows fly south."), magazine="Birds")
+
+    out = index.search("quantum computer")
+    assert [h["url"] for h in out["hits"]] == ["u2", "u1"]
+    assert "[" in out["hits"][0]["snippet"]
+    assert out["hits"][0]["published"] == "2026-10-01"
+    assert index.search("quantum", magazine="Gardens")["count"] == 1
+
+
+def test_search_falls_back_to_any_term_and_ignores_fts_syntax(tmp_path):
+    index = ArticleIndex(path=str(tmp_path / "index.sqlite3"))
+    index.add(_article("u1", "Bird migration", "Swallows fly south."))
+    out = index.search('swallows NEAR("penguins" OR')
+    assert out["match"] == "any" and out["count"] == 1
+    index.add(_article("u1", "Bird migration", "Storks fly south."))
+    assert index.stats()["entries"] == 1
+
+
+def test_magazine_from_issue_title():
+    assert magazine_from_issue("New Scientist - 12 Oct 2026 | Readly") == "New Scientist"
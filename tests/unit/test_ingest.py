@@ -0,0 +1,69 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from readly_mcp.core.browser import BrowserManager
+from readly_mcp.core.ingest import STATE_EXTRACTED, IngestSnapshot
+
+
+def _listing(issue: str, urls: list[str]) -> dict:
+    return {
+        "issue_title": issue,
+        "page_url": f"https://www.readly.com/{issue}",
+        "articles": [{"index": i, "title": f"Title {u}", "url": u} for i, u in enumerate(urls)],
+    }
+
+
+def test_snapshot_diff_returns_only_unseen_or_pending_articles():
+    snap = IngestSnapshot(path=":memory:")
+    first = snap.diff("Mag", _listing("i1", ["a", "b"]))
+    assert first["new_issue"] and [a["url"] for a in first["pending"]] == ["a", "b"]
+    snap.mark(["a"], STATE_EXTRACTED)
+
+    again = snap.diff("Mag", _listing("i1", ["a", "b", "c"]))
+    assert not again["new_issue"]
+    assert [a["url"] for a in again["pending"]] == ["b", "c"] and again["known"] == 1
+    assert snap.snapshot("Mag")["magazines"]["Mag"][0]["extracted"] == 1
+
+
+def test_ingest_extracts_only_the_delta():
+    bm = BrowserManager(pool_size=2)
+    bm.context = MagicMock()
+    listings = iter([_listing("i1", ["a", "b"]), _listing("i2", ["a", "b", "c"])])
+    fetched = []
+
+    async def magazine_listing(name, slots, refresh=False):
+        return next(listings)
+
+    async def fetch(href, listing=None):
+        fetched.append(href)
+        return {"url": href, "title": href, "text": "w " * 80, "word_count": 80}
+
+    bm._magazine_listing = magazine_listing
+    bm._fetch_article = fetch
+
+    first = asyncio.run(bm.ingest(["Mag"]))
+    second = asyncio.run(bm.ingest(["Mag"]))
+    assert first["new_articles"] == 2 and first["new_issues"] == 1
+    assert second["new_issues"] == 1
+    assert [a["url"] for a in second["magazines"][0]["new_articles"]] == ["c"]
+    assert fetched == ["a", "b", "c"]
+
+
+def test_ingest_rescans_instead_of_serving_the_listing_cache():
+    bm = BrowserManager(pool_size=1)
+    bm.ingest_snapshot = IngestSnapshot(path=":memory:")
+    page = MagicMock(url="https://www.readly.com/i1")
+    page.is_closed.return_value = False
+    bm.context = MagicMock(new_page=AsyncMock(return_value=page))
+    bm.search_magazines = AsyncMock(return_value={"results": [{"url": "https://www.readly.com/mag"}]})
+    bm.open_url = AsyncMock(return_value={"success": True})
+    scans = iter([_listing("i1", ["a", "b"]), _listing("i1", ["a", "b", "c"])])
+    bm._scan_listing = AsyncMock(side_effect=lambda page: next(scans))
+    bm._fetch_article = AsyncMock(
+        side_effect=lambda href, listing=None: {"url": href, "title": href, "text": "w " * 80, "word_count": 80}
+    )
+
+    first = asyncio.run(bm.ingest(["Mag"]))
+    second = asyncio.run(bm.ingest(["Mag"]))
+    assert [a["url"] for a in first["magazines"][0]["new_articles"]] == ["a", "b"]
+    assert [a["url"] for a in second["magazines"][0]["new_articles"]] == ["c"]
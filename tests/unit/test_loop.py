@@ -0,0 +1,34 @@
+import asyncio
+import threading
+
+from readly_mcp.core.loop import BrowserLoop
+
+
+def test_jobs_from_any_loop_run_on_the_owner_thread():
+    owner = BrowserLoop(name="test-browser")
+    gate = asyncio.Lock()  # bound to the owner loop on first use
+
+    async def job(n: int) -> tuple[int, str]:
+        async with gate:
+            await asyncio.sleep(0.01)
+            return n, threading.current_thread().name
+
+    async def caller(n: int) -> tuple[int, str]:
+        return await owner.run(job(n))
+
+    results: list = []
+    threads = [threading.Thread(target=lambda n=n: results.append(asyncio.run(caller(n)))) for n in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(results) == [(0, "test-browser"), (1, "test-browser"), (2, "test-browser")]
+
+    async def events():
+        for n in range(3):
+            yield n, threading.current_thread().name
+
+    async def collect():
+        return [item async for item in owner.stream(events())]
+
+    assert asyncio.run(collect()) == [(n, "test-browser") for n in range(3)]
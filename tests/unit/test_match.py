@@ -0,0 +1,69 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from readly_mcp.core.browser import BrowserManager
+
+
+def _manager(delays: dict[str, float] | None = None) -> BrowserManager:
+    delays = delays or {}
+    bm = BrowserManager(pool_size=4)
+    bm.context = MagicMock()
+
+    async def _new_page():
+        page = MagicMock()
+        page.is_closed.return_value = False
+        return page
+
+    bm.context.new_page = AsyncMock(side_effect=_new_page)
+
+    async def search(name, page=None, **_):
+        return {"results": [{"url": f"https://www.readly.com/{name}"}]}
+
+    async def open_url(url, page=None):
+        page.current = url.rsplit("/", 1)[-1]
+        await asyncio.sleep(delays.get(page.current, 0))
+        return {"success": True}
+
+    async def list_articles(page=None, **_):
+        articles = [
+            {"title": f"Quantum computing milestone part {i}", "url": f"u{i}", "index": i} for i in range(5)
+        ] + [{"title": "Gardening tips for spring", "url": "g", "index": 5}]
+        return {"issue_title": page.current, "articles": articles}
+
+    bm.search_magazines = search
+    bm.open_url = open_url
+    bm.list_articles = list_articles
+    return bm
+
+
+def test_match_enforces_per_magazine_cap():
+    bm = _manager()
+    out = asyncio.run(bm.match_magazine_articles("quantum computing", ["A", "B"], max_per_magazine=2))
+    assert out["count"] == 4
+    assert sorted(out["magazines_completed"]) == ["A", "B"]
+    assert not out["partial"]
+
+
+def test_match_stops_once_enough_hits():
+    bm = _manager({"slow": 5})
+    out = asyncio.run(bm.match_magazine_articles("quantum computing", ["fast", "slow"], max_per_magazine=3, max_hits=3))
+    assert out["count"] == 3
+    assert out["magazines_unfinished"] == ["slow"]
+    assert out["partial"] and not out["timed_out"]
+    assert bm.pool_stats()["leased"] == 0
+
+
+def test_match_deadline_returns_partial_results():
+    bm = _manager({"slow": 5})
+    out = asyncio.run(bm.match_magazine_articles("quantum computing", ["fast", "slow"], max_hits=50, timeout=0.2))
+    assert out["timed_out"]
+    assert out["magazines_completed"] == ["fast"]
+    assert out["count"] == 3
+
+
+def test_match_queries_ranks_batch_against_one_listing_pass():
+    bm = _manager()
+    out = asyncio.run(bm.match_queries(["quantum computing", "spring gardening"], ["A", "B"], max_per_magazine=1))
+    first, second = out["results"]
+    assert first["count"] == 2 and {h["magazine"] for h in first["hits"]} == {"A", "B"}
+    assert [h["title"] for h in second["hits"]] == ["Gardening tips for spring"] * 2
@@ -0,0 +1,45 @@
+import io
+import random
+
+from PIL import Image, ImageDraw
+
+from readly_mcp.core.pagehash import PAGE_LOOP, PAGE_NEW, PAGE_SAME, PageSequence, dhash, hamming
+
+
+def _page(seed: int) -> Image.Image:
+    rng = random.Random(seed)  # noqa: S311
+    img = Image.new("RGB", (640, 360), "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(40):
+        x, y = rng.randrange(600), rng.randrange(340)
+        draw.rectangle((x, y, x + rng.randrange(10, 200), y + rng.randrange(4, 60)), fill=rng.choice(["black", "grey"]))
+    return img
+
+
+def _png(img: Image.Image) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def test_dhash_ignores_a_changed_pixel_but_not_a_different_page():
+    page = _page(1)
+    blinked = page.copy()
+    blinked.putpixel((320, 180), (255, 0, 0))
+    assert hamming(dhash(_png(page)), dhash(_png(blinked))) <= 2
+    assert hamming(dhash(_png(page)), dhash(_png(_page(2)))) > 40
+
+
+def test_page_sequence_detects_end_of_issue_and_loops():
+    hashes = {n: dhash(_page(n)) for n in range(1, 5)}
+
+    end = PageSequence()
+    assert end.observe(1, hashes[1]) == (PAGE_NEW, None)
+    assert end.observe(2, hashes[1]) == (PAGE_SAME, 1)
+
+    # 1 2 3 4 then back to 2 3: the second repeat in a row is a loop.
+    loop = PageSequence(repeats=2)
+    for n in range(1, 5):
+        assert loop.observe(n, hashes[n])[0] == PAGE_NEW
+    assert loop.observe(5, hashes[2]) == (PAGE_NEW, 2)
+    assert loop.observe(6, hashes[3]) == (PAGE_LOOP, 3)
@@ -0,0 +1,89 @@
+import io
+import os
+
+import pytest
+from PIL import Image
+from pypdf import PdfReader
+
+from readly_mcp.core.pdf import IncrementalPdf, PageEncoding, create_pdf, encode_page
+
+
+def _png(size: tuple[int, int], color: str) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, color).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _page_sizes(path) -> list[tuple[float, float]]:
+    return [(float(p.mediabox.width), float(p.mediabox.height)) for p in PdfReader(path).pages]
+
+
+def test_create_pdf_from_in_memory_pages_and_paths(tmp_path):
+    on_disk = tmp_path / "page_002.png"
+    on_disk.write_bytes(_png((300, 200), "blue"))
+    out = tmp_path / "issue.pdf"
+    create_pdf([_png((200, 300), "red"), str(on_disk)], str(out))
+    assert _page_sizes(out) == [(200, 300), (300, 200)]
+
+
+def test_incremental_pdf_flushes_chunks_and_finalizes(tmp_path):
+    out = tmp_path / "issue.pdf"
+    pdf = IncrementalPdf(str(out), chunk_pages=2, workers=1)
+    for i in range(5):
+        pdf.add_page(_png((100 + i, 50), "white"))
+    assert len(os.listdir(pdf.parts_dir)) == 2  # two full chunks on disk, one page in memory
+
+    assert pdf.checkpoint() == str(out)
+    assert len(_page_sizes(out)) == 5
+    pdf.add_page(_png((10, 10), "black"))
+    assert pdf.finalize() == str(out)
+    assert _page_sizes(out) == [(100, 50), (101, 50), (102, 50), (103, 50), (104, 50), (10, 10)]
+    assert not os.path.exists(pdf.parts_dir)
+
+
+def test_parts_of_an_interrupted_build_are_recovered(tmp_path):
+    out = tmp_path / "issue.pdf"
+    crashed = IncrementalPdf(str(out), chunk_pages=1, workers=1)
+    crashed.add_page(_png((30, 40), "white"))
+
+    IncrementalPdf(str(out)).finalize()
+    assert _page_sizes(tmp_path / "issue_recovered.pdf") == [(30, 40)]
+
+
+def test_encoded_pages_keep_their_size_and_shrink_the_pdf(tmp_path):
+    noisy = Image.effect_noise((960, 540), 60).convert("RGB")
+    buf = io.BytesIO()
+    noisy.save(buf, "PNG")
+    page = buf.getvalue()
+
+    create_pdf([page], str(tmp_path / "png.pdf"))
+    create_pdf([page], str(tmp_path / "jpeg.pdf"), PageEncoding("jpeg", quality=60, grayscale=True, dpi=72))
+    assert _page_sizes(tmp_path / "jpeg.pdf") == [(960, 540)]
+    assert (tmp_path / "jpeg.pdf").stat().st_size < (tmp_path / "png.pdf").stat().st_size / 3
+
+    data, size = encode_page(page, PageEncoding("jpeg", dpi=48))
+    assert size == (960, 540) and Image.open(io.BytesIO(data)).size == (480, 270)
+    with pytest.raises(ValueError, match="WebP"):
+        PageEncoding("webp")
+
+
+def test_parts_built_on_the_process_pool_keep_page_order(tmp_path):
+    out = tmp_path / "issue.pdf"
+    pdf = IncrementalPdf(str(out), chunk_pages=2, workers=2)
+    for i in range(7):
+        pdf.add_page(_png((100 + i, 60 + i), "white"))
+    assert pdf.checkpoint() == str(out)
+    assert len(_page_sizes(out)) == 7
+    assert pdf.finalize() == str(out)
+    assert _page_sizes(out) == [(100 + i, 60 + i) for i in range(7)]
+    assert os.listdir(tmp_path) == ["issue.pdf"]
+
+
+def test_pages_of_a_failed_part_are_not_counted_as_written(tmp_path):
+    out = tmp_path / "issue.pdf"
+    pdf = IncrementalPdf(str(out), chunk_pages=2, workers=2)
+    for page in (_png((40, 30), "white"), _png((41, 30), "white"), b"not an image", _png((43, 30), "white")):
+        pdf.add_page(page, (50, 50))
+    pdf.finalize()
+    assert (pdf.pages, pdf.lost_pages) == (2, 2)
+    assert len(_page_sizes(out)) == 2
@@ -0,0 +1,29 @@
+from readly_mcp.core.ranking import BM25Ranker, stem, tokenize
+
+
+def test_tokenize_drops_stopwords_and_stems():
+    assert tokenize("Using the Quantum Computers for a new paper") == ["quantum", "comput"]
+    assert stem("milestones") == stem("milestone")
+
+
+def test_rank_prefers_rare_terms_and_title_matches():
+    ranker = BM25Ranker()
+    docs = [
+        {"url": "a", "title": "Climate change and the oceans"},
+        {"url": "b", "title": "Quantum computing reaches a milestone"},
+        {"url": "c", "title": "Climate policy news"},
+        {"url": "d", "title": "Gardening", "text": "A quantum computer article about qubit computing."},
+    ]
+    [hits] = ranker.rank(["Quantum computers and qubits"], docs)
+    assert [h["doc"]["url"] for h in hits] == ["b", "d"]
+    assert hits[0]["matched_terms"] == ["comput", "quantum"]
+
+
+def test_rank_scores_batches_and_accumulates_idf_once_per_document():
+    ranker = BM25Ranker()
+    docs = [{"url": str(i), "title": t} for i, t in enumerate(["ocean warming trends", "ocean plastic", "bees"])]
+    first = ranker.rank(["ocean warming", "bees"], docs)
+    ranker.rank(["ocean"], docs)
+    assert ranker.stats()["documents"] == 3
+    assert first[0][0]["doc"]["url"] == "0"
+    assert [h["doc"]["url"] for h in first[1]] == ["2"]
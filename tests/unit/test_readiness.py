@@ -0,0 +1,58 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from readly_mcp.core.readiness import WAIT_PROFILES, WaitProfile, get_wait_profile, wait_ready
+
+
+def _page() -> MagicMock:
+    page = MagicMock()
+    page.wait_for_load_state = AsyncMock()
+    page.wait_for_selector = AsyncMock()
+    page.evaluate = AsyncMock(return_value=True)
+    page.wait_for_function = AsyncMock()
+    return page
+
+
+def test_every_profile_has_a_timeout():
+    for name, profile in WAIT_PROFILES.items():
+        assert profile.name == name
+        assert profile.timeout_ms > 0
+
+
+def test_unknown_profile_raises():
+    with pytest.raises(ValueError):
+        get_wait_profile("nope")
+
+
+def test_wait_ready_reports_signals():
+    page = _page()
+    out = asyncio.run(wait_ready(page, "issue"))
+    assert out["profile"] == "issue"
+    assert out["selector"] is True
+    assert out["dom_settled"] is True
+    page.wait_for_selector.assert_awaited_once()
+
+
+def test_wait_ready_swallows_timeouts():
+    page = _page()
+    page.wait_for_selector.side_effect = PlaywrightTimeoutError("slow")
+    page.wait_for_load_state.side_effect = PlaywrightTimeoutError("busy")
+    profile = WaitProfile("custom", timeout_ms=50, selector="main", network_idle_ms=10)
+    out = asyncio.run(wait_ready(page, profile))
+    assert out["selector"] is False
+    assert out["network_idle"] is False
+    assert "dom_settled" not in out
+
+
+def test_page_turn_waits_for_the_reader_page_to_change():
+    page = _page()
+    out = asyncio.run(wait_ready(page, "page_turn", before="https://x/read/1|p. 1|img-1.jpg"))
+    assert out["page_changed"] is True and out["network_idle"] is True
+    assert page.wait_for_function.await_args.kwargs["arg"] == "https://x/read/1|p. 1|img-1.jpg"
+
+    page.wait_for_function.side_effect = PlaywrightTimeoutError("same page")
+    out = asyncio.run(wait_ready(page, "screenshot"))
+    assert out["images_loaded"] is False and out["dom_settled"] is True
@@ -0,0 +1,137 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from readly_mcp.core.browser import BrowserManager
+from readly_mcp.core.scheduler import (
+    LANE_MAIN,
+    LANE_POOL,
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    BrowserScheduler,
+    PriorityGate,
+)
+
+
+def test_priority_gate_serves_interactive_before_batch():
+    gate = PriorityGate(1)
+    order: list[str] = []
+
+    async def job(name: str, priority: int):
+        await gate.acquire(priority)
+        order.append(name)
+        await asyncio.sleep(0)
+        gate.release()
+
+    async def run():
+        await gate.acquire()
+        tasks = [
+            asyncio.create_task(job("batch-1", PRIORITY_BATCH)),
+            asyncio.create_task(job("batch-2", PRIORITY_BATCH)),
+            asyncio.create_task(job("interactive", PRIORITY_INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        assert gate.depth == 3
+        gate.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert order == ["interactive", "batch-1", "batch-2"]
+    assert gate.in_use == 0
+
+
+def test_priority_gate_cancelled_waiter_is_dropped():
+    gate = PriorityGate(1)
+
+    async def run():
+        await gate.acquire()
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        gate.release()
+
+    asyncio.run(run())
+    assert gate.depth == 0
+    assert gate.in_use == 0
+
+
+def test_priority_gate_release_between_cancel_and_wakeup():
+    gate = PriorityGate(1)
+
+    async def run():
+        await gate.acquire()
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        gate.release()  # pops the cancelled waiter before it resumes
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.wait_for(gate.acquire(), timeout=1)
+        gate.release()
+
+    asyncio.run(run())
+    assert gate.depth == 0
+    assert gate.in_use == 0
+
+
+def _scheduler() -> BrowserScheduler:
+    bm = BrowserManager(pool_size=2)
+    bm.page = MagicMock(name="main")
+    bm.context = MagicMock()
+
+    async def _new_page():
+        page = MagicMock()
+        page.is_closed.return_value = False
+        return page
+
+    bm.context.new_page = _new_page
+    return BrowserScheduler(bm)
+
+
+def test_main_lane_jobs_never_overlap():
+    sched = _scheduler()
+    active = 0
+    peak = 0
+
+    async def job():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*(sched.run("job", job, lane=LANE_MAIN) for _ in range(4)))
+
+    assert asyncio.run(run()) == ["ok"] * 4
+    assert peak == 1
+    stats = sched.stats()
+    assert stats["completed"] == 4
+    assert stats["queue_depth"] == 0
+
+
+def test_pool_lane_passes_leased_page():
+    sched = _scheduler()
+
+    async def job(page=None):
+        return page
+
+    page = asyncio.run(sched.run("job", job, lane=LANE_POOL))
+    assert page is not None
+    assert page is not sched.manager.page
+
+
+def test_queue_timeout_raises():
+    sched = _scheduler()
+
+    async def run():
+        async with sched.exclusive("holder"):
+            with pytest.raises(TimeoutError):
+                await sched.run("late", asyncio.sleep, 0, timeout=0.01)
+
+    asyncio.run(run())
+    assert sched.stats()["timed_out"] == 1
@@ -0,0 +1,64 @@
+import asyncio
+import contextlib
+import io
+import random
+from unittest.mock import AsyncMock
+
+from PIL import Image, ImageDraw
+from pypdf import PdfReader
+
+import readly_mcp.server as server
+
+
+def _page(seed: int) -> bytes:
+    rng = random.Random(seed)  # noqa: S311
+    img = Image.new("RGB", (320, 180), "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(30):
+        x, y = rng.randrange(300), rng.randrange(170)
+        draw.rectangle((x, y, x + rng.randrange(10, 100), y + rng.randrange(4, 30)), fill="black")
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def test_worker_stops_on_a_reader_loop_and_still_writes_the_pdf(monkeypatch, tmp_path):
+    # Reader shows pages 1-4, then cycles back to 2 and 3.
+    shots = iter([_page(n) for n in (1, 2, 3, 4, 2, 3, 4)])
+    bm = server.browser_manager
+    monkeypatch.setattr(bm, "start_browser", AsyncMock())
+    monkeypatch.setattr(bm, "capture_page", AsyncMock(side_effect=lambda: next(shots)))
+    monkeypatch.setattr(bm, "turn_page_right", AsyncMock())
+    monkeypatch.setattr(bm, "full_render", contextlib.nullcontext)
+    monkeypatch.setattr(server, "_scrape_output_path", lambda name: str(tmp_path / f"{name}.pdf"))
+
+    asyncio.run(server.scraping_worker("Issue", 0, 20, archive_screenshots=False))
+
+    state = server.scraping_state
+    assert state["status"] == "Completed"
+    assert state["pages_captured"] == 4
+    assert len(PdfReader(state["pdf_path"]).pages) == 4
+
+
+def test_main_tab_jobs_fail_fast_while_a_scrape_runs(monkeypatch):
+    job = AsyncMock()
+    monkeypatch.setitem(server.scraping_state, "is_running", True)
+    monkeypatch.setitem(server.scraping_state, "issue_name", "Issue")
+
+    out = asyncio.run(server._run_job("list_articles", job))
+    assert out["error"] == "browser_busy" and "Issue" in out["reason"]
+    job.assert_not_awaited()
+
+
+def test_scrape_that_cannot_get_the_main_tab_reports_it(monkeypatch, tmp_path):
+    @contextlib.asynccontextmanager
+    async def busy(*args, **kwargs):
+        raise TimeoutError
+        yield
+
+    monkeypatch.setattr(server.browser_manager, "start_browser", AsyncMock())
+    monkeypatch.setattr(server.browser_scheduler, "exclusive", busy)
+    monkeypatch.setattr(server, "_scrape_output_path", lambda name: str(tmp_path / f"{name}.pdf"))
+
+    asyncio.run(server.scraping_worker("Issue", 0, 5, archive_screenshots=False))
+    assert server.scraping_state["status"].startswith("Error: browser busy: the main tab was not free")
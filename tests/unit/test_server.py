@@ -37,6 +37,10 @@ def test_server_tools_exist():
         "search_magazines",
         "open_latest_issue",
         "read_all_articles",
+        "read_articles",
+        "search_articles",
+        "ingest_updates",
+        "get_article_text",
     }
     missing = expected - tool_names
     assert not missing, f"Missing tools: {missing}"
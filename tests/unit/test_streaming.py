@@ -0,0 +1,71 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import readly_mcp.server as server
+from readly_mcp.core.browser import BrowserManager
+
+
+def _manager() -> BrowserManager:
+    bm = BrowserManager(pool_size=4)
+    bm.page = MagicMock(url="https://www.readly.com/issue")
+    delays = {"slow": 0.2, "fast": 0.0}
+
+    async def list_articles(**_):
+        return {
+            "issue_title": "Issue",
+            "articles": [{"index": i, "title": n, "url": n} for i, n in enumerate(["slow", "fast", "short"])],
+        }
+
+    async def fetch(href, listing=None):
+        await asyncio.sleep(delays.get(href, 0))
+        words = 5 if href == "short" else 100
+        return {"title": href, "url": href, "text": "w " * words, "word_count": words, "cached": False}
+
+    bm.list_articles = list_articles
+    bm._fetch_article = fetch
+    return bm
+
+
+def test_iter_articles_yields_in_completion_order():
+    async def collect():
+        return [e async for e in _manager().iter_articles(10)]
+
+    events = asyncio.run(collect())
+    assert [e["event"] for e in events] == ["issue", "article", "skipped", "article", "done"]
+    assert events[1]["url"] == "fast"
+    assert events[-1]["count"] == 2 and events[-1]["skipped"] == 1
+
+
+def test_read_all_articles_keeps_listing_order_and_reports_progress():
+    progress = []
+
+    async def on_progress(done, total):
+        progress.append((done, total))
+
+    out = asyncio.run(_manager().read_all_articles(10, on_progress=on_progress))
+    assert [a["url"] for a in out["articles"]] == ["slow", "fast"]
+    assert "index" not in out["articles"][0]
+    assert out["skipped"][0]["error"] == "low_word_count"
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_read_all_articles_tool_reports_progress_on_the_callers_loop(monkeypatch):
+    async def read_all(max_articles, on_progress=None, duplicates=None):
+        for done in (1, 2):
+            await on_progress(done, 2)
+        return {"success": True}
+
+    monkeypatch.setattr(server, "_ensure_browser", AsyncMock())
+    monkeypatch.setattr(server.browser_manager, "read_all_articles", read_all)
+    loops = []
+
+    class Ctx:
+        async def report_progress(self, done, total, message):
+            loops.append(asyncio.get_running_loop())
+
+    async def call():
+        return await server.read_all_articles(2, ctx=Ctx()), asyncio.get_running_loop()
+
+    out, caller = asyncio.run(call())
+    assert out == {"success": True}
+    assert loops == [caller, caller]
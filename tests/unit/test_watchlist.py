@@ -0,0 +1,57 @@
+import asyncio
+
+from readly_mcp.core.browser import get_last_poll_stats, get_poll_history, record_poll_stats
+from readly_mcp.core.watchlist import WatchlistPoller, parse_duration, parse_watchlist
+
+
+def test_parse_watchlist_intervals_and_defaults():
+    entries = parse_watchlist("New Scientist:6h, Wired:30m, The Economist, , Wired:1h", default_interval="2h")
+    assert [(e.magazine, e.interval) for e in entries] == [
+        ("New Scientist", 21600),
+        ("Wired", 1800),
+        ("The Economist", 7200),
+    ]
+    assert parse_duration("90") == 90
+
+
+def test_poller_runs_each_magazine_on_its_interval_with_bounded_concurrency():
+    calls: list[str] = []
+    active = 0
+    peak = 0
+
+    async def poll(magazine):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        calls.append(magazine)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return {"success": True, "new_articles": 1}
+
+    async def scenario():
+        poller = WatchlistPoller(poll, parse_watchlist("A:0.1s, B:0.1s, C:10s"), concurrency=1, jitter=0)
+        poller.start()
+        await asyncio.sleep(0.35)
+        await poller.stop()
+        return poller.stats()
+
+    stats = asyncio.run(scenario())
+    assert peak == 1
+    # First runs are staggered across the shortest interval, then C waits 10s.
+    assert calls.count("A") >= 3 and calls.count("C") == 1
+    a = stats["magazines"][0]
+    assert a["runs"] >= 3 and a["last_new_articles"] == 1 and a["failures"] == 0
+
+
+def test_poll_history_keeps_every_run():
+    record_poll_stats(magazine="Mag X", articles_extracted=5, avg_word_count=900, source="ingest", duration_ms=12)
+    record_poll_stats(magazine="Mag X", articles_extracted=0, source="ingest", low_yield=False)
+    runs = get_poll_history(magazine="Mag X")
+    assert [r["articles_extracted"] for r in runs[:2]] == [0, 5]
+    assert runs[1]["duration_ms"] == 12 and not runs[0]["low_yield"]
+
+
+def test_failed_ingest_magazines_join_the_rolling_low_yield_list():
+    record_poll_stats(magazine="Mag Y", articles_extracted=0)
+    record_poll_stats(articles_extracted=3, magazines=["A", "B"], low_yield=True, failed_magazines=["B"])
+    assert get_last_poll_stats()["low_yield_magazines"][-2:] == ["Mag Y", "B"]